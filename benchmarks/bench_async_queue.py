@@ -0,0 +1,56 @@
+# Latency benchmark for AsyncCircularQueue: p50/p99 time from put() to get()
+# with several concurrent producers, for both ring backends and asyncio.Queue.
+#
+# Run from the repository root:
+#     python -m benchmarks.bench_async_queue [items_per_producer]
+import asyncio
+import statistics
+import sys
+import time
+
+from linked_lists import Async_CircularQueue, CircularSinglyLinked_List, Circular_DoublyLinked_List
+
+PRODUCERS = (1, 8, 32)
+MAXSIZE = 1024
+
+QUEUES = [
+    ("AsyncCircularQueue/singly",
+     lambda: Async_CircularQueue.AsyncCircularQueue(MAXSIZE, CircularSinglyLinked_List.CircularSinglyLinkedList)),
+    ("AsyncCircularQueue/doubly",
+     lambda: Async_CircularQueue.AsyncCircularQueue(MAXSIZE, Circular_DoublyLinked_List.CircularDoublyLinkedList)),
+    ("asyncio.Queue", lambda: asyncio.Queue(MAXSIZE)),
+]
+
+
+# Each producer puts timestamps; a single consumer records put -> get latency.
+async def run(make_queue, producers, items):
+    queue = make_queue()
+    latencies = []
+
+    async def produce():
+        for _ in range(items):
+            await queue.put(time.perf_counter())
+
+    async def consume():
+        for _ in range(producers * items):
+            sent = await queue.get()
+            latencies.append(time.perf_counter() - sent)
+
+    await asyncio.gather(consume(), *(produce() for _ in range(producers)))
+    cuts = statistics.quantiles(latencies, n=100)
+    return cuts[49] * 1e6, cuts[98] * 1e6
+
+
+def main(items=5_000):
+    print(f"items per producer={items}, maxsize={MAXSIZE}, latency in microseconds")
+    print(f"{'queue':<28}" + "".join(f"{f'{p} prod p50/p99':>22}" for p in PRODUCERS))
+    for name, make_queue in QUEUES:
+        cells = []
+        for producers in PRODUCERS:
+            p50, p99 = asyncio.run(run(make_queue, producers, items))
+            cells.append(f"{p50:>10.1f} /{p99:>9.1f}")
+        print(f"{name:<28}" + "".join(f"{cell:>22}" for cell in cells))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000)
@@ -0,0 +1,92 @@
+# Cache benchmark: LRUCache and LFUCache against functools.lru_cache and a
+# hand-rolled OrderedDict LRU. Every cache serves the same skewed (Zipf-like)
+# stream of keys with the usual "look up, compute on a miss" pattern; the
+# table shows nanoseconds per access and the hit rate for several sizes.
+#
+# Run from the repository root:
+#     python -m benchmarks.bench_cache [accesses]
+import functools
+import random
+import sys
+import time
+from collections import OrderedDict
+
+from linked_lists import LFUCache, LRUCache
+
+CACHE_SIZES = (100, 1_000, 10_000)
+KEY_SPACE = 100_000
+MISSING = object()
+
+
+def compute(key):
+    return key * 2
+
+
+# Keys drawn with probability ~ 1/rank, so a small hot set dominates.
+def key_stream(accesses, seed=1):
+    rng = random.Random(seed)
+    weights = [1 / rank for rank in range(1, KEY_SPACE + 1)]
+    return rng.choices(range(KEY_SPACE), weights, k=accesses)
+
+
+def run_linked(cache_class, size, keys):
+    cache = cache_class(maxsize=size)
+    get = cache.get
+    put = cache.put
+    start = time.perf_counter()
+    for key in keys:
+        value = get(key, MISSING)
+        if value is MISSING:
+            put(key, compute(key))
+    elapsed = time.perf_counter() - start
+    return elapsed, cache.hits
+
+
+def run_ordered_dict(size, keys):
+    cache = OrderedDict()
+    hits = 0
+    start = time.perf_counter()
+    for key in keys:
+        if key in cache:
+            cache.move_to_end(key)
+            cache[key]  # The read a real cache hit makes
+            hits += 1
+        else:
+            cache[key] = compute(key)
+            if len(cache) > size:
+                cache.popitem(last=False)
+    elapsed = time.perf_counter() - start
+    return elapsed, hits
+
+
+def run_lru_cache(size, keys):
+    cached = functools.lru_cache(maxsize=size)(compute)
+    start = time.perf_counter()
+    for key in keys:
+        cached(key)
+    elapsed = time.perf_counter() - start
+    return elapsed, cached.cache_info().hits
+
+
+CACHES = [
+    ("LRUCache", lambda size, keys: run_linked(LRUCache, size, keys)),
+    ("LFUCache", lambda size, keys: run_linked(LFUCache, size, keys)),
+    ("OrderedDict LRU", run_ordered_dict),
+    ("functools.lru_cache", run_lru_cache),
+]
+
+
+def main(accesses=1_000_000):
+    keys = key_stream(accesses)
+    print(f"accesses={accesses} keys={KEY_SPACE}")
+    print(f"{'cache':<22}" + "".join(f"{f'size {size}':>26}" for size in CACHE_SIZES))
+    for name, run in CACHES:
+        cells = []
+        for size in CACHE_SIZES:
+            elapsed, hits = run(size, keys)
+            cells.append(f"{elapsed / accesses * 1e9:>10.0f} ns {hits / accesses:>6.1%} hit")
+        print(f"{name:<22}" + "".join(f"{cell:>26}" for cell in cells), flush=True)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,78 @@
+# Multi-threaded stress benchmark: ops/sec of the concurrent
+# CircularDoublyLinkedList mode against queue.Queue and collections.deque
+# as the number of producer/consumer thread pairs grows.
+#
+# Run from the repository root:
+#     python -m benchmarks.bench_concurrent [items_per_producer]
+import collections
+import queue
+import sys
+import threading
+import time
+
+from linked_lists import Circular_DoublyLinked_List
+
+THREAD_PAIRS = (1, 2, 4, 8)
+
+
+# Adapter giving collections.deque a blocking-style put/get by spinning.
+class DequeAdapter:
+    def __init__(self):
+        self.items = collections.deque()
+
+    def put(self, item):
+        self.items.append(item)
+
+    def get(self):
+        while True:
+            try:
+                return self.items.popleft()
+            except IndexError:
+                time.sleep(0)  # Yield the GIL to a producer
+
+
+QUEUES = [
+    ("ConcurrentLinkedQueue", lambda: Circular_DoublyLinked_List.CircularDoublyLinkedList(concurrent=True)),
+    ("queue.Queue", queue.Queue),
+    ("collections.deque", DequeAdapter),
+]
+
+
+# Run `pairs` producers and `pairs` consumers moving `items` items each;
+# returns total put+get operations per second.
+def stress(make_queue, pairs, items):
+    shared = make_queue()
+    start_gate = threading.Barrier(2 * pairs + 1)
+
+    def produce():
+        start_gate.wait()
+        for i in range(items):
+            shared.put(i)
+
+    def consume():
+        start_gate.wait()
+        for _ in range(items):
+            shared.get()
+
+    threads = [threading.Thread(target=produce) for _ in range(pairs)]
+    threads += [threading.Thread(target=consume) for _ in range(pairs)]
+    for thread in threads:
+        thread.start()
+    start_gate.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return 2 * pairs * items / elapsed
+
+
+def main(items=50_000):
+    print(f"items per producer={items}")
+    print(f"{'queue':<24}" + "".join(f"{f'{p}+{p} thr':>14}" for p in THREAD_PAIRS))
+    for name, make_queue in QUEUES:
+        rates = [stress(make_queue, pairs, items) for pairs in THREAD_PAIRS]
+        print(f"{name:<24}" + "".join(f"{rate:>14,.0f}" for rate in rates))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
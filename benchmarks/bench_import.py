@@ -0,0 +1,55 @@
+# Cold-start cost of the package: each statement runs in a fresh interpreter
+# (no warm module cache), and the time of an empty `python -c pass` is
+# subtracted so only the import itself is counted. Also lists how many of
+# the package's modules each statement ends up loading.
+#
+# Run from the repository root:
+#     python -m benchmarks.bench_import
+#     python -m benchmarks.bench_import --repeat 50
+import argparse
+import subprocess
+import sys
+import time
+
+STATEMENTS = [
+    "import linked_lists",
+    "from linked_lists import LinkedList",
+    "from linked_lists import DoublyLinkedList",
+    "from linked_lists import CircularDoublyLinkedList",
+    "from linked_lists import SortedLinkedList",
+    "from linked_lists import ConcurrentLinkedQueue",
+    "from linked_lists import AsyncCircularQueue",
+]
+REPORT = "import sys; print(sum(name.startswith('linked_lists.') for name in sys.modules))"
+
+
+# Best wall time in seconds of `python -c code` over `repeat` runs.
+def spawn_time(code, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# Number of linked_lists submodules loaded after running `statement`.
+def modules_loaded(statement):
+    output = subprocess.run([sys.executable, "-c", f"{statement}; {REPORT}"],
+                            check=True, capture_output=True, text=True).stdout
+    return int(output)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the cold import time of linked_lists.")
+    parser.add_argument("--repeat", type=int, default=20, help="interpreter launches per statement (best is kept)")
+    args = parser.parse_args(argv)
+    baseline = spawn_time("pass", args.repeat)
+    print(f"{'python -c pass':<50}{baseline * 1e3:>9.2f} ms")
+    for statement in STATEMENTS:
+        elapsed = spawn_time(statement, args.repeat) - baseline
+        print(f"{statement:<50}{elapsed * 1e3:>+9.2f} ms  {modules_loaded(statement):>3} modules", flush=True)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
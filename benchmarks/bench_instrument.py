@@ -0,0 +1,63 @@
+# Instrumentation overhead: nanoseconds per call for a few list methods on a
+# plain list, on a list that was instrumented and then uninstrumented (the
+# disabled case, which should match plain), on an instrumented list and on
+# one that also counts nodes traversed.
+#
+# Run from the repository root:
+#     python -m benchmarks.bench_instrument [size]
+import sys
+import time
+
+from linked_lists import DoublyLinkedList, LinkedList, instrument, uninstrument
+
+CALLS = 20_000
+
+
+def plain(list_class, size):
+    return list_class.from_iterable(range(size))
+
+
+def disabled(list_class, size):
+    built = plain(list_class, size)
+    instrument(built)
+    uninstrument(built)
+    return built
+
+
+def enabled(list_class, size):
+    built = plain(list_class, size)
+    instrument(built)
+    return built
+
+
+def counting(list_class, size):
+    built = plain(list_class, size)
+    instrument(built, count_nodes=True)
+    return built
+
+
+MODES = [("plain", plain), ("disabled", disabled), ("instrumented", enabled), ("count_nodes", counting)]
+OPERATIONS = [
+    ("length", lambda built, i: built.length()),
+    ("append+delete", lambda built, i: (built.insert_at_end(i), built.delete_at_end())),
+    ("insert_middle", lambda built, i: built.insert_at_position(i, 50)),
+]
+
+
+def main(size=1_000):
+    print(f"size={size} calls={CALLS}")
+    print(f"{'list':<18}{'operation':<16}" + "".join(f"{name:>14}" for name, _ in MODES))
+    for list_class in (LinkedList, DoublyLinkedList):
+        for name, operation in OPERATIONS:
+            cells = []
+            for _, make in MODES:
+                built = make(list_class, size)
+                start = time.perf_counter()
+                for i in range(CALLS):
+                    operation(built, i)
+                cells.append((time.perf_counter() - start) / CALLS * 1e9)
+            print(f"{list_class.__name__:<18}{name:<16}" + "".join(f"{cell:>11.0f} ns" for cell in cells), flush=True)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000)
@@ -0,0 +1,72 @@
+# Memory benchmark: bytes per element for each list variant, comparing the
+# old dict-based nodes ("before") with the slotted nodes ("after").
+#
+# Run from the repository root:
+#     python -m benchmarks.bench_memory [size]
+import sys
+import tracemalloc
+
+from linked_lists import CircularSinglyLinked_List, Circular_DoublyLinked_List, Linked_List, doublyLinked_List
+
+
+# Node layouts as they were before __slots__, kept here only for comparison.
+# They carry the same fields as today's slotted nodes (the doubly ones gained
+# `owner` for handles), so the numbers differ by layout alone.
+class DictNode:
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+
+
+class DictDoublyNode:
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+        self.prev = None
+        self.owner = None
+
+
+VARIANTS = [
+    ("LinkedList", Linked_List, Linked_List.LinkedList, "SinglyNode", DictNode),
+    ("DoublyLinkedList", doublyLinked_List, doublyLinked_List.DoublyLinkedList, "DoublyNode", DictDoublyNode),
+    ("CircularSinglyLinkedList", CircularSinglyLinked_List,
+     CircularSinglyLinked_List.CircularSinglyLinkedList, "CircularSinglyNode", DictNode),
+    ("CircularDoublyLinkedList", Circular_DoublyLinked_List,
+     Circular_DoublyLinked_List.CircularDoublyLinkedList, "CircularDoublyNode", DictDoublyNode),
+]
+
+
+# Build a list of `size` elements and return the bytes allocated per element.
+# The payload ints are created up front so only the nodes are measured.
+def bytes_per_element(list_class, size):
+    payload = list(range(size))
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    built = list_class.from_iterable(payload)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del built
+    return (after - before) / size
+
+
+# Measure one variant with the module's own node class swapped for the dict-based one.
+def measure_legacy(module, list_class, node_name, legacy_node, size):
+    slotted_node = getattr(module, node_name)
+    setattr(module, node_name, legacy_node)  # The list classes look their node class up as a module global
+    try:
+        return bytes_per_element(list_class, size)
+    finally:
+        setattr(module, node_name, slotted_node)
+
+
+def main(size=100_000):
+    print(f"{'variant':<28}{'before B/elem':>15}{'after B/elem':>15}{'saved':>9}")
+    for name, module, list_class, node_name, legacy_node in VARIANTS:
+        before = measure_legacy(module, list_class, node_name, legacy_node, size)
+        after = bytes_per_element(list_class, size)
+        saved = 100 * (before - after) / before
+        print(f"{name:<28}{before:>15.1f}{after:>15.1f}{saved:>8.1f}%")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
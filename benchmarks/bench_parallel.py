@@ -0,0 +1,70 @@
+# Scaling benchmark for list.parallel(): count, find_all, map and reduce on
+# LinkedList and DoublyLinkedList data with 1 to N worker processes, next to
+# the plain single-process loop. The pool is started once per worker count,
+# so the times include the snapshot and the transfer to the workers but not
+# process startup. Speedups are relative to the serial loop.
+#
+# Run from the repository root:
+#     python -m benchmarks.bench_parallel [size] [max_workers]
+import operator
+import os
+import sys
+import time
+from functools import reduce
+
+from linked_lists import DoublyLinkedList, LinkedList
+
+
+def is_multiple_of_seven(value):
+    return value % 7 == 0
+
+
+def cube(value):
+    return value * value * value
+
+
+OPERATIONS = [
+    ("count", lambda items: sum(1 for value in items if is_multiple_of_seven(value)),
+     lambda par: par.count(is_multiple_of_seven)),
+    ("find_all", lambda items: [i for i, value in enumerate(items) if is_multiple_of_seven(value)],
+     lambda par: par.find_all(is_multiple_of_seven)),
+    ("map", lambda items: [cube(value) for value in items], lambda par: par.map(cube)),
+    ("reduce", lambda items: reduce(operator.add, items), lambda par: par.reduce(operator.add)),
+]
+
+
+def worker_counts(max_workers):
+    counts = [1]
+    while counts[-1] * 2 <= max_workers:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != max_workers:
+        counts.append(max_workers)
+    return counts
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main(size=2_000_000, max_workers=None):
+    counts = worker_counts(max_workers or os.cpu_count() or 1)
+    print(f"size={size} cpus={os.cpu_count()}")
+    print(f"{'list':<18}{'operation':<10}{'serial':>10}" + "".join(f"{f'{n} proc':>16}" for n in counts))
+    for list_class in (LinkedList, DoublyLinkedList):
+        built = list_class.from_iterable(range(size))
+        serial = [timed(lambda: run(built)) for _, run, _ in OPERATIONS]
+        parallel = [[] for _ in OPERATIONS]
+        for workers in counts:
+            with built.parallel(workers) as par:
+                for times, (_, _, run) in zip(parallel, OPERATIONS):
+                    times.append(timed(lambda: run(par)))
+        for (name, _, _), base, times in zip(OPERATIONS, serial, parallel):
+            cells = "".join(f"{elapsed:>8.2f}s {base / elapsed:>5.1f}x" for elapsed in times)
+            print(f"{list_class.__name__:<18}{name:<10}{base:>9.2f}s" + cells, flush=True)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else None)
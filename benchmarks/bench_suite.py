@@ -0,0 +1,231 @@
+# Benchmark suite: the four list classes against list and collections.deque
+# baselines, across sizes from 10^3 to 10^7. For every variant and size it
+# measures append, prepend, positional insert (middle), delete_by_value
+# (middle), search (missing value, full scan), reverse, length, iteration
+# and memory (bytes per element while building, via tracemalloc).
+# Timings are nanoseconds per operation; k operations are applied to a list
+# of `size` elements, with k scaled down for the O(n) operations and, for
+# those that add or remove elements, capped so the list drifts at most 1%.
+#
+# Run from the repository root:
+#     python -m benchmarks.bench_suite
+#     python -m benchmarks.bench_suite --sizes 1000,100000 --json run.json --csv run.csv
+#     python -m benchmarks.bench_suite --sizes 1000,100000 --compare run.json
+import argparse
+import csv
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+from linked_lists import CircularSinglyLinked_List, Circular_DoublyLinked_List, Linked_List, doublyLinked_List
+
+SIZES = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7)
+OPERATIONS = ("memory", "length", "iterate", "search", "append", "prepend",
+              "insert_middle", "delete_by_value", "reverse")
+CONSTANT_OPS = 10_000  # k for the O(1) operations
+LINEAR_BUDGET = 10 ** 6  # Total elements walked by the O(n) operations, k = budget // size
+MISSING = -1  # Never stored, so search() scans the whole list
+
+
+# Adapters giving list and deque the method names of the list classes.
+class ListBaseline:
+    def __init__(self, items=()):
+        self.items = list(items)
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        return cls(iterable)
+
+    def insert_at_beginning(self, data):
+        self.items.insert(0, data)
+
+    def insert_at_end(self, data):
+        self.items.append(data)
+
+    def insert_at_position(self, data, position):
+        self.items.insert(position, data)
+
+    def delete_by_value(self, data):
+        self.items.remove(data)
+
+    def search(self, data):
+        return data in self.items
+
+    def reverse(self):
+        self.items.reverse()
+
+    def length(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+
+class DequeBaseline(ListBaseline):
+    def __init__(self, items=()):
+        self.items = deque(items)
+
+    def insert_at_beginning(self, data):
+        self.items.appendleft(data)
+
+
+VARIANTS = [
+    ("LinkedList", Linked_List.LinkedList),
+    ("DoublyLinkedList", doublyLinked_List.DoublyLinkedList),
+    ("CircularSinglyLinkedList", CircularSinglyLinked_List.CircularSinglyLinkedList),
+    ("CircularDoublyLinkedList", Circular_DoublyLinked_List.CircularDoublyLinkedList),
+    ("list", ListBaseline),
+    ("deque", DequeBaseline),
+]
+
+
+# Build a list of `size` elements; returns it and the bytes allocated per
+# element. The payload ints are created up front so only the structure counts.
+def build(list_class, size):
+    payload = list(range(size))
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    built = list_class.from_iterable(payload)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return built, (after - before) / size
+
+
+# Call fn(i) for i in range(count); returns the best seconds per call over
+# `repeat` rounds.
+def timed(fn, count, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for i in range(count):
+            fn(i)
+        best = min(best, (time.perf_counter() - start) / count)
+    return best
+
+
+# Yield (operation, value, unit) for one variant at one size. The read-only
+# operations share one list; every operation that changes the list gets one
+# of exactly `size` elements, rebuilt if an earlier operation grew or shrank it.
+def measure(list_class, size, repeat, operations):
+    built, bytes_per_element = build(list_class, size)
+    changed = False  # True once the list no longer holds `size` elements
+    linear = max(1, LINEAR_BUDGET // size)  # k for the O(n) operations
+    drift = min(linear, max(1, size // 100))  # k for the O(n) operations that change the size
+    middle = size // 2
+
+    def fresh():
+        nonlocal built, changed
+        if changed:
+            built = None  # Free the old list first, at 10^7 elements it is large
+            built = list_class.from_iterable(range(size))
+        changed = True
+
+    if "memory" in operations:
+        yield "memory", bytes_per_element, "B/elem"
+    if "length" in operations:
+        yield "length", timed(lambda i: built.length(), CONSTANT_OPS, repeat), "s/op"
+    if "iterate" in operations:
+        def iterate(i):
+            for _ in built:
+                pass
+        yield "iterate", timed(iterate, 1, repeat) / size, "s/elem"
+    if "search" in operations:
+        yield "search", timed(lambda i: built.search(MISSING), linear, repeat), "s/op"
+    if "append" in operations:
+        fresh()
+        yield "append", timed(lambda i: built.insert_at_end(-2), CONSTANT_OPS, 1), "s/op"
+    if "prepend" in operations:
+        fresh()
+        yield "prepend", timed(lambda i: built.insert_at_beginning(-3), CONSTANT_OPS, 1), "s/op"
+    if "insert_middle" in operations:
+        fresh()
+        yield "insert_middle", timed(lambda i: built.insert_at_position(-4, middle), drift, 1), "s/op"
+    if "delete_by_value" in operations:
+        fresh()
+        yield "delete_by_value", timed(lambda i: built.delete_by_value(middle + i), drift, 1), "s/op"
+    if "reverse" in operations:
+        fresh()
+        yield "reverse", timed(lambda i: built.reverse(), 1, repeat), "s/op"
+
+
+def run(sizes, repeat, operations, variants):
+    results = []
+    for size in sizes:
+        for name, list_class in VARIANTS:
+            if variants and name not in variants:
+                continue
+            for operation, value, unit in measure(list_class, size, repeat, operations):
+                if unit.startswith("s/"):  # Report times in nanoseconds
+                    value *= 1e9
+                    unit = "ns" + unit[1:]
+                results.append({"variant": name, "size": size, "operation": operation,
+                                "value": round(value, 2), "unit": unit})
+                print(f"{name:<26}{size:>10}  {operation:<16}{value:>14.1f} {unit}", flush=True)
+    return results
+
+
+# Metadata stored with every run so results from different machines or
+# interpreters are not compared by accident.
+def run_info():
+    return {"python": platform.python_version(), "implementation": platform.python_implementation(),
+            "machine": platform.machine(), "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+
+def write_json(path, results):
+    with open(path, "w") as stream:
+        json.dump({"info": run_info(), "results": results}, stream, indent=2)
+
+
+def write_csv(path, results):
+    with open(path, "w", newline="") as stream:
+        writer = csv.DictWriter(stream, fieldnames=["variant", "size", "operation", "value", "unit"])
+        writer.writeheader()
+        writer.writerows(results)
+
+
+# Print new/old ratios for every measurement present in both runs
+# (above 1.0 means the new run is slower or uses more memory).
+def compare(path, results):
+    with open(path) as stream:
+        old = {(row["variant"], row["size"], row["operation"]): row["value"]
+               for row in json.load(stream)["results"]}
+    print(f"\nCompared with {path}:")
+    for row in results:
+        previous = old.get((row["variant"], row["size"], row["operation"]))
+        if previous:
+            print(f"{row['variant']:<26}{row['size']:>10}  {row['operation']:<16}{row['value'] / previous:>8.2f}x")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the list classes against list and deque.")
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)),
+                        help="comma-separated list sizes (default: 10^3 to 10^7)")
+    parser.add_argument("--operations", default=",".join(OPERATIONS),
+                        help="comma-separated subset of: " + ", ".join(OPERATIONS))
+    parser.add_argument("--variants", default="", help="comma-separated subset of the variant names")
+    parser.add_argument("--repeat", type=int, default=3, help="rounds for the read-only operations (best is kept)")
+    parser.add_argument("--json", help="write the results to this JSON file")
+    parser.add_argument("--csv", help="write the results to this CSV file")
+    parser.add_argument("--compare", help="JSON file from an earlier run to compare against")
+    args = parser.parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",")]
+    operations = set(args.operations.split(","))
+    unknown = operations - set(OPERATIONS)
+    if unknown:
+        parser.error(f"unknown operations: {', '.join(sorted(unknown))}")
+    variants = set(filter(None, args.variants.split(",")))
+    results = run(sizes, args.repeat, operations, variants)
+    if args.json:
+        write_json(args.json, results)
+    if args.csv:
+        write_csv(args.csv, results)
+    if args.compare:
+        compare(args.compare, results)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,70 @@
+# Benchmark: UnrolledLinkedList against the node-per-element lists for
+# append, positional insert, scan and memory.
+#
+# Run from the repository root:
+#     python -m benchmarks.bench_unrolled [size]
+import random
+import sys
+import time
+import tracemalloc
+
+from linked_lists import Linked_List, Unrolled_LinkedList, doublyLinked_List
+
+VARIANTS = [
+    ("LinkedList", Linked_List.LinkedList),
+    ("DoublyLinkedList", doublyLinked_List.DoublyLinkedList),
+    ("UnrolledLinkedList", Unrolled_LinkedList.UnrolledLinkedList),
+]
+
+
+# Seconds taken by fn().
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+# Append `size` elements one insert_at_end call at a time.
+def bench_append(list_class, size):
+    built = list_class()
+    return timed(lambda: [built.insert_at_end(i) for i in range(size)])
+
+
+# Insert `count` elements at random positions into a list of `size` elements.
+def bench_positional_insert(list_class, size, count=200):
+    built = list_class.from_iterable(range(size))
+    rng = random.Random(0)
+    positions = [rng.randrange(size) for _ in range(count)]
+    return timed(lambda: [built.insert_at_position(-1, p) for p in positions])
+
+
+# Full scan: search for a value that is not in the list.
+def bench_scan(list_class, size):
+    built = list_class.from_iterable(range(size))
+    return timed(lambda: built.search(-1))
+
+
+# Bytes allocated per element when building the list.
+def bench_memory(list_class, size):
+    payload = list(range(size))
+    tracemalloc.start()
+    built = list_class.from_iterable(payload)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del built
+    return used / size
+
+
+def main(size=200_000):
+    print(f"size={size}")
+    print(f"{'variant':<22}{'append s':>11}{'pos insert s':>14}{'scan s':>10}{'B/elem':>9}")
+    for name, list_class in VARIANTS:
+        print(f"{name:<22}"
+              f"{bench_append(list_class, size):>11.4f}"
+              f"{bench_positional_insert(list_class, size):>14.4f}"
+              f"{bench_scan(list_class, size):>10.4f}"
+              f"{bench_memory(list_class, size):>9.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
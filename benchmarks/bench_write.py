@@ -0,0 +1,55 @@
+# Benchmark: output throughput of write_to() against the old one-print()-per-
+# element loop, for an in-memory text stream and a binary file.
+#
+# Run from the repository root:
+#     python -m benchmarks.bench_write [size]
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+from linked_lists import CircularSinglyLinked_List, Circular_DoublyLinked_List, Linked_List, doublyLinked_List
+
+VARIANTS = [
+    ("LinkedList", Linked_List.LinkedList),
+    ("DoublyLinkedList", doublyLinked_List.DoublyLinkedList),
+    ("CircularSinglyLinkedList", CircularSinglyLinked_List.CircularSinglyLinkedList),
+    ("CircularDoublyLinkedList", Circular_DoublyLinked_List.CircularDoublyLinkedList),
+]
+
+
+# The rendering loop the print methods used before write_to().
+def print_per_element(built, stream):
+    with contextlib.redirect_stdout(stream):
+        for data in built:
+            print(data, end=" -> ")
+        print("None")
+
+
+# Run fn(stream) and return (megabytes written, seconds).
+def measure(fn, stream):
+    start = time.perf_counter()
+    fn(stream)
+    elapsed = time.perf_counter() - start
+    return stream.tell() / 1e6, elapsed
+
+
+def main(size=1_000_000):
+    print(f"size={size}")
+    print(f"{'variant':<28}{'print() MB/s':>14}{'write_to text MB/s':>20}{'write_to file MB/s':>20}")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "out.bin")
+        for name, list_class in VARIANTS:
+            built = list_class.from_iterable(range(size))
+            rates = []
+            rates.append(measure(lambda s: print_per_element(built, s), io.StringIO()))
+            rates.append(measure(built.write_to, io.StringIO()))
+            with open(path, "wb") as binary:
+                rates.append(measure(built.write_to, binary))
+            print(f"{name:<28}" + "".join(f"{mb / seconds:>{w}.1f}" for (mb, seconds), w in zip(rates, (14, 20, 20))))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,408 @@
+# Array-backed (index-linked) engines for LinkedList and DoublyLinkedList.
+# Instead of one Python object per node, links are stored as integer indices
+# in array('q') buffers and payloads in a parallel Python list. A slot is
+# identified by its index; NIL (-1) plays the role of None.
+# Deleted slots are pushed onto a free list and recycled by later inserts.
+import sys
+from array import array
+
+from .List_IO import dump_records, load_array, load_records, write_chunked
+
+NIL = -1  # Index used as the "null pointer"
+
+
+# ArrayLinkedList mirrors LinkedList on top of index buffers.
+class ArrayLinkedList:
+    def __init__(self):
+        self.values = []  # Payload of every slot, None for free slots
+        self.next_index = array("q")  # next_index[i] is the slot after slot i
+        self.free = array("q")  # Stack of recycled slots
+        self.head = NIL  # Slot of the first element
+        self.tail = NIL  # Slot of the last element
+        self.size = 0  # Number of elements
+
+    # Build a new list from any iterable (generators are consumed lazily).
+    @classmethod
+    def from_iterable(cls, iterable):
+        new_list = cls()
+        new_list.extend(iterable)
+        return new_list
+
+    # Save the list to a binary snapshot file (see List_IO for the format).
+    def dump(self, path):
+        dump_records(path, self, self.size)
+
+    # Load a list saved by dump(). Fixed-width snapshots are read straight
+    # into the value buffer and linked slot i -> i + 1 without a per-element loop.
+    @classmethod
+    def load(cls, path):
+        values = load_array(path)
+        if values is None:  # Pickled records, decode them one by one
+            return cls.from_iterable(load_records(path))
+        new_list = cls()
+        new_list._adopt(values.tolist())
+        return new_list
+
+    # Take over a Python list of payloads as slots 0..n-1 in order.
+    def _adopt(self, values):
+        count = len(values)
+        self.values = values
+        self.next_index = array("q", range(1, count + 1))
+        self.free = array("q")
+        if count:
+            self.next_index[-1] = NIL
+        self.head = 0 if count else NIL
+        self.tail = count - 1 if count else NIL
+        self.size = count
+
+    # Take a slot from the free list, or grow the buffers by one slot.
+    def _allocate(self, data):
+        if self.free:
+            slot = self.free.pop()
+            self.values[slot] = data
+            self.next_index[slot] = NIL
+            return slot
+        self.values.append(data)
+        self.next_index.append(NIL)
+        return len(self.values) - 1
+
+    # Return a slot to the free list and drop its payload reference.
+    def _release(self, slot):
+        self.values[slot] = None
+        self.free.append(slot)
+
+    # Yield every occupied slot from head to tail.
+    def _slots(self):
+        next_index = self.next_index
+        slot = self.head
+        while slot != NIL:
+            yield slot
+            slot = next_index[slot]
+
+    # Slot `steps` links after slot.
+    def _advance(self, slot, steps):
+        next_index = self.next_index
+        for _ in range(steps):
+            slot = next_index[slot]
+        return slot
+
+    # Slot of the element at a 0-based position (position must be in range).
+    def _slot_at(self, position):
+        return self._advance(self.head, position)
+
+    # Insert a new element at the beginning of the list.
+    def insert_at_beginning(self, data):
+        slot = self._allocate(data)
+        self.next_index[slot] = self.head
+        self.head = slot
+        if self.tail == NIL:  # First element is also the last element
+            self.tail = slot
+        self.size += 1
+
+    # Insert a new element at the end of the list.
+    def insert_at_end(self, data):
+        slot = self._allocate(data)
+        if self.tail == NIL:  # Empty list
+            self.head = slot
+        else:
+            self.next_index[self.tail] = slot
+        self.tail = slot
+        self.size += 1
+
+    # Append every item of the iterable.
+    def extend(self, iterable):
+        for data in iterable:
+            self.insert_at_end(data)
+
+    # Prepend every item of the iterable (ends up reversed at the front).
+    def extendleft(self, iterable):
+        for data in iterable:
+            self.insert_at_beginning(data)
+
+    # Insert a new element at a specific position (0-based index).
+    def insert_at_position(self, data, position):
+        if position < 0:  # Invalid position
+            print("Position cannot be negative.")
+            return
+        if position > self.size:  # If position is beyond the list length
+            print("Position out of range.")
+            return
+        if position == 0:
+            self.insert_at_beginning(data)
+            return
+        if position == self.size:
+            self.insert_at_end(data)
+            return
+        before = self._slot_at(position - 1)  # Slot before the position
+        slot = self._allocate(data)
+        self.next_index[slot] = self.next_index[before]
+        self.next_index[before] = slot
+        self.size += 1
+
+    # Delete the element at the beginning of the list.
+    def delete_at_beginning(self):
+        if self.head == NIL:  # If list is empty, nothing to delete
+            print("List is empty.")
+            return
+        slot = self.head
+        self.head = self.next_index[slot]
+        if self.head == NIL:  # List became empty
+            self.tail = NIL
+        self._release(slot)
+        self.size -= 1
+
+    # Delete the element at the end of the list.
+    def delete_at_end(self):
+        if self.head == NIL:  # If list is empty
+            print("List is empty.")
+            return
+        if self.size == 1:
+            self.delete_at_beginning()
+            return
+        before = self._slot_at(self.size - 2)  # Singly linked, walk to the second last slot
+        self._release(self.tail)
+        self.next_index[before] = NIL
+        self.tail = before
+        self.size -= 1
+
+    # Delete the first element with the given data value.
+    def delete_by_value(self, data):
+        if self.head == NIL:  # If list is empty
+            print("List is empty.")
+            return
+        values = self.values
+        next_index = self.next_index
+        previous = NIL
+        for slot in self._slots():
+            if values[slot] == data:
+                following = next_index[slot]
+                if previous == NIL:
+                    self.head = following
+                else:
+                    next_index[previous] = following
+                if slot == self.tail:
+                    self.tail = previous
+                self._release(slot)
+                self.size -= 1
+                return
+            previous = slot
+        print("Value not found.")  # If value not in list
+
+    # Search for an element with the given data and return True if found.
+    def search(self, data):
+        values = self.values
+        for slot in self._slots():
+            if values[slot] == data:
+                return True
+        return False
+
+    # Iterate over the data from head to tail.
+    def __iter__(self):
+        values = self.values
+        next_index = self.next_index
+        slot = self.head
+        while slot != NIL:
+            yield values[slot]
+            slot = next_index[slot]
+
+    # Iterate from tail to head (collected first, the list is singly linked).
+    def __reversed__(self):
+        return reversed(list(self))
+
+    # Iterate over positions start <= i < stop (slice semantics, negative
+    # indices allowed) without copying; stops walking after `stop`.
+    def iter_range(self, start, stop):
+        start, stop, _ = slice(start, stop).indices(self.size)
+        if stop <= start:
+            return
+        values = self.values
+        next_index = self.next_index
+        slot = self._slot_at(start)  # Walk to the first position
+        for _ in range(stop - start):
+            yield values[slot]
+            slot = next_index[slot]
+
+    # Run find_all/count/map/reduce over a snapshot of the list in a process
+    # pool, one contiguous segment per task (see Parallel_Ops).
+    def parallel(self, workers=None):
+        from .Parallel_Ops import ParallelList  # Imported lazily, only needed for this mode
+        return ParallelList(self, workers)
+
+    # Render the list to a text or binary stream, e.g. "10 -> 15 -> None".
+    # Elements are batched chunk_size at a time into one write() call.
+    def write_to(self, stream, sep=" -> ", end="None\n", chunk_size=4096):
+        write_chunked(stream, self, sep, end, chunk_size)
+
+    # Print all elements in the list.
+    def print_list(self):
+        self.write_to(sys.stdout)
+
+    # Get the length (number of elements) in the list.
+    def length(self):
+        return self.size
+
+    # Support the built-in len() in O(1).
+    def __len__(self):
+        return self.size
+
+    # Reverse the list by rewriting the next indices.
+    def reverse(self):
+        next_index = self.next_index
+        previous = NIL
+        slot = self.head
+        self.tail = slot
+        while slot != NIL:
+            following = next_index[slot]
+            next_index[slot] = previous
+            previous = slot
+            slot = following
+        self.head = previous
+
+
+# ArrayDoublyLinkedList mirrors DoublyLinkedList, adding a prev_index buffer.
+class ArrayDoublyLinkedList(ArrayLinkedList):
+    def __init__(self):
+        super().__init__()
+        self.prev_index = array("q")  # prev_index[i] is the slot before slot i
+
+    def _allocate(self, data):
+        if self.free:
+            slot = self.free.pop()
+            self.values[slot] = data
+            self.next_index[slot] = NIL
+            self.prev_index[slot] = NIL
+            return slot
+        self.values.append(data)
+        self.next_index.append(NIL)
+        self.prev_index.append(NIL)
+        return len(self.values) - 1
+
+    def _adopt(self, values):
+        super()._adopt(values)
+        self.prev_index = array("q", range(-1, len(values) - 1))
+
+    # Slot `steps` links after slot, or before it for negative steps.
+    def _advance(self, slot, steps):
+        if steps >= 0:
+            return super()._advance(slot, steps)
+        prev_index = self.prev_index
+        for _ in range(-steps):
+            slot = prev_index[slot]
+        return slot
+
+    # Slot of the element at a 0-based position, walking from the nearer end.
+    def _slot_at(self, position):
+        if position <= self.size // 2:
+            return self._advance(self.head, position)
+        return self._advance(self.tail, position - (self.size - 1))
+
+    # Unlink an occupied slot from its neighbours and free it.
+    def _unlink(self, slot):
+        before = self.prev_index[slot]
+        after = self.next_index[slot]
+        if before == NIL:
+            self.head = after
+        else:
+            self.next_index[before] = after
+        if after == NIL:
+            self.tail = before
+        else:
+            self.prev_index[after] = before
+        self._release(slot)
+        self.size -= 1
+
+    def insert_at_beginning(self, data):
+        slot = self._allocate(data)
+        if self.head == NIL:
+            self.tail = slot
+        else:
+            self.prev_index[self.head] = slot
+            self.next_index[slot] = self.head
+        self.head = slot
+        self.size += 1
+
+    def insert_at_end(self, data):
+        slot = self._allocate(data)
+        if self.tail == NIL:
+            self.head = slot
+        else:
+            self.next_index[self.tail] = slot
+            self.prev_index[slot] = self.tail
+        self.tail = slot
+        self.size += 1
+
+    def insert_at_position(self, data, position):
+        if position < 0:  # Invalid position
+            print("Position cannot be negative.")
+            return
+        if position > self.size:  # If position is beyond list length
+            print("Position out of range.")
+            return
+        if position == 0:
+            self.insert_at_beginning(data)
+            return
+        if position == self.size:
+            self.insert_at_end(data)
+            return
+        after = self._slot_at(position)  # Slot currently at the position
+        before = self.prev_index[after]
+        slot = self._allocate(data)
+        self.next_index[slot] = after
+        self.prev_index[slot] = before
+        self.next_index[before] = slot
+        self.prev_index[after] = slot
+        self.size += 1
+
+    def delete_at_beginning(self):
+        if self.head == NIL:  # If list is empty
+            print("List is empty.")
+            return
+        self._unlink(self.head)
+
+    def delete_at_end(self):
+        if self.tail == NIL:  # If list is empty
+            print("List is empty.")
+            return
+        self._unlink(self.tail)
+
+    def delete_by_value(self, data):
+        if self.head == NIL:  # If list is empty
+            print("List is empty.")
+            return
+        values = self.values
+        for slot in self._slots():
+            if values[slot] == data:
+                self._unlink(slot)
+                return
+        print("Value not found.")  # If value not in list
+
+    # Iterate over the data from tail to head along the prev indices.
+    def __reversed__(self):
+        values = self.values
+        prev_index = self.prev_index
+        slot = self.tail
+        while slot != NIL:
+            yield values[slot]
+            slot = prev_index[slot]
+
+    # Render the list to a text or binary stream, e.g. "10 <-> 15 <-> None".
+    # Elements are batched chunk_size at a time into one write() call;
+    # reverse=True renders from tail to head.
+    def write_to(self, stream, sep=" <-> ", end="None\n", chunk_size=4096, reverse=False):
+        write_chunked(stream, reversed(self) if reverse else self, sep, end, chunk_size)
+
+    # Print all elements in the list (forward).
+    def print_list_forward(self):
+        self.write_to(sys.stdout)
+
+    # Print all elements in the list (backward).
+    def print_list_backward(self):
+        self.write_to(sys.stdout, reverse=True)
+
+    def print_list(self):
+        self.write_to(sys.stdout)
+
+    # Reverse in O(1): the next and prev buffers simply trade roles.
+    def reverse(self):
+        self.next_index, self.prev_index = self.prev_index, self.next_index
+        self.head, self.tail = self.tail, self.head
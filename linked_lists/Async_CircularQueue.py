@@ -0,0 +1,170 @@
+# asyncio queue backed by CircularSinglyLinkedList or CircularDoublyLinkedList.
+# put()/get() are O(1) on both rings (the singly linked ring is anchored on
+# its tail), a maxsize bound applies backpressure to producers, and get_many()
+# drains a batch in one wake-up. Waiting follows asyncio.Queue: parked
+# producers and consumers each wait on a future that the other side resolves.
+# Operations that walk the ring (search, and reverse on the singly linked
+# ring) hold the queue's lock and yield to the event loop every `yield_every`
+# nodes, so a long ring never stalls other tasks; put()/get() wait for such an
+# operation to finish. The doubly linked ring reverses in O(1) without walking.
+import asyncio
+from collections import deque
+from itertools import islice
+
+from .Circular_DoublyLinked_List import CircularDoublyLinkedList
+
+
+class AsyncCircularQueue:
+    def __init__(self, maxsize=0, ring_class=CircularDoublyLinkedList, yield_every=1024):
+        self.maxsize = maxsize  # Capacity bound, 0 means unbounded
+        self.yield_every = yield_every  # Nodes visited between event-loop yields
+        self._ring = ring_class()  # Underlying circular list, head is the next item out
+        self._flipped = False  # True while the doubly ring is reversed, head.prev is then next out
+        self._getters = deque()  # Futures of consumers waiting for an item
+        self._putters = deque()  # Futures of producers waiting for room
+        self._walking = asyncio.Lock()  # Held by search()/reverse() while they walk the ring
+        self._closed = False
+
+    # Number of queued items, O(1) (the rings cache their size).
+    def qsize(self):
+        return self._ring.size
+
+    def __len__(self):
+        return self._ring.size
+
+    def length(self):
+        return self._ring.size
+
+    def empty(self):
+        return self._ring.size == 0
+
+    def full(self):
+        return 0 < self.maxsize <= self._ring.size
+
+    # Stop accepting items; consumers drain what is left, then iteration ends.
+    def close(self):
+        self._closed = True
+        for waiters in (self._getters, self._putters):
+            while waiters:
+                self._wakeup_next(waiters)
+
+    # Resolve the first still-pending future in a waiter queue.
+    @staticmethod
+    def _wakeup_next(waiters):
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    # Park the current task on a new future in `waiters`.
+    async def _park(self, waiters):
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:  # Already woken: pass the wake-up on
+                self._wakeup_next(waiters)
+            raise
+
+    # Wait until no search()/reverse() is walking the ring.
+    async def _wait_idle(self):
+        while self._walking.locked():
+            async with self._walking:
+                pass
+
+    # Append an item or raise asyncio.QueueFull without waiting (also while
+    # a search()/reverse() is walking the ring).
+    def put_nowait(self, item):
+        if self._closed:
+            raise RuntimeError("put() on a closed AsyncCircularQueue")
+        if self.full() or self._walking.locked():
+            raise asyncio.QueueFull
+        self._ring.insert_at_end(item)
+        self._wakeup_next(self._getters)
+
+    # Append an item, waiting while a bounded queue is full.
+    async def put(self, item):
+        while True:
+            if self._walking.locked():
+                await self._wait_idle()
+            if self._closed or not self.full():
+                return self.put_nowait(item)
+            await self._park(self._putters)
+
+    # Remove and return the head item or raise asyncio.QueueEmpty without
+    # waiting (also while a search()/reverse() is walking the ring).
+    def get_nowait(self):
+        if not self._ring.size or self._walking.locked():
+            raise asyncio.QueueEmpty
+        front = self._ring.head.prev if self._flipped else self._ring.head
+        item = front.data
+        self._ring.delete_at_beginning()
+        self._wakeup_next(self._putters)
+        return item
+
+    # Wait until an item is queued or the queue is closed and drained.
+    async def _wait_for_item(self):
+        while True:
+            if self._walking.locked():
+                await self._wait_idle()
+            if self._ring.size or self._closed:
+                return
+            await self._park(self._getters)
+
+    # Remove and return the head item, waiting while the queue is empty.
+    # Raises asyncio.QueueEmpty once the queue is closed and drained.
+    async def get(self):
+        if not self._ring.size or self._walking.locked():  # Fast path skips the extra coroutine
+            await self._wait_for_item()
+        return self.get_nowait()
+
+    # Wait for at least one item, then remove and return up to n items.
+    # Returns an empty list once the queue is closed and drained.
+    async def get_many(self, n):
+        await self._wait_for_item()
+        return [self.get_nowait() for _ in range(min(n, self._ring.size))]
+
+    # `async for item in queue` consumes items until the queue is closed and drained.
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return await self.get()
+        except asyncio.QueueEmpty:
+            raise StopAsyncIteration from None
+
+    # Return True if an item equal to data is queued, yielding to the event
+    # loop every yield_every nodes.
+    async def search(self, data):
+        async with self._walking:
+            for visited, item in enumerate(self._ring, 1):
+                if item == data:
+                    return True
+                if visited % self.yield_every == 0:
+                    await asyncio.sleep(0)
+            return False
+
+    # Reverse the queue order. The doubly linked ring just flips its
+    # orientation in O(1); a singly linked ring is rebuilt reversed a chunk
+    # at a time with event-loop yields in between, then swapped in.
+    async def reverse(self):
+        async with self._walking:
+            if isinstance(self._ring, CircularDoublyLinkedList):
+                self._ring.reverse()
+                self._flipped = not self._flipped
+                return
+            reversed_ring = type(self._ring)()
+            items = iter(self._ring)
+            while True:
+                chunk = list(islice(items, self.yield_every))
+                if not chunk:
+                    break
+                reversed_ring.extendleft(chunk)
+                await asyncio.sleep(0)
+            self._ring = reversed_ring
@@ -0,0 +1,52 @@
+# Planning step shared by LinkedList.apply_batch and DoublyLinkedList.apply_batch.
+# A batch is a sequence of operations:
+#   ("insert", position, data)   insert before the element now at `position`
+#                                (position == length appends)
+#   ("delete", position)         delete the element now at `position`
+#   ("delete_value", data)       delete the first remaining element equal to data
+# Positions refer to the list as it was before the batch, so the batch can be
+# applied in one forward sweep. Inserts at the same position keep batch order.
+from collections import deque
+
+INSERT = "insert"
+DELETE = "delete"
+DELETE_VALUE = "delete_value"
+
+
+# Split a batch into positional operations sorted by position (inserts before
+# deletes at the same position), pending value deletes keyed by value, and a
+# results list preset to False (invalid positions simply stay False).
+def plan_batch(ops, size):
+    results = [False] * len(ops)
+    positional = []  # (position, 0 for insert / 1 for delete, op number, data)
+    by_value = {}  # value -> op numbers still waiting for a matching element
+    for number, op in enumerate(ops):
+        kind = op[0]
+        if kind == INSERT:
+            _, position, data = op
+            if 0 <= position <= size:
+                positional.append((position, 0, number, data))
+        elif kind == DELETE:
+            _, position = op
+            if 0 <= position < size:
+                positional.append((position, 1, number, None))
+        elif kind == DELETE_VALUE:
+            by_value.setdefault(op[1], deque()).append(number)
+        else:
+            raise ValueError(f"Unknown batch operation: {kind!r}")
+    positional.sort(key=lambda entry: entry[:3])
+    return positional, by_value, results
+
+
+# If a value delete is waiting for `data`, mark it done and return True.
+def claim_value_delete(by_value, data, results):
+    try:
+        waiting = by_value.get(data)
+    except TypeError:  # Unhashable element, it cannot match a hashable key
+        return False
+    if not waiting:
+        return False
+    results[waiting.popleft()] = True
+    if not waiting:
+        del by_value[data]
+    return True
@@ -0,0 +1,502 @@
+import sys
+
+from .Hash_Index import HashIndex
+from .List_IO import dump_records, load_records, write_chunked
+from .Sort_Ops import relink, sorted_nodes
+
+# CircularSinglyNode class to represent each element in the circular singly linked list.
+# Each node contains data and a reference to the next node.
+class CircularSinglyNode:
+    __slots__ = ("data", "next")  # No per-instance __dict__, keeps each node compact
+
+    def __init__(self, data):
+        self.data = data  # Store the data value in the node
+        self.next = None  # Pointer to the next node, initially None
+
+Node = CircularSinglyNode  # Former name, kept for code that imports Node directly
+
+# CircularSinglyLinkedList class to manage circular singly linked list operations.
+# The ring is anchored on its last node: tail.next is always the head, so both
+# ends are reachable without walking the ring.
+class CircularSinglyLinkedList:
+    # Fixed attribute layout, no per-instance __dict__. _stats is only set while
+    # the list is instrumented (see Instrumented_List).
+    __slots__ = ("tail", "size", "_index", "_pred", "_stats", "__weakref__")
+
+    # indexed=True keeps a value -> node hash index (values must be hashable) so
+    # search() and delete_by_value() run in O(1) on average.
+    def __init__(self, indexed=False):
+        self.tail = None  # Last node of the ring, None for an empty list
+        self.size = 0  # Number of nodes, updated by every insert and delete
+        self._index = HashIndex() if indexed else None  # value -> nodes, None when not indexed
+        self._pred = {} if indexed else None  # node -> previous node in the ring, for O(1) unlinking
+
+    # The head is the node after the tail.
+    @property
+    def head(self):
+        return self.tail.next if self.tail else None
+
+    # Yield every node from head to tail.
+    def _nodes(self):
+        if self.tail is None:
+            return
+        current = self.tail.next
+        while True:
+            yield current
+            if current is self.tail:
+                break
+            current = current.next
+
+    # Node `steps` links after node, going round the ring.
+    def _advance(self, node, steps):
+        for _ in range(steps):
+            node = node.next
+        return node
+
+    # Rebuild the hash index and predecessor map after a bulk relink.
+    def _reindex(self):
+        self._index.rebuild(self._nodes())
+        self._pred.clear()
+        previous = self.tail
+        for node in self._nodes():
+            self._pred[node] = previous
+            previous = node
+
+    # Link a new node in right after the tail, i.e. as the new head.
+    def _link_after_tail(self, data):
+        new_node = CircularSinglyNode(data)  # Create a new node with the given data
+        if self.tail is None:  # If list is empty
+            new_node.next = new_node  # Point to itself to form a circle
+            self.tail = new_node
+        else:
+            new_node.next = self.tail.next  # New node points to current head
+            self.tail.next = new_node  # Last node points to new node
+        if self._pred is not None:
+            self._pred[new_node] = self.tail
+            self._pred[new_node.next] = new_node
+        self.size += 1
+        return new_node
+
+    # Insert a new node at the beginning of the list and return it (a handle).
+    def insert_at_beginning(self, data):
+        new_node = self._link_after_tail(data)  # The node after the tail is the head
+        if self._index is not None:
+            self._index.push_front(new_node)
+        return new_node
+
+    # Insert a new node at the end of the list and return it (a handle).
+    def insert_at_end(self, data):
+        new_node = self._link_after_tail(data)  # Link the node in after the tail
+        self.tail = new_node  # and advance the tail onto it
+        if self._index is not None:
+            self._index.push_back(new_node)
+        return new_node
+
+    # Build a new list from any iterable (generators are consumed lazily).
+    @classmethod
+    def from_iterable(cls, iterable, indexed=False):
+        new_list = cls(indexed=indexed)
+        new_list.extend(iterable)
+        return new_list
+
+    # Append every item of the iterable, linking the new chain in a single pass.
+    def extend(self, iterable):
+        first = None
+        last = None
+        count = 0
+        for data in iterable:  # Build the chain without touching the ring yet
+            new_node = CircularSinglyNode(data)
+            if last is None:
+                first = new_node
+            else:
+                last.next = new_node
+            last = new_node
+            count += 1
+        if first is None:  # Nothing to add
+            return
+        if self.tail is None:  # Empty list, close the chain into a ring
+            last.next = first
+        else:
+            last.next = self.tail.next  # Chain ends at the current head
+            self.tail.next = first  # Splice the chain after the last node
+        if self._index is not None:
+            previous = self.tail or last
+            current = first
+            while True:  # Register the new chain in list order
+                self._index.push_back(current)
+                self._pred[current] = previous
+                if current is last:
+                    break
+                previous = current
+                current = current.next
+            self._pred[last.next] = last
+        self.tail = last
+        self.size += count
+
+    # Prepend every item of the iterable one after another, so they end up in
+    # reverse order at the front (same semantics as collections.deque.extendleft).
+    def extendleft(self, iterable):
+        first = None
+        last = None
+        count = 0
+        for data in iterable:  # Each new node goes in front of the previous one
+            new_node = CircularSinglyNode(data)
+            new_node.next = first
+            if last is None:
+                last = new_node
+            first = new_node
+            count += 1
+        if first is None:  # Nothing to add
+            return
+        if self.tail is None:  # Empty list, close the chain into a ring
+            last.next = first
+            self.tail = last
+        else:
+            last.next = self.tail.next  # Chain ends at the current head
+            self.tail.next = first  # and becomes the new front of the ring
+        if self._index is not None:
+            chain = []
+            current = first
+            while True:  # Collect the new chain, front to back
+                chain.append(current)
+                if current is last:
+                    break
+                current = current.next
+            previous = self.tail
+            for node in chain:
+                self._pred[node] = previous
+                previous = node
+            self._pred[last.next] = last
+            for node in reversed(chain):  # Front-most node is registered last
+                self._index.push_front(node)
+        self.size += count
+
+    # Insert a new node at a specific position (0-based index) and return it.
+    def insert_at_position(self, data, position):
+        if position < 0:  # Invalid position
+            print("Position cannot be negative.")
+            return
+        if position > self.size:  # If position is beyond list length
+            print("Position out of range.")
+            return
+        if position == 0:  # Insert at beginning
+            return self.insert_at_beginning(data)
+        if position == self.size:  # Insert at end
+            return self.insert_at_end(data)
+        current = self._advance(self.tail, position)  # Traverse to node before position (the tail precedes the head)
+        new_node = CircularSinglyNode(data)  # Create a new node
+        new_node.next = current.next  # Insert new node
+        current.next = new_node
+        if self._index is not None:
+            self._index.insert(new_node, current, new_node.next)
+            self._pred[new_node] = current
+            self._pred[new_node.next] = new_node
+        self.size += 1
+        return new_node
+
+    # Unlink a node given its predecessor in the ring.
+    def _unlink(self, previous, node):
+        if node is previous:  # Only node in the ring
+            self.tail = None
+        else:
+            previous.next = node.next  # Remove the node
+            if node is self.tail:  # Removed the last node
+                self.tail = previous
+        if self._index is not None:
+            self._index.remove(node)
+            del self._pred[node]
+            if node is not previous:
+                self._pred[node.next] = previous
+        self.size -= 1
+
+    # Delete the node at the beginning of the list.
+    def delete_at_beginning(self):
+        if self.tail is None:  # If list is empty
+            print("List is empty.")
+            return
+        self._unlink(self.tail, self.tail.next)  # The tail precedes the head
+
+    # Delete the node at the end of the list.
+    def delete_at_end(self):
+        if self.tail is None:  # If list is empty
+            print("List is empty.")
+            return
+        if self._pred is not None:  # Predecessor is known, no traversal
+            self._unlink(self._pred[self.tail], self.tail)
+            return
+        current = self._advance(self.tail, self.size - 1)  # Traverse to second last node (singly linked, no back pointer)
+        self._unlink(current, self.tail)
+
+    # Delete the first node with the given data value. Indexed lists jump to it;
+    # if the value was inserted mid-list away from its equals, the first such
+    # lookup walks the list once to order them (see Hash_Index).
+    def delete_by_value(self, data):
+        if self.tail is None:  # If list is empty
+            print("List is empty.")
+            return
+        if self._index is not None:  # Jump straight to the first occurrence
+            node = self._index.first(data, self._nodes)
+            if node is None:
+                print("Value not found.")
+                return
+            self._unlink(self._pred[node], node)
+            return
+        prev = self.tail
+        for current in self._nodes():  # Traverse the ring once, starting at the head
+            if current.data == data:
+                self._unlink(prev, current)
+                return
+            prev = current
+        print("Value not found.")  # If value not in list
+
+    # Unlink positions start <= i < stop (slice semantics) as a None-terminated
+    # chain in one pass from the head; returns (first, last, count).
+    def _detach(self, start, stop):
+        start, stop, _ = slice(start, stop).indices(self.size)
+        count = stop - start
+        if count <= 0:
+            return None, None, 0
+        before = self._advance(self.tail, start)  # Traverse to the node before the range (the tail precedes the head)
+        first = before.next
+        if stop == self.size:  # The range runs to the end, no walk needed
+            last = self.tail
+        else:  # Walk on to the last node of the range
+            last = self._advance(first, count - 1)
+        after = last.next
+        if count == self.size:
+            self.tail = None
+        else:
+            before.next = after
+            if last is self.tail:  # The range ran to the end
+                self.tail = before
+        last.next = None
+        if self._index is not None:
+            if count == self.size:
+                self._index.clear()
+                self._pred.clear()
+            else:
+                current = first
+                while current:  # Forget the moved nodes
+                    self._index.remove(current)
+                    del self._pred[current]
+                    current = current.next
+                self._pred[after] = before
+        self.size -= count
+        return first, last, count
+
+    # Link a None-terminated chain of count nodes in front of position `at`.
+    # O(1) at either end (both sit right after the tail), otherwise one walk.
+    def _attach(self, first, last, count, at):
+        if self.tail is None:  # The chain closes on itself
+            before = last
+            last.next = first
+            self.tail = last
+        else:
+            before = self.tail
+            if 0 < at < self.size:  # Traverse to the node before the position
+                before = self._advance(before, at)
+            last.next = before.next
+            before.next = first
+            if at == self.size:
+                self.tail = last
+        if self._index is not None:
+            chain = []
+            previous = before
+            current = first
+            for _ in range(count):  # Register the moved nodes' predecessors
+                chain.append(current)
+                self._pred[current] = previous
+                previous = current
+                current = current.next
+            self._pred[last.next] = last
+            if last is self.tail:
+                for node in chain:
+                    self._index.push_back(node)
+            elif at == 0:
+                for node in reversed(chain):  # Front-most node is registered last
+                    self._index.push_front(node)
+            else:
+                self._index.rebuild(self._nodes())
+        self.size += count
+
+    # Move other[start:stop] (slice semantics, all of other by default) in
+    # front of position `at` of this list (the end by default). Nodes are
+    # relinked, never copied; other's size and ends are updated too.
+    def splice(self, other, at=None, start=None, stop=None):
+        if not isinstance(other, CircularSinglyLinkedList):
+            raise TypeError("Can only splice another CircularSinglyLinkedList")
+        if other is self:
+            raise ValueError("Cannot splice a list into itself")
+        if at is None:
+            at = self.size
+        if not 0 <= at <= self.size:
+            raise IndexError("splice position out of range")
+        first, last, count = other._detach(start, stop)
+        if count:
+            self._attach(first, last, count, at)
+
+    # Move every node of other to the end of this list in O(1).
+    def concat(self, other):
+        self.splice(other)
+
+    # Split off the nodes from position i on into a new list of the same
+    # kind and return it; this list keeps the first i nodes.
+    def split_at(self, i):
+        if not 0 <= i <= self.size:
+            raise IndexError("split position out of range")
+        new_list = type(self)(indexed=self._index is not None)
+        new_list.splice(self, 0, i)
+        return new_list
+
+    # Run find_all/count/map/reduce over a snapshot of the list in a process
+    # pool, one contiguous segment per task (see Parallel_Ops).
+    def parallel(self, workers=None):
+        from .Parallel_Ops import ParallelList  # Imported lazily, only needed for this mode
+        return ParallelList(self, workers)
+
+    # Search for a node with the given data and return True if found.
+    def search(self, data):
+        if self.tail is None:  # If list is empty
+            return False
+        if self._index is not None:
+            return data in self._index
+        for node in self._nodes():  # Traverse the circular list once
+            if node.data == data:
+                return True  # Found
+        return False  # Not found
+
+    # Iterate over the data once around the ring, head to tail.
+    def __iter__(self):
+        if self.tail is None:
+            return
+        current = self.tail.next
+        for _ in range(self.size):
+            yield current.data
+            current = current.next
+
+    # Iterate from tail to head. The ring is singly linked, so the data is
+    # collected first (O(n) extra references).
+    def __reversed__(self):
+        return reversed(list(self))
+
+    # Iterate one full lap around the ring, starting at the given node.
+    def iter_from(self, node):
+        current = node
+        for _ in range(self.size):
+            yield current.data
+            current = current.next
+
+    # Iterate over positions start <= i < stop (slice semantics, negative
+    # indices allowed) without copying; stops walking after `stop`.
+    def iter_range(self, start, stop):
+        start, stop, _ = slice(start, stop).indices(self.size)
+        if start >= stop:
+            return
+        current = self._advance(self.tail.next, start)  # Walk to the first position
+        for _ in range(stop - start):
+            yield current.data
+            current = current.next
+
+    # Yield n elements going round the ring from the head, wrapping as often
+    # as needed (round-robin). Empty rings yield nothing.
+    def cycle(self, n):
+        if self.tail is None:
+            return
+        current = self.tail.next
+        for _ in range(n):
+            yield current.data
+            current = current.next
+
+    # Render one lap of the ring to a text or binary stream, e.g.
+    # "10 -> 15 -> (head)". Elements are batched chunk_size at a time.
+    def write_to(self, stream, sep=" -> ", end="(head)\n", chunk_size=4096):
+        write_chunked(stream, self, sep, end, chunk_size)
+
+    # Save the list to a binary snapshot file (see List_IO for the format).
+    def dump(self, path):
+        dump_records(path, self, self.size)
+
+    # Load a list saved by dump(). The file is memory-mapped and nodes are
+    # linked as records are decoded, without an intermediate Python list.
+    @classmethod
+    def load(cls, path, indexed=False):
+        return cls.from_iterable(load_records(path), indexed=indexed)
+
+    # Print all elements in the list.
+    def print_list(self):
+        if self.tail is None:  # If list is empty
+            print("List is empty.")
+            return
+        self.write_to(sys.stdout)
+
+    # Get the length (number of nodes) in the list.
+    def length(self):
+        return self.size  # Maintained incrementally by every mutator
+
+    # Support the built-in len() in O(1).
+    def __len__(self):
+        return self.size
+
+    # Reverse the circular singly linked list.
+    def reverse(self):
+        if self.tail is None or self.tail.next is self.tail:  # If empty or single node
+            return
+        head = self.tail.next
+        prev = self.tail
+        current = head
+        while True:  # Traverse and reverse pointers
+            next_node = current.next
+            current.next = prev
+            prev = current
+            current = next_node
+            if current is head:  # Back to start, end loop
+                break
+        self.tail = head  # Old head is now the last node, and its next is the old tail
+        if self._index is not None:
+            self._reindex()
+
+    # Sort the list in place (stable, O(n log n)) by relinking its nodes.
+    def sort(self, key=None, reverse=False):
+        if self.tail is None:
+            return
+        nodes = sorted_nodes(self._nodes(), key, reverse)
+        relink(nodes)
+        nodes[-1].next = nodes[0]  # Close the ring again
+        self.tail = nodes[-1]
+        if self._index is not None:
+            self._reindex()
+
+# Example usage (python -m linked_lists.CircularSinglyLinked_List):
+if __name__ == "__main__":
+    # Create a circular singly linked list
+    csll = CircularSinglyLinkedList()
+
+    # Insert operations
+    csll.insert_at_beginning(10)
+    csll.insert_at_end(20)
+    csll.insert_at_position(15, 1)  # Insert 15 between 10 and 20
+
+    # Print list: 10 -> 15 -> 20 -> (head)
+    csll.print_list()
+
+    # Search for 15: True
+    print(csll.search(15))
+
+    # Delete operations
+    csll.delete_at_beginning()  # Removes 10
+    csll.delete_at_end()  # Removes 20
+    csll.delete_by_value(15)  # Removes 15
+
+    # Print list after deletions: List is empty.
+    csll.print_list()
+
+    # Length: 0
+    print(csll.length())
+
+    # Insert again and reverse
+    csll.insert_at_end(30)
+    csll.insert_at_end(40)
+    csll.insert_at_end(50)
+    csll.print_list()  # 30 -> 40 -> 50 -> (head)
+    csll.reverse()
+    csll.print_list()  # 50 -> 40 -> 30 -> (head)
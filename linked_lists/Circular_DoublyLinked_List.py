@@ -0,0 +1,646 @@
+import sys
+
+from .Handle_Ops import Owner, adopt, check_handle, flip_chain
+from .Hash_Index import HashIndex
+from .List_IO import dump_records, load_records, write_chunked
+from .Sort_Ops import relink, sorted_nodes
+
+# CircularDoublyNode class for a circular doubly linked list.
+# Each node contains data, a reference to the next node, and a reference to the previous node.
+class CircularDoublyNode:
+    __slots__ = ("data", "next", "prev", "owner")  # No per-instance __dict__, keeps each node compact
+
+    def __init__(self, data):
+        self.data = data  # Store the data value in the node
+        self.next = None  # Pointer to the next node, initially None
+        self.prev = None  # Pointer to the previous node, initially None
+        self.owner = None  # Owner tag of the list holding the node, None while unlinked
+
+Node = CircularDoublyNode  # Former name, kept for code that imports Node directly
+
+# CircularDoublyLinkedList class to manage circular doubly linked list operations.
+class CircularDoublyLinkedList:
+    # Fixed attribute layout, no per-instance __dict__. _stats is only set while
+    # the list is instrumented (see Instrumented_List).
+    __slots__ = ("head", "size", "_index", "_reversed", "_owner", "_stats", "__weakref__")
+
+    # indexed=True keeps a value -> node hash index (values must be hashable) so
+    # search() and delete_by_value() run in O(1) on average.
+    # concurrent=True returns a thread-safe ConcurrentLinkedQueue instead, with
+    # blocking put()/get() and an optional maxsize bound. It is a FIFO only:
+    # besides put()/get() it offers insert_at_end() and delete_at_beginning(),
+    # none of the other list methods.
+    def __new__(cls, indexed=False, concurrent=False, maxsize=0):
+        if concurrent:
+            if indexed:
+                raise ValueError("The concurrent mode does not support indexed=True")
+            from .Concurrent_LinkedQueue import ConcurrentLinkedQueue  # Imported lazily, only needed for this mode
+            return ConcurrentLinkedQueue(maxsize)
+        return super().__new__(cls)
+
+    def __init__(self, indexed=False, concurrent=False, maxsize=0):
+        self.head = None  # Initialize the head of the list as None (empty list)
+        self.size = 0  # Number of nodes, updated by every insert and delete
+        self._index = HashIndex() if indexed else None  # value -> nodes, None when not indexed
+        self._reversed = False  # True when the logical order runs backwards over the nodes (see reverse())
+        self._owner = Owner(self)  # Tag carried by this list's nodes, validates handles (see Handle_Ops)
+
+    # Yield every node from head to the last node, or from the last node back
+    # to the head if backward.
+    def _nodes(self, backward=False):
+        if self.head is None:
+            return
+        first = self.head.prev if backward else self.head
+        current = first
+        while True:
+            yield current
+            current = current.prev if backward else current.next
+            if current is first:
+                break
+
+    # Insert a new node at the beginning of the list and return it (a handle).
+    def insert_at_beginning(self, data):
+        if self._reversed:  # The logical front is the physical last node
+            return self._push_back(data)
+        return self._push_front(data)
+
+    # Insert a new node at the end of the list and return it (a handle).
+    def insert_at_end(self, data):
+        if self._reversed:
+            return self._push_front(data)
+        return self._push_back(data)
+
+    # Link a new node in as the physical head.
+    def _push_front(self, data):
+        new_node = CircularDoublyNode(data)  # Create a new node with the given data
+        new_node.owner = self._owner
+        if self.head is None:  # If list is empty
+            self.head = new_node
+            new_node.next = new_node  # Point to itself
+            new_node.prev = new_node  # Point to itself
+        else:
+            last = self.head.prev  # Get the last node
+            new_node.next = self.head  # New node points to current head
+            new_node.prev = last  # New node points back to last node
+            self.head.prev = new_node  # Current head's prev points to new node
+            last.next = new_node  # Last node's next points to new node
+            self.head = new_node  # Update head to new node
+        if self._index is not None:
+            self._index.push_front(new_node)
+        self.size += 1
+        return new_node
+
+    # Link a new node in as the physical last node.
+    def _push_back(self, data):
+        new_node = CircularDoublyNode(data)  # Create a new node with the given data
+        new_node.owner = self._owner
+        if self.head is None:  # If list is empty
+            self.head = new_node
+            new_node.next = new_node  # Point to itself
+            new_node.prev = new_node  # Point to itself
+        else:
+            last = self.head.prev  # Get the last node
+            new_node.next = self.head  # New node points to head
+            new_node.prev = last  # New node points back to last node
+            last.next = new_node  # Last node's next points to new node
+            self.head.prev = new_node  # Head's prev points to new node
+        if self._index is not None:
+            self._index.push_back(new_node)
+        self.size += 1
+        return new_node
+
+    # Build a new list from any iterable (generators are consumed lazily).
+    @classmethod
+    def from_iterable(cls, iterable, indexed=False):
+        new_list = cls(indexed=indexed)
+        new_list.extend(iterable)
+        return new_list
+
+    # Append every item of the iterable. On a reversed list the logical end is
+    # the physical front, where extending left keeps the same logical order.
+    def extend(self, iterable):
+        if self._reversed:
+            self._extend_front(iterable)
+        else:
+            self._extend_back(iterable)
+
+    # Prepend every item of the iterable one after another, so they end up in
+    # reverse order at the front (same semantics as collections.deque.extendleft).
+    def extendleft(self, iterable):
+        if self._reversed:
+            self._extend_back(iterable)
+        else:
+            self._extend_front(iterable)
+
+    # Append at the physical back, linking the new chain in a single pass.
+    def _extend_back(self, iterable):
+        first = None
+        last = None
+        count = 0
+        for data in iterable:  # Build the chain without touching the ring yet
+            new_node = CircularDoublyNode(data)
+            new_node.owner = self._owner
+            if last is None:
+                first = new_node
+            else:
+                last.next = new_node
+                new_node.prev = last
+            last = new_node
+            count += 1
+        if first is None:  # Nothing to add
+            return
+        if self.head is None:  # Empty list, close the chain into a ring
+            self.head = first
+        else:
+            old_last = self.head.prev
+            old_last.next = first  # Splice the chain after the last node
+            first.prev = old_last
+        last.next = self.head  # Chain ends back at the head
+        self.head.prev = last
+        if self._index is not None:
+            current = first
+            while True:  # Register the new chain in list order
+                self._index.push_back(current)
+                if current is last:
+                    break
+                current = current.next
+        self.size += count
+
+    # Prepend at the physical front, one item after another.
+    def _extend_front(self, iterable):
+        first = None
+        last = None
+        count = 0
+        for data in iterable:  # Each new node goes in front of the previous one
+            new_node = CircularDoublyNode(data)
+            new_node.owner = self._owner
+            if first is None:
+                last = new_node
+            else:
+                new_node.next = first
+                first.prev = new_node
+            if self._index is not None:
+                self._index.push_front(new_node)
+            first = new_node
+            count += 1
+        if first is None:  # Nothing to add
+            return
+        if self.head is None:  # Empty list, close the chain into a ring
+            first.prev = last
+            last.next = first
+        else:
+            old_last = self.head.prev
+            old_last.next = first  # Chain sits between the last node and the head
+            first.prev = old_last
+            last.next = self.head
+            self.head.prev = last
+        self.head = first
+        self.size += count
+
+    # Insert a new node at a specific position (0-based index) and return it.
+    def insert_at_position(self, data, position):
+        if position < 0:  # Invalid position
+            print("Position cannot be negative.")
+            return
+        if position > self.size:  # If position is beyond list length
+            print("Position out of range.")
+            return
+        if position == 0:  # Insert at beginning
+            return self.insert_at_beginning(data)
+        if position == self.size:  # Insert at end
+            return self.insert_at_end(data)
+        if self._reversed:  # Same gap counted from the physical head
+            position = self.size - position
+        new_node = CircularDoublyNode(data)  # Create a new node
+        new_node.owner = self._owner
+        current = self._advance(self.head, position - 1)  # Traverse to node before position
+        new_node.next = current.next  # Set new node's pointers
+        new_node.prev = current
+        current.next.prev = new_node  # Update next node's prev
+        current.next = new_node  # Update current node's next
+        if self._index is not None:
+            self._index.insert(new_node, new_node.prev, new_node.next)
+        self.size += 1
+        return new_node
+
+    # Unlink a node from the ring in O(1) using its prev/next pointers.
+    def _unlink(self, node):
+        if node.next is node:  # Only node in the ring
+            self.head = None
+        else:
+            node.prev.next = node.next  # Update prev node's next
+            node.next.prev = node.prev  # Update next node's prev
+            if node is self.head:  # Removing the head, its successor takes over
+                self.head = node.next
+        node.prev = node.next = None
+        node.owner = None  # Handles to the node are stale from now on
+        if self._index is not None:
+            self._index.remove(node)
+        self.size -= 1
+
+    # Delete the node at the beginning of the list.
+    def delete_at_beginning(self):
+        if self.head is None:  # If list is empty
+            print("List is empty.")
+            return
+        self._unlink(self.head.prev if self._reversed else self.head)
+
+    # Delete the node at the end of the list.
+    def delete_at_end(self):
+        if self.head is None:  # If list is empty
+            print("List is empty.")
+            return
+        self._unlink(self.head if self._reversed else self.head.prev)  # The last node is the head's prev
+
+    # Delete the first node with the given data value. Indexed lists jump to it;
+    # if the value was inserted mid-list away from its equals, the first such
+    # lookup walks the list once to order them (see Hash_Index).
+    def delete_by_value(self, data):
+        if self.head is None:  # If list is empty
+            print("List is empty.")
+            return
+        if self._index is not None:  # Jump straight to the first occurrence
+            node = (self._index.last(data, self._nodes) if self._reversed
+                    else self._index.first(data, self._nodes))
+            if node is None:
+                print("Value not found.")
+                return
+            self._unlink(node)
+            return
+        for current in self._nodes(self._reversed):  # Traverse one lap in list order to find the node
+            if current.data == data:
+                self._unlink(current)
+                return
+        print("Value not found.")  # If value not in list
+
+    # Node `steps` links after node, or before it for negative steps.
+    def _advance(self, node, steps):
+        if steps >= 0:
+            for _ in range(steps):
+                node = node.next
+        else:
+            for _ in range(-steps):
+                node = node.prev
+        return node
+
+    # Node at a position (0 <= position < size), walking from the nearer side
+    # of the head.
+    def _node_at(self, position):
+        if position <= self.size // 2:
+            return self._advance(self.head, position)
+        return self._advance(self.head, position - self.size)
+
+    # Unlink positions start <= i < stop (slice semantics) as a None-terminated
+    # chain; returns (first, last, count). Only the endpoints are relinked,
+    # so a range that touches either end is detached in O(1). The chain keeps
+    # the physical order, which is the logical one reversed if the list is.
+    def _detach(self, start, stop):
+        start, stop, _ = slice(start, stop).indices(self.size)
+        count = stop - start
+        if count <= 0:
+            return None, None, 0
+        if self._reversed:  # Same range counted from the physical head
+            start, stop = self.size - stop, self.size - start
+        first = self._node_at(start)
+        if count - 1 < self.size - stop:  # Walk on from first unless the last node is nearer
+            last = self._advance(first, count - 1)
+        else:
+            last = self._advance(self.head.prev, stop - self.size)
+        if count == self.size:
+            self.head = None
+        else:
+            before, after = first.prev, last.next
+            before.next = after
+            after.prev = before
+            if first is self.head:
+                self.head = after
+        first.prev = last.next = None
+        if self._index is not None:
+            if count == self.size:
+                self._index.clear()
+            else:
+                current = first
+                while current:  # Forget the moved nodes
+                    self._index.remove(current)
+                    current = current.next
+        self.size -= count
+        return first, last, count
+
+    # Link a None-terminated chain of count nodes, in physical order, in front
+    # of position `at`.
+    # Both ends of the ring sit next to the head, so they take O(1).
+    def _attach(self, first, last, count, at):
+        if self._reversed:  # Same gap counted from the physical head
+            at = self.size - at
+        if self.head is None:
+            first.prev = last
+            last.next = first
+            self.head = first
+        else:
+            after = self.head if at == self.size else self._node_at(at)
+            before = after.prev
+            before.next = first
+            first.prev = before
+            last.next = after
+            after.prev = last
+            if at == 0:
+                self.head = first
+        if self._index is not None:
+            if at == self.size:
+                current = first
+                for _ in range(count):  # Register the moved nodes in list order
+                    self._index.push_back(current)
+                    current = current.next
+            elif at == 0:
+                current = last
+                for _ in range(count):  # Front-most node is registered last
+                    self._index.push_front(current)
+                    current = current.prev
+            else:
+                self._index.rebuild(self._nodes())
+        self.size += count
+
+    # Move other[start:stop] (slice semantics, all of other by default) in
+    # front of position `at` of this list (the end by default). Nodes are
+    # relinked, never copied; other's size and ends are updated too.
+    def splice(self, other, at=None, start=None, stop=None):
+        if not isinstance(other, CircularDoublyLinkedList):
+            raise TypeError("Can only splice another CircularDoublyLinkedList")
+        if other is self:
+            raise ValueError("Cannot splice a list into itself")
+        if at is None:
+            at = self.size
+        if not 0 <= at <= self.size:
+            raise IndexError("splice position out of range")
+        first, last, count = other._detach(start, stop)
+        if count:
+            adopt(self, other, first, count)
+            if other._reversed != self._reversed:  # Only the moved nodes change direction, O(count)
+                first, last = flip_chain(first, last)
+            self._attach(first, last, count, at)
+
+    # Move every node of other to the end of this list in O(1).
+    def concat(self, other):
+        self.splice(other)
+
+    # Split off the nodes from position i on into a new list of the same
+    # kind and return it; this list keeps the first i nodes.
+    def split_at(self, i):
+        if not 0 <= i <= self.size:
+            raise IndexError("split position out of range")
+        new_list = type(self)(indexed=self._index is not None)
+        new_list._reversed = self._reversed  # Same orientation, so the moved nodes are not flipped
+        new_list.splice(self, 0, i)
+        return new_list
+
+    # Insert data right after the node `handle` (in list order) in O(1) and
+    # return the new node. Handles are the nodes returned by the inserts; one
+    # from another list, or already removed, raises ValueError.
+    def insert_after(self, handle, data):
+        check_handle(handle, self)
+        if self._reversed:  # Logically after is physically before
+            return self._link_before(handle, data)
+        return self._link_after(handle, data)
+
+    # Insert data right before the node `handle` (in list order) in O(1) and
+    # return the new node.
+    def insert_before(self, handle, data):
+        check_handle(handle, self)
+        if self._reversed:
+            return self._link_after(handle, data)
+        return self._link_before(handle, data)
+
+    # Link a new node in physically after node.
+    def _link_after(self, node, data):
+        if node is self.head.prev:  # After the last node, the head stays put
+            return self._push_back(data)
+        new_node = CircularDoublyNode(data)
+        new_node.owner = self._owner
+        new_node.prev = node
+        new_node.next = node.next
+        node.next.prev = new_node
+        node.next = new_node
+        if self._index is not None:
+            self._index.insert(new_node, new_node.prev, new_node.next)
+        self.size += 1
+        return new_node
+
+    # Link a new node in physically before node.
+    def _link_before(self, node, data):
+        if node is self.head:  # The new node becomes the head
+            return self._push_front(data)
+        return self._link_after(node.prev, data)
+
+    # Remove the node `handle` in O(1) and return its data.
+    def remove(self, handle):
+        check_handle(handle, self)
+        self._unlink(handle)
+        return handle.data
+
+    # Move the node `handle` to the front of the list in O(1), keeping the node
+    # (and so the handle) itself.
+    def move_to_front(self, handle):
+        check_handle(handle, self)
+        if handle is (self.head.prev if self._reversed else self.head):  # Already in front
+            return
+        self._unlink(handle)
+        handle.owner = self._owner
+        last = self.head.prev
+        handle.next = self.head  # Both ends of the ring sit between the last node and the head
+        handle.prev = last
+        last.next = handle
+        self.head.prev = handle
+        if self._reversed:  # The logical front is the physical last node
+            if self._index is not None:
+                self._index.push_back(handle)
+        else:
+            self.head = handle
+            if self._index is not None:
+                self._index.push_front(handle)
+        self.size += 1
+
+    # Run find_all/count/map/reduce over a snapshot of the list in a process
+    # pool, one contiguous segment per task (see Parallel_Ops).
+    def parallel(self, workers=None):
+        from .Parallel_Ops import ParallelList  # Imported lazily, only needed for this mode
+        return ParallelList(self, workers)
+
+    # Search for a node with the given data and return True if found.
+    def search(self, data):
+        if self.head is None:  # If list is empty
+            return False
+        if self._index is not None:
+            return data in self._index
+        for node in self._nodes():  # Traverse the circular list once
+            if node.data == data:
+                return True  # Found
+        return False  # Not found
+
+    # Iterate over the data once around the ring, in list order.
+    def __iter__(self):
+        return self._walk(self._reversed)
+
+    # Iterate once around the ring in reverse list order.
+    def __reversed__(self):
+        return self._walk(not self._reversed)
+
+    # One lap head to last node, or backwards from the last node to the head.
+    def _walk(self, backward):
+        if self.head is None:
+            return
+        if backward:
+            current = self.head.prev
+            for _ in range(self.size):
+                yield current.data
+                current = current.prev
+        else:
+            current = self.head
+            for _ in range(self.size):
+                yield current.data
+                current = current.next
+
+    # Iterate one full lap around the ring in list order, starting at the given node.
+    def iter_from(self, node):
+        current = node
+        for _ in range(self.size):
+            yield current.data
+            current = current.prev if self._reversed else current.next
+
+    # Iterate over positions start <= i < stop (slice semantics, negative
+    # indices allowed) without copying; the walk starts from the nearer end.
+    def iter_range(self, start, stop):
+        start, stop, _ = slice(start, stop).indices(self.size)
+        if start >= stop:
+            return
+        first = self.size - 1 - start if self._reversed else start  # Physical position of the first element
+        current = self._node_at(first)  # Walks back round the ring when that is shorter
+        for _ in range(stop - start):
+            yield current.data
+            current = current.prev if self._reversed else current.next
+
+    # Yield n elements going round the ring from the head, wrapping as often
+    # as needed (round-robin). Empty rings yield nothing.
+    def cycle(self, n):
+        current = self.head
+        if current is None:
+            return
+        if self._reversed:  # The logical head is the physical last node
+            current = current.prev
+        for _ in range(n):
+            yield current.data
+            current = current.prev if self._reversed else current.next
+
+    # Render one lap of the ring to a text or binary stream, e.g.
+    # "10 <-> 15 <-> (head)". Elements are batched chunk_size at a time;
+    # reverse=True renders from the last node back to the head.
+    def write_to(self, stream, sep=" <-> ", end="(head)\n", chunk_size=4096, reverse=False):
+        write_chunked(stream, reversed(self) if reverse else self, sep, end, chunk_size)
+
+    # Save the list to a binary snapshot file (see List_IO for the format).
+    def dump(self, path):
+        dump_records(path, self, self.size)
+
+    # Load a list saved by dump(). The file is memory-mapped and nodes are
+    # linked as records are decoded, without an intermediate Python list.
+    @classmethod
+    def load(cls, path, indexed=False):
+        return cls.from_iterable(load_records(path), indexed=indexed)
+
+    # Print all elements in the list (forward).
+    def print_list_forward(self):
+        if self.head is None:  # If list is empty
+            print("List is empty.")
+            return
+        self.write_to(sys.stdout)
+
+    # Print all elements in the list (backward).
+    def print_list_backward(self):
+        if self.head is None:  # If list is empty
+            print("List is empty.")
+            return
+        self.write_to(sys.stdout, end="(last)\n", reverse=True)
+
+    # Get the length (number of nodes) in the list.
+    def length(self):
+        return self.size  # Maintained incrementally by every mutator
+
+    # Support the built-in len() in O(1).
+    def __len__(self):
+        return self.size
+
+    # Reverse the list in O(1) by flipping the orientation flag. head keeps
+    # naming the physical head; every method reads the flag, and the ones
+    # that relink many nodes call materialize() first.
+    def reverse(self):
+        self._reversed = not self._reversed
+
+    # Make the physical layout match the logical order: if the list is
+    # logically reversed, swap every node's next/prev pointers (O(n)).
+    def materialize(self):
+        if not self._reversed:
+            return
+        self._reversed = False
+        if self.head is None or self.head.next == self.head:  # If empty or single node
+            return
+        current = self.head
+        while True:  # Traverse and swap next/prev pointers
+            temp = current.next
+            current.next = current.prev
+            current.prev = temp
+            current = temp
+            if current == self.head:  # Back to start, end loop
+                break
+        self.head = self.head.next  # Old last node (now after the old head) becomes the head
+        if self._index is not None:
+            self._index.rebuild(self._nodes())
+
+    # Sort the list in place (stable, O(n log n)) by relinking its nodes.
+    def sort(self, key=None, reverse=False):
+        if self.head is None:
+            return
+        self.materialize()
+        nodes = sorted_nodes(self._nodes(), key, reverse)
+        relink(nodes, doubly=True)
+        nodes[-1].next = nodes[0]  # Close the ring again
+        nodes[0].prev = nodes[-1]
+        self.head = nodes[0]
+        if self._index is not None:
+            self._index.rebuild(self._nodes())
+
+# Example usage (python -m linked_lists.Circular_DoublyLinked_List):
+if __name__ == "__main__":
+    # Create a circular doubly linked list
+    cdll = CircularDoublyLinkedList()
+
+    # Insert operations
+    cdll.insert_at_beginning(10)
+    cdll.insert_at_end(20)
+    cdll.insert_at_position(15, 1)  # Insert 15 between 10 and 20
+
+    # Print forward: 10 <-> 15 <-> 20 <-> (head)
+    cdll.print_list_forward()
+
+    # Print backward: 20 <-> 15 <-> 10 <-> (last)
+    cdll.print_list_backward()
+
+    # Search for 15: True
+    print(cdll.search(15))
+
+    # Delete operations
+    cdll.delete_at_beginning()  # Removes 10
+    cdll.delete_at_end()  # Removes 20
+    cdll.delete_by_value(15)  # Removes 15
+
+    # Print forward after deletions: List is empty.
+    cdll.print_list_forward()
+
+    # Length: 0
+    print(cdll.length())
+
+    # Insert again and reverse
+    cdll.insert_at_end(30)
+    cdll.insert_at_end(40)
+    cdll.insert_at_end(50)
+    cdll.print_list_forward()  # 30 <-> 40 <-> 50 <-> (head)
+    cdll.reverse()
+    cdll.print_list_forward()  # 50 <-> 40 <-> 30 <-> (head)
@@ -0,0 +1,130 @@
+# Thread-safe FIFO built from CircularDoublyLinkedList nodes, for producer /
+# consumer work rings. It uses the two-lock queue of Michael & Scott: a dummy
+# node sits in front of the first element, producers only touch the tail
+# under the tail lock and consumers only touch the dummy under the head lock,
+# so a put and a get never wait for each other.
+# The chain is not closed into a ring: the tail -> head link would make both
+# ends share a node and serialise producers with consumers again.
+# put()/get() follow the queue.Queue API, including block/timeout and the
+# queue.Full / queue.Empty exceptions.
+# Only FIFO use is supported: put()/get(), their _nowait forms and the
+# insert_at_end()/delete_at_beginning() aliases, all thread-safe. The rest of
+# the CircularDoublyLinkedList API (the other inserts and deletes, search,
+# iteration, reverse, splice, ...) is not available in this mode.
+import threading
+from queue import Empty, Full
+from time import monotonic
+
+from .Circular_DoublyLinked_List import CircularDoublyNode
+
+
+class ConcurrentLinkedQueue:
+    def __init__(self, maxsize=0):
+        self.maxsize = maxsize  # Capacity bound, 0 means unbounded
+        self._dummy = CircularDoublyNode(None)  # Placeholder before the first element, owned by consumers
+        self._tail = self._dummy  # Last node, owned by producers
+        self._head_lock = threading.Lock()  # Serialises consumers
+        self._tail_lock = threading.Lock()  # Serialises producers
+        self._not_empty = threading.Condition(threading.Lock())  # Only used by consumers that must wait
+        self._not_full = threading.Condition(threading.Lock())  # Only used by producers that must wait
+        self._waiting_gets = 0  # Consumers parked on _not_empty
+        self._waiting_puts = 0  # Producers parked on _not_full
+        self._puts = 0  # Elements ever linked, updated under the tail lock
+        self._gets = 0  # Elements ever taken, updated under the head lock
+
+    # Approximate number of elements (exact when no put/get is in flight).
+    def qsize(self):
+        return self._puts - self._gets
+
+    def __len__(self):
+        return self.qsize()
+
+    # Same as CircularDoublyLinkedList.length(), O(1).
+    def length(self):
+        return self.qsize()
+
+    def empty(self):
+        return self.qsize() <= 0
+
+    def full(self):
+        return self.maxsize > 0 and self.qsize() >= self.maxsize
+
+    # Park on a condition until ready() is true; returns False on timeout.
+    # The waiter count is raised before ready() is re-checked, so a thread
+    # that makes ready() true afterwards is guaranteed to see it and notify.
+    def _wait(self, condition, ready, waiting, deadline):
+        with condition:
+            setattr(self, waiting, getattr(self, waiting) + 1)
+            try:
+                while not ready():
+                    remaining = None if deadline is None else deadline - monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    condition.wait(remaining)
+                return True
+            finally:
+                setattr(self, waiting, getattr(self, waiting) - 1)
+
+    # Wake one parked thread, taking the condition's lock only if someone waits.
+    def _wake(self, condition, waiting):
+        if getattr(self, waiting):
+            with condition:
+                condition.notify()
+
+    # Append an item at the tail. With block=False, or once `timeout` seconds
+    # pass, a full bounded queue raises queue.Full.
+    def put(self, item, block=True, timeout=None):
+        new_node = CircularDoublyNode(item)
+        deadline = monotonic() + timeout if block and timeout is not None else None
+        while True:
+            with self._tail_lock:
+                if self.maxsize <= 0 or self._puts - self._gets < self.maxsize:
+                    new_node.prev = self._tail
+                    self._tail.next = new_node  # Publishing the link makes the item visible to consumers
+                    self._tail = new_node
+                    self._puts += 1
+                    break
+            if not block or not self._wait(self._not_full, lambda: not self.full(), "_waiting_puts", deadline):
+                raise Full
+        self._wake(self._not_empty, "_waiting_gets")
+
+    # Remove and return the item at the head. With block=False, or once
+    # `timeout` seconds pass, an empty queue raises queue.Empty.
+    def get(self, block=True, timeout=None):
+        deadline = monotonic() + timeout if block and timeout is not None else None
+        while True:
+            with self._head_lock:
+                first = self._dummy.next
+                if first is not None:
+                    item = first.data
+                    first.data = None  # The first node becomes the new dummy
+                    first.prev = None
+                    self._dummy.next = None
+                    self._dummy = first
+                    self._gets += 1
+                    break
+            if not block or not self._wait(self._not_empty, lambda: self._dummy.next is not None,
+                                           "_waiting_gets", deadline):
+                raise Empty
+        if self.maxsize > 0:
+            self._wake(self._not_full, "_waiting_puts")
+        return item
+
+    def put_nowait(self, item):
+        self.put(item, block=False)
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+    # Thread-safe alias of put(), so producer code written against the list
+    # API keeps working. Blocks while a bounded queue is full.
+    def insert_at_end(self, data):
+        self.put(data)
+
+    # Thread-safe alias of get_nowait() with the list's empty handling:
+    # returns the first item, or prints "List is empty." and returns None.
+    def delete_at_beginning(self):
+        try:
+            return self.get(block=False)
+        except Empty:
+            print("List is empty.")
@@ -0,0 +1,57 @@
+# Node handles for the doubly linked lists. Every insert returns the new
+# node, which callers can hand back to insert_after(), insert_before(),
+# remove() and move_to_front() to skip the O(n) walk to a position or value.
+# Each node's `owner` points at its list's Owner tag (None once removed), so
+# a handle from another list, or a stale one, is rejected in O(1). Also holds
+# the chain helpers splice() uses to move nodes between lists.
+
+
+# Tag shared by all nodes of one list. Moving nodes between lists retags
+# only one side of the move (see adopt()).
+class Owner:
+    __slots__ = ("list",)
+
+    def __init__(self, owner_list):
+        self.list = owner_list  # The list whose nodes carry this tag, None once retired
+
+
+# Raise ValueError unless handle is a node currently in owner_list.
+def check_handle(handle, owner_list):
+    owner = getattr(handle, "owner", None)
+    if owner is None or owner.list is not owner_list:
+        raise ValueError("Handle is not a node of this list")
+
+
+# Tag `count` nodes, following next pointers from `node`.
+def retag(node, count, owner):
+    for _ in range(count):
+        node.owner = owner
+        node = node.next
+
+
+# After `count` nodes starting at `first` were detached from source on their
+# way into target, give them target's tag. Retags whichever side is smaller:
+# the moved nodes, or target's own nodes plus those source keeps (then the
+# moved nodes keep their tag, which passes to target). So concat() into an
+# empty list is O(1) and split_at() only retags the shorter part.
+def adopt(target, source, first, count):
+    if count <= target.size + source.size:
+        retag(first, count, target._owner)
+        return
+    owner = source._owner
+    source._owner = Owner(source)
+    retag(source.head, source.size, source._owner)
+    target._owner.list = None  # None of target's nodes carry it any more
+    owner.list = target
+    target._owner = owner
+    retag(target.head, target.size, owner)
+
+
+# Turn a None-terminated chain around in place by swapping each node's
+# next/prev pointers; returns its new (first, last).
+def flip_chain(first, last):
+    current = first
+    while current:
+        current.next, current.prev = current.prev, current.next
+        current = current.prev  # The old next
+    return last, first
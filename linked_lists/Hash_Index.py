@@ -0,0 +1,91 @@
+# HashIndex maps each value to the nodes holding it, in list order, so the
+# lists can answer search() and find the first occurrence for
+# delete_by_value() without scanning. Values must be hashable.
+# Buckets are plain lists; with unique values every bucket has one node.
+# A node linked into the middle next to an equal value is placed beside that
+# value's entry. Otherwise its bucket is only marked unordered, and one walk
+# over the list puts every unordered bucket back in order the next time a
+# first or last occurrence is asked for, so inserts never walk the list.
+class HashIndex:
+    def __init__(self):
+        self.buckets = {}  # value -> nodes holding that value, first occurrence first
+        self.unordered = set()  # Values whose bucket is not in list order yet
+
+    # True if at least one node holds the value.
+    def __contains__(self, data):
+        return data in self.buckets
+
+    # First node (in list order) holding the value, or None. `nodes` yields
+    # the list's nodes in order, it is only walked for an unordered bucket.
+    def first(self, data, nodes):
+        if data in self.unordered:
+            self._order(nodes)
+        bucket = self.buckets.get(data)
+        return bucket[0] if bucket else None
+
+    # Last node (in list order) holding the value, or None.
+    def last(self, data, nodes):
+        if data in self.unordered:
+            self._order(nodes)
+        bucket = self.buckets.get(data)
+        return bucket[-1] if bucket else None
+
+    # Record a node that was linked in front of every other node.
+    def push_front(self, node):
+        self.buckets.setdefault(node.data, []).insert(0, node)
+
+    # Record a node that was linked after every other node.
+    def push_back(self, node):
+        self.buckets.setdefault(node.data, []).append(node)
+
+    # Record a node linked somewhere in the middle, between the nodes before
+    # and after it. An equal neighbour gives its rank without a walk.
+    def insert(self, node, before, after):
+        bucket = self.buckets.setdefault(node.data, [])
+        if not bucket:
+            bucket.append(node)
+        elif before is not None and before.data == node.data:
+            if bucket[-1] is before:
+                bucket.append(node)
+            else:
+                bucket.insert(bucket.index(before) + 1, node)
+        elif after is not None and after.data == node.data:
+            bucket.insert(0 if bucket[0] is after else bucket.index(after), node)
+        else:  # Rank unknown, sorted out by the next _order()
+            bucket.append(node)
+            self.unordered.add(node.data)
+
+    # Forget a node that was unlinked from the list.
+    def remove(self, node):
+        bucket = self.buckets[node.data]
+        if bucket[0] is node:
+            del bucket[0]
+        elif bucket[-1] is node:
+            del bucket[-1]
+        else:
+            bucket.remove(node)
+        if len(bucket) < 2:  # Zero or one node is always in order
+            self.unordered.discard(node.data)
+            if not bucket:
+                del self.buckets[node.data]
+
+    # Forget every node.
+    def clear(self):
+        self.buckets.clear()
+        self.unordered.clear()
+
+    # Re-index from scratch, given the nodes in list order.
+    def rebuild(self, nodes):
+        self.clear()
+        for node in nodes:
+            self.push_back(node)
+
+    # Put every unordered bucket back in list order with one walk.
+    def _order(self, nodes):
+        buckets = {data: [] for data in self.unordered}
+        for node in nodes():
+            bucket = buckets.get(node.data)
+            if bucket is not None:
+                bucket.append(node)
+        self.buckets.update(buckets)
+        self.unordered.clear()
@@ -0,0 +1,239 @@
+# Opt-in instrumentation for the list classes: calls per method, wall time
+# histograms and, if asked for, nodes traversed per call.
+#
+#     stats = instrument(linked_list)
+#     ...                                # use the list as usual
+#     print(stats.to_prometheus())       # or stats.as_dict()
+#     uninstrument(linked_list)
+#
+# instrument() swaps the list's __class__ for a subclass whose public methods
+# record every call, so uninstrumented lists keep running the plain methods
+# and pay nothing. The list classes use __slots__, which keeps the swap from
+# moving their attributes into a slower per-instance dict. Only the
+# outermost call is recorded (insert_at_position calling insert_at_end counts
+# as one insert_at_position). Methods returning an iterator (__iter__,
+# iter_range, ...) are recorded once it is exhausted or dropped, with the
+# time spent producing items and one node per item.
+#
+# count_nodes=True also counts the nodes each call walks over, through the
+# traversal helpers the lists share: _nodes() and _slots() count one per node
+# or slot they yield, _advance() counts the links it follows. Scans, seeks by
+# position and the index walks that go through them are counted; passes that
+# relink every node in place (reverse, apply_batch, materialize) are not, nor
+# are the express levels of the skip list or lists with no such helpers.
+# len() is not recorded, as list() calls it for a length hint; length() is.
+from bisect import bisect_left
+from functools import wraps
+from time import perf_counter_ns
+from types import GeneratorType
+
+BUCKET_BOUNDS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0)  # Histogram upper bounds in seconds, +Inf implied
+_BOUNDS_NS = tuple(round(bound * 1e9) for bound in BUCKET_BOUNDS)
+_DUNDERS = ("__iter__", "__reversed__", "__contains__")
+_COUNTED = ("_nodes", "_slots")  # Traversal helpers yielding one node or slot at a time
+_classes = {}  # list class -> its instrumented subclass
+
+
+# Counters for one method.
+class MethodStats:
+    __slots__ = ("calls", "nodes", "max_nodes", "total_ns", "buckets")
+
+    def __init__(self):
+        self.calls = 0
+        self.nodes = 0  # Nodes traversed over all calls (when counted)
+        self.max_nodes = 0  # Most nodes traversed by a single call
+        self.total_ns = 0
+        self.buckets = [0] * (len(BUCKET_BOUNDS) + 1)  # Calls per time bucket, the last one is +Inf
+
+
+# Everything recorded for one instrumented list.
+class ListStats:
+    def __init__(self, class_name, count_nodes=False):
+        self.class_name = class_name
+        self.count_nodes = count_nodes
+        self.methods = {}  # method name -> MethodStats
+        self.depth = 0  # > 0 while a recorded call is running
+        self.steps = 0  # Nodes counted by the traversal helpers during the current call
+
+    def record(self, name, elapsed_ns, nodes):
+        stats = self.methods.get(name)
+        if stats is None:
+            stats = self.methods[name] = MethodStats()
+        stats.calls += 1
+        stats.total_ns += elapsed_ns
+        stats.buckets[bisect_left(_BOUNDS_NS, elapsed_ns)] += 1
+        if nodes is not None:
+            stats.nodes += nodes
+            stats.max_nodes = max(stats.max_nodes, nodes)
+
+    # Forget everything recorded so far.
+    def reset(self):
+        self.methods.clear()
+
+    # Recorded counters as plain dicts; buckets are cumulative like
+    # Prometheus's, keyed by upper bound in seconds ("+Inf" last).
+    def as_dict(self):
+        methods = {}
+        for name, stats in sorted(self.methods.items()):
+            cumulative = 0
+            buckets = {}
+            for bound, count in zip(BUCKET_BOUNDS + ("+Inf",), stats.buckets):
+                cumulative += count
+                buckets[bound] = cumulative
+            methods[name] = {"calls": stats.calls, "nodes": stats.nodes, "max_nodes": stats.max_nodes,
+                             "seconds": stats.total_ns / 1e9, "buckets": buckets}
+        return {"class": self.class_name, "count_nodes": self.count_nodes, "methods": methods}
+
+    # Prometheus text exposition format. `labels` are added to every sample,
+    # e.g. {"list": "sessions"} to tell several lists apart.
+    def to_prometheus(self, prefix="linked_list", labels=None):
+        base = {"class": self.class_name, **(labels or {})}
+        lines = [f"# HELP {prefix}_calls_total Calls per list method.",
+                 f"# TYPE {prefix}_calls_total counter"]
+        lines += [f"{prefix}_calls_total{_labels(base, method=name)} {stats.calls}"
+                  for name, stats in sorted(self.methods.items())]
+        if self.count_nodes:
+            lines += [f"# HELP {prefix}_nodes_traversed_total Nodes traversed per list method.",
+                      f"# TYPE {prefix}_nodes_traversed_total counter"]
+            lines += [f"{prefix}_nodes_traversed_total{_labels(base, method=name)} {stats.nodes}"
+                      for name, stats in sorted(self.methods.items())]
+        lines += [f"# HELP {prefix}_call_seconds Wall time per list method call.",
+                  f"# TYPE {prefix}_call_seconds histogram"]
+        for name, summary in self.as_dict()["methods"].items():
+            for bound, count in summary["buckets"].items():
+                le = bound if bound == "+Inf" else repr(bound)
+                lines.append(f"{prefix}_call_seconds_bucket{_labels(base, method=name, le=le)} {count}")
+            lines.append(f"{prefix}_call_seconds_sum{_labels(base, method=name)} {summary['seconds']!r}")
+            lines.append(f"{prefix}_call_seconds_count{_labels(base, method=name)} {summary['calls']}")
+        return "\n".join(lines) + "\n"
+
+    # Re-yield a method's iterator, timing only the work of producing items.
+    # Other calls may run between items, so the helpers' count is kept apart.
+    def track(self, name, iterator):
+        elapsed = 0
+        nodes = 0
+        try:
+            while True:
+                start = perf_counter_ns()
+                self.depth += 1
+                outer_steps, self.steps = self.steps, 0
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    break
+                finally:
+                    self.depth -= 1
+                    nodes += self.steps  # Seeks before the first item
+                    self.steps = outer_steps
+                    elapsed += perf_counter_ns() - start
+                nodes += 1
+                yield item
+        finally:
+            self.record(name, elapsed, nodes)
+
+
+def _labels(base, **extra):
+    pairs = {**base, **extra}
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"') for value in pairs.values())
+    return "{" + ",".join(f'{key}="{value}"' for key, value in zip(pairs, escaped)) + "}"
+
+
+# Re-yield a traversal, adding one to stats.steps per item.
+def _counted(stats, iterator):
+    for item in iterator:
+        stats.steps += 1
+        yield item
+
+
+# Wrap one method so each outermost call is recorded in self._stats.
+def _recorded(name, method):
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        stats = self._stats
+        if stats.depth:  # Called by another list method, only the outer call counts
+            result = method(self, *args, **kwargs)
+            if stats.count_nodes and isinstance(result, GeneratorType):  # e.g. write_to() iterating the list
+                return _counted(stats, result)
+            return result
+        stats.steps = 0
+        stats.depth += 1
+        start = perf_counter_ns()
+        try:
+            result = method(self, *args, **kwargs)
+        finally:
+            elapsed = perf_counter_ns() - start
+            stats.depth -= 1
+        if isinstance(result, GeneratorType):  # Recorded when the caller is done with it
+            return stats.track(name, result)
+        stats.record(name, elapsed, stats.steps if stats.count_nodes else None)
+        return result
+    return wrapper
+
+
+# Counting override of a helper yielding nodes or slots.
+def _counting_walk(helper):
+    @wraps(helper)
+    def walk(self, *args):
+        iterator = helper(self, *args)
+        stats = self._stats
+        return _counted(stats, iterator) if stats.count_nodes else iterator
+    return walk
+
+
+# Counting override of _advance(node, steps), which follows abs(steps) links.
+def _counting_advance(helper):
+    @wraps(helper)
+    def advance(self, node, steps):
+        stats = self._stats
+        if stats.count_nodes:
+            stats.steps += abs(steps)
+        return helper(self, node, steps)
+    return advance
+
+
+# Instrumented subclass of list_class, built once per class.
+def _instrumented_class(list_class):
+    instrumented = _classes.get(list_class)
+    if instrumented is not None:
+        return instrumented
+    namespace = {"__slots__": (), "__module__": list_class.__module__}
+    for name in dir(list_class):
+        if name.startswith("_") and name not in _DUNDERS:
+            continue
+        attribute = getattr(list_class, name)
+        if callable(attribute) and not isinstance(attribute, type) and getattr(attribute, "__self__", None) is None:
+            namespace[name] = _recorded(name, attribute)  # Plain methods only, not classmethods
+    for name in _COUNTED:
+        if hasattr(list_class, name):
+            namespace[name] = _counting_walk(getattr(list_class, name))
+    if hasattr(list_class, "_advance"):
+        namespace["_advance"] = _counting_advance(list_class._advance)
+
+    def __init__(self, *args, **kwargs):  # Lists built by the methods themselves (split_at) get their own stats
+        list_class.__init__(self, *args, **kwargs)
+        self._stats = ListStats(list_class.__name__)
+    namespace["__init__"] = __init__
+    instrumented = _classes[list_class] = type(f"Instrumented{list_class.__name__}", (list_class,), namespace)
+    return instrumented
+
+
+# Start recording calls on a list and return its ListStats. Calling it on a
+# list that is already instrumented returns the existing stats.
+def instrument(linked_list, count_nodes=False):
+    if type(linked_list) in _classes.values():
+        linked_list._stats.count_nodes = count_nodes
+        return linked_list._stats
+    instrumented = _instrumented_class(type(linked_list))
+    linked_list._stats = ListStats(type(linked_list).__name__, count_nodes)
+    linked_list.__class__ = instrumented
+    return linked_list._stats
+
+
+# Stop recording and return the final stats (None if not instrumented).
+def uninstrument(linked_list):
+    if type(linked_list) not in _classes.values():
+        return None
+    stats = linked_list._stats
+    linked_list.__class__ = type(linked_list).__mro__[1]
+    del linked_list._stats
+    return stats
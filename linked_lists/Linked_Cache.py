@@ -0,0 +1,336 @@
+# Bounded caches built on doubly linked nodes. A dict maps every key to its
+# node and the nodes are kept in eviction order, so get, put, promotion and
+# eviction are all O(1):
+#   LRUCache evicts the least recently used entry;
+#   LFUCache evicts the least frequently used entry (the least recently used
+#   one among equal use counts), keeping one ring of entries per use count.
+# Both are bounded by entry count (maxsize) and/or total weight (maxweight,
+# where weigher(key, value) gives each entry's weight, 1 by default), call
+# on_evict(key, value) for every entry they evict and count hits and misses.
+from collections import namedtuple
+
+from .doublyLinked_List import DoublyNode
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize", "weight"])
+
+_MISSING = object()  # Default for pop(), distinguishes "no default" from None
+
+
+# Cache entry; the node's data is the cached value.
+class CacheNode(DoublyNode):
+    __slots__ = ("key", "weight", "bucket")
+
+    def __init__(self, key, value, weight):
+        self.data = value  # Set directly rather than via DoublyNode.__init__, put() is hot
+        self.next = None
+        self.prev = None
+        self.key = key
+        self.weight = weight
+        self.bucket = None  # LFUCache: the _Bucket this entry is linked into
+
+
+# Empty ring: a sentinel node linked to itself, so linking and unlinking
+# never have to special-case the ends.
+def _ring():
+    sentinel = CacheNode(None, None, 0)
+    sentinel.next = sentinel
+    sentinel.prev = sentinel
+    return sentinel
+
+
+# Link node (an entry or a bucket) in right after anchor.
+def _link_after(anchor, node):
+    node.prev = anchor
+    node.next = anchor.next
+    anchor.next.prev = node
+    anchor.next = node
+
+
+# Unlink node from its ring.
+def _unlink(node):
+    node.prev.next = node.next
+    node.next.prev = node.prev
+    node.next = None
+    node.prev = None
+
+
+# Shared bookkeeping; subclasses decide the eviction order through _add,
+# _touch, _detach, _victim, _order and _reset.
+class _LinkedCache:
+    def __init__(self, maxsize=128, maxweight=None, weigher=None, on_evict=None):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("maxsize must not be negative")
+        if maxweight is not None and maxweight < 0:
+            raise ValueError("maxweight must not be negative")
+        self.maxsize = maxsize  # Most entries kept, None for no limit
+        self.maxweight = maxweight  # Largest total weight kept, None for no limit
+        self.weigher = weigher  # weigher(key, value) -> weight, None weighs every entry 1
+        self.on_evict = on_evict  # on_evict(key, value), called after an entry is evicted
+        self._map = {}  # key -> CacheNode
+        self.weight = 0  # Total weight of the cached entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # Return the cached value and mark the key as used, or default on a miss.
+    def get(self, key, default=None):
+        node = self._map.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(node)
+        return node.data
+
+    # Return the cached value without marking it used or counting a hit/miss.
+    def peek(self, key, default=None):
+        node = self._map.get(key)
+        return default if node is None else node.data
+
+    # Cache value under key (replacing any earlier value, which counts as a
+    # use), then evict entries until the cache is back within its bounds.
+    def put(self, key, value):
+        if self.maxsize == 0:  # Caching disabled, as with functools.lru_cache(maxsize=0)
+            return
+        weight = 1 if self.weigher is None else self.weigher(key, value)
+        if self.maxweight is not None and weight > self.maxweight:
+            raise ValueError(f"Entry weight {weight} exceeds maxweight {self.maxweight}")
+        node = self._map.get(key)
+        if node is None:
+            node = CacheNode(key, value, weight)
+            self._map[key] = node
+            self._add(node)
+        else:
+            self.weight -= node.weight
+            node.data = value
+            node.weight = weight
+            self._touch(node)
+        self.weight += weight
+        maxsize = self.maxsize
+        maxweight = self.maxweight
+        while ((maxsize is not None and len(self._map) > maxsize)
+               or (maxweight is not None and self.weight > maxweight)):
+            self._evict(self._victim(node))  # Never the entry just stored
+
+    # Mark the key as used without reading it; returns False if not cached.
+    def touch(self, key):
+        node = self._map.get(key)
+        if node is None:
+            return False
+        self._touch(node)
+        return True
+
+    # Remove the key and return its value (no on_evict call). Raises
+    # KeyError if the key is missing and no default is given.
+    def pop(self, key, default=_MISSING):
+        node = self._map.get(key)
+        if node is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        self._remove(node)
+        return node.data
+
+    # Evict the next entry in eviction order and return (key, value).
+    def evict(self):
+        if not self._map:
+            raise KeyError("evict() on an empty cache")
+        node = self._victim(None)
+        self._evict(node)
+        return node.key, node.data
+
+    # Drop every entry (no on_evict calls); statistics are kept.
+    def clear(self):
+        self._map.clear()
+        self.weight = 0
+        self._reset()
+
+    # Hit/miss/eviction counters and current size, like functools' cache_info().
+    def cache_info(self):
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._map), self.weight)
+
+    # (key, value) pairs, from the entry evicted last to the one evicted next.
+    def items(self):
+        for node in self._order():
+            yield node.key, node.data
+
+    # Keys in the same order as items().
+    def __iter__(self):
+        for node in self._order():
+            yield node.key
+
+    def __len__(self):
+        return len(self._map)
+
+    # Membership test; does not count as a use.
+    def __contains__(self, key):
+        return key in self._map
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def __delitem__(self, key):
+        self.pop(key)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    # Remove node from the map and the eviction order.
+    def _remove(self, node):
+        del self._map[node.key]
+        self.weight -= node.weight
+        self._detach(node)
+
+    # Remove node as an eviction and report it to on_evict.
+    def _evict(self, node):
+        del self._map[node.key]
+        self.weight -= node.weight
+        self._detach(node)
+        self.evictions += 1
+        if self.on_evict is not None:
+            self.on_evict(node.key, node.data)
+
+
+# Least recently used eviction over one ring: the sentinel's next entry is
+# the most recently used, its prev the next to be evicted.
+class LRUCache(_LinkedCache):
+    def __init__(self, maxsize=128, maxweight=None, weigher=None, on_evict=None):
+        super().__init__(maxsize, maxweight, weigher, on_evict)
+        self._entries = _ring()
+
+    def _add(self, node):
+        _link_after(self._entries, node)
+
+    # Move the node to the front of the ring.
+    def _touch(self, node):
+        if self._entries.next is not node:
+            _unlink(node)
+            _link_after(self._entries, node)
+
+    move_to_front = _LinkedCache.touch  # The LRU name for touch()
+
+    def _detach(self, node):
+        _unlink(node)
+
+    # Least recently used entry other than keep.
+    def _victim(self, keep):
+        node = self._entries.prev
+        return node.prev if node is keep else node
+
+    def _order(self):
+        node = self._entries.next
+        while node is not self._entries:
+            yield node
+            node = node.next
+
+    def _reset(self):
+        self._entries = _ring()
+
+
+# All LFUCache entries used the same number of times, most recent first.
+class _Bucket:
+    __slots__ = ("count", "entries", "next", "prev")
+
+    def __init__(self, count):
+        self.count = count  # Uses of every entry in this bucket
+        self.entries = _ring()
+        self.next = None  # Bucket with the next higher count
+        self.prev = None  # Bucket with the next lower count
+
+
+# Least frequently used eviction in O(1): buckets sit on a ring in
+# ascending count order and only exist while they hold entries, so a use
+# moves an entry to the neighbouring bucket (creating it if needed) and the
+# next victim is always the oldest entry of the first bucket.
+class LFUCache(_LinkedCache):
+    def __init__(self, maxsize=128, maxweight=None, weigher=None, on_evict=None):
+        super().__init__(maxsize, maxweight, weigher, on_evict)
+        self._buckets = self._bucket_ring()
+
+    @staticmethod
+    def _bucket_ring():
+        sentinel = _Bucket(0)  # Count 0 never matches a real bucket
+        sentinel.next = sentinel
+        sentinel.prev = sentinel
+        return sentinel
+
+    # Number of times key has been used (stored, read or touched), 0 if not cached.
+    def use_count(self, key):
+        node = self._map.get(key)
+        return 0 if node is None else node.bucket.count
+
+    # New entries start in the count-1 bucket, always the first if present.
+    def _add(self, node):
+        bucket = self._buckets.next
+        if bucket.count != 1:
+            bucket = _Bucket(1)
+            _link_after(self._buckets, bucket)
+        node.bucket = bucket
+        _link_after(bucket.entries, node)
+
+    # Move the node to the front of the next bucket up.
+    def _touch(self, node):
+        bucket = node.bucket
+        following = bucket.next
+        if following.count != bucket.count + 1:
+            following = _Bucket(bucket.count + 1)
+            _link_after(bucket, following)
+        self._detach(node)
+        node.bucket = following
+        _link_after(following.entries, node)
+
+    # Unlink the node, dropping its bucket if that leaves it empty.
+    def _detach(self, node):
+        bucket = node.bucket
+        _unlink(node)
+        node.bucket = None
+        if bucket.entries.next is bucket.entries:
+            _unlink(bucket)
+
+    # Oldest entry of the lowest count other than keep.
+    def _victim(self, keep):
+        bucket = self._buckets.next
+        node = bucket.entries.prev
+        if node is keep:
+            node = node.prev
+            if node is bucket.entries:  # keep was alone in the first bucket
+                node = bucket.next.entries.prev
+        return node
+
+    # Most used first, most recent first within a count.
+    def _order(self):
+        bucket = self._buckets.prev
+        while bucket is not self._buckets:
+            node = bucket.entries.next
+            while node is not bucket.entries:
+                yield node
+                node = node.next
+            bucket = bucket.prev
+
+    def _reset(self):
+        self._buckets = self._bucket_ring()
+
+
+# Example usage (python -m linked_lists.Linked_Cache):
+if __name__ == "__main__":
+    lru = LRUCache(maxsize=3, on_evict=lambda key, value: print("Evicted:", key, value))
+    for key in "abc":
+        lru.put(key, key.upper())
+    lru.get("a")  # "a" becomes the most recently used
+    lru.put("d", "D")  # Evicts "b"
+    print("LRU order:", list(lru))
+    print(lru.cache_info())
+
+    lfu = LFUCache(maxweight=10, weigher=lambda key, value: len(value))
+    lfu.put("x", "xxxx")
+    lfu.put("y", "yyyy")
+    lfu.get("x")
+    lfu.put("z", "zzzz")  # Over the weight bound, evicts "y" (used least)
+    print("LFU order:", list(lfu), "weight:", lfu.weight)
+    print("Uses of x:", lfu.use_count("x"))
@@ -0,0 +1,581 @@
+import sys
+
+from .Batch_Ops import claim_value_delete, plan_batch
+from .Hash_Index import HashIndex
+from .List_IO import dump_records, load_records, write_chunked
+from .Sort_Ops import relink, sorted_nodes
+
+# SinglyNode class to represent each element in the linked list.
+# Each node contains data and a reference (link) to the next node.
+class SinglyNode:
+    __slots__ = ("data", "next")  # No per-instance __dict__, keeps each node compact
+
+    def __init__(self, data):
+        self.data = data  # Store the data value in the node
+        self.next = None  # Pointer to the next node, initially None
+
+Node = SinglyNode  # Former name, kept for code that imports Node directly
+
+# LinkedList class to manage the linked list operations.
+class LinkedList:
+    # Fixed attribute layout, no per-instance __dict__. _stats is only set while
+    # the list is instrumented (see Instrumented_List).
+    __slots__ = ("head", "tail", "size", "_index", "_pred", "_shared", "_stats", "__weakref__")
+
+    # engine="node" builds the list from SinglyNode objects (the default);
+    # engine="array" returns an index-linked ArrayLinkedList. It has the basic
+    # inserts/deletes, search, reverse, iteration, iter_range, write_to,
+    # dump/load and parallel, but no iter_from, sort, splice/concat/split_at,
+    # apply_batch or snapshot.
+    # engine="numpy" returns a float64 NumericLinkedList (requires NumPy) with
+    # vectorized search/find_all/sum/min/max on top of the basic inserts/deletes,
+    # reverse, iteration and write_to; none of the other methods above.
+    # indexed=True keeps a value -> node hash index (values must be hashable) so
+    # search() and delete_by_value() run in O(1) on average.
+    def __new__(cls, engine="node", indexed=False):
+        if engine == "array":
+            if indexed:
+                raise ValueError("The array engine does not support indexed=True")
+            from .Array_LinkedList import ArrayLinkedList  # Imported lazily, only needed for this engine
+            return ArrayLinkedList()
+        if engine == "numpy":
+            if indexed:
+                raise ValueError("The numpy engine does not support indexed=True")
+            from .Numeric_LinkedList import NumericLinkedList  # Imported lazily, NumPy is optional
+            return NumericLinkedList()
+        if engine != "node":
+            raise ValueError(f"Unknown engine: {engine!r}")
+        return super().__new__(cls)
+
+    def __init__(self, engine="node", indexed=False):
+        self.head = None  # Initialize the head of the list as None (empty list)
+        self.tail = None  # Reference to the last node, kept so end operations skip the traversal
+        self.size = 0  # Number of nodes, updated by every insert and delete
+        self._index = HashIndex() if indexed else None  # value -> nodes, None when not indexed
+        self._pred = {} if indexed else None  # node -> previous node, lets indexed deletes unlink in O(1)
+        self._shared = False  # True while snapshots may still read the current nodes
+
+    # Yield every node from head to tail.
+    def _nodes(self):
+        current = self.head
+        while current:
+            yield current
+            current = current.next
+
+    # Node `steps` links after node.
+    def _advance(self, node, steps):
+        for _ in range(steps):
+            node = node.next
+        return node
+
+    # Rebuild the hash index and predecessor map after a bulk relink.
+    def _reindex(self):
+        self._index.rebuild(self._nodes())
+        self._pred.clear()
+        previous = None
+        for node in self._nodes():
+            self._pred[node] = previous
+            previous = node
+
+    # Copy-on-write for snapshot(): a snapshot reads a fixed number of nodes
+    # from the head it saw, so prepends, appends and deletes at the head never
+    # disturb it. Every other mutator calls this first; while snapshots exist
+    # it gives the list a fresh copy of its chain and leaves the old nodes to them.
+    def _unshare(self):
+        if not self._shared:
+            return
+        data = list(self)
+        self.head = self.tail = None
+        self.size = 0
+        if self._index is not None:
+            self._index.clear()
+            self._pred.clear()
+        self._shared = False
+        self.extend(data)
+
+    # Return an immutable PersistentList view of the current contents in O(1).
+    # It shares this list's nodes until a mutation needs to relink them.
+    def snapshot(self):
+        from .Persistent_List import PersistentList  # Imported lazily, Persistent_List builds on this module
+        self._shared = True
+        return PersistentList._from_chain(self.head, self.size)
+
+    # Insert a new node at the beginning of the list and return it (a handle).
+    def insert_at_beginning(self, data):
+        new_node = SinglyNode(data)  # Create a new node with the given data
+        new_node.next = self.head  # Set the new node's next to the current head
+        if self._index is not None:
+            self._index.push_front(new_node)
+            self._pred[new_node] = None
+            if self.head:
+                self._pred[self.head] = new_node
+        self.head = new_node  # Update the head to the new node
+        if self.tail is None:  # First node is also the last node
+            self.tail = new_node
+        self.size += 1
+        return new_node
+
+    # Insert a new node at the end of the list and return it (a handle).
+    def insert_at_end(self, data):
+        new_node = SinglyNode(data)  # Create a new node with the given data
+        if self._index is not None:
+            self._index.push_back(new_node)
+            self._pred[new_node] = self.tail
+        if self.head is None:  # If the list is empty, set head to the new node
+            self.head = new_node
+        else:
+            self.tail.next = new_node  # Link the last node to the new node
+        self.tail = new_node  # The new node is now the last node
+        self.size += 1
+        return new_node
+
+    # Build a new list from any iterable (generators are consumed lazily).
+    @classmethod
+    def from_iterable(cls, iterable, indexed=False):
+        new_list = cls(indexed=indexed)
+        new_list.extend(iterable)
+        return new_list
+
+    # Append every item of the iterable, linking the new chain in a single pass.
+    def extend(self, iterable):
+        first = None
+        last = None
+        count = 0
+        for data in iterable:  # Build the chain without touching the list yet
+            new_node = SinglyNode(data)
+            if last is None:
+                first = new_node
+            else:
+                last.next = new_node
+            last = new_node
+            count += 1
+        if first is None:  # Nothing to add
+            return
+        if self._index is not None:
+            previous = self.tail
+            current = first
+            while current:  # Register the new chain in list order
+                self._index.push_back(current)
+                self._pred[current] = previous
+                previous = current
+                current = current.next
+        if self.tail is None:  # Empty list, the chain becomes the whole list
+            self.head = first
+        else:
+            self.tail.next = first  # Splice the chain after the last node
+        self.tail = last
+        self.size += count
+
+    # Prepend every item of the iterable one after another, so they end up in
+    # reverse order at the front (same semantics as collections.deque.extendleft).
+    def extendleft(self, iterable):
+        first = None
+        last = None
+        count = 0
+        for data in iterable:  # Each new node goes in front of the previous one
+            new_node = SinglyNode(data)
+            new_node.next = first
+            if self._index is not None:
+                self._index.push_front(new_node)
+                if first is not None:
+                    self._pred[first] = new_node
+            if last is None:
+                last = new_node
+            first = new_node
+            count += 1
+        if first is None:  # Nothing to add
+            return
+        if self._index is not None:
+            self._pred[first] = None
+            if self.head:
+                self._pred[self.head] = last
+        last.next = self.head  # Splice the chain before the current head
+        self.head = first
+        if self.tail is None:
+            self.tail = last
+        self.size += count
+
+    # Insert a new node at a specific position (0-based index) and return it.
+    def insert_at_position(self, data, position):
+        if position < 0:  # Invalid position
+            print("Position cannot be negative.")
+            return
+        if position > self.size:  # If position is beyond the list length
+            print("Position out of range.")
+            return
+        if position == 0:  # Insert at the beginning if position is 0
+            return self.insert_at_beginning(data)
+        if position == self.size:  # Appending, no traversal needed
+            return self.insert_at_end(data)
+        self._unshare()
+        new_node = SinglyNode(data)  # Create a new node
+        current = self._advance(self.head, position - 1)  # Traverse to the node before the position
+        new_node.next = current.next  # Insert the new node
+        current.next = new_node
+        if self._index is not None:
+            self._index.insert(new_node, current, new_node.next)
+            self._pred[new_node] = current
+            self._pred[new_node.next] = new_node
+        self.size += 1
+        return new_node
+
+    # Delete the node at the beginning of the list.
+    def delete_at_beginning(self):
+        if self.head is None:  # If list is empty, nothing to delete
+            print("List is empty.")
+            return
+        if self._index is not None:
+            self._index.remove(self.head)
+            del self._pred[self.head]
+            if self.head.next:
+                self._pred[self.head.next] = None
+        self.head = self.head.next  # Move head to the next node
+        if self.head is None:  # List became empty
+            self.tail = None
+        self.size -= 1
+
+    # Delete the node at the end of the list.
+    def delete_at_end(self):
+        if self.head is None:  # If list is empty
+            print("List is empty.")
+            return
+        if self.head.next is None:  # If only one node
+            self.delete_at_beginning()
+            return
+        self._unshare()
+        if self._index is not None:  # Predecessor is known, no traversal
+            current = self._pred.pop(self.tail)
+            self._index.remove(self.tail)
+        else:  # Traverse to the second last node (singly linked, no back pointer)
+            current = self._advance(self.head, self.size - 2)
+        current.next = None  # Remove the last node
+        self.tail = current
+        self.size -= 1
+
+    # Unlink a node given its predecessor (None when the node is the head).
+    def _unlink(self, previous, node):
+        if previous is None:
+            self.delete_at_beginning()
+            return
+        if node is self.tail:  # Removing the last node
+            self.tail = previous
+        previous.next = node.next  # Remove the node
+        if self._index is not None:
+            self._index.remove(node)
+            del self._pred[node]
+            if node.next:
+                self._pred[node.next] = previous
+        self.size -= 1
+
+    # Delete the first node with the given data value. Indexed lists jump to it;
+    # if the value was inserted mid-list away from its equals, the first such
+    # lookup walks the list once to order them (see Hash_Index).
+    def delete_by_value(self, data):
+        if self.head is None:  # If list is empty
+            print("List is empty.")
+            return
+        self._unshare()
+        if self._index is not None:  # Jump straight to the first occurrence
+            node = self._index.first(data, self._nodes)
+            if node is None:
+                print("Value not found.")
+                return
+            self._unlink(self._pred[node], node)
+            return
+        previous = None
+        for node in self._nodes():  # Traverse to find the node
+            if node.data == data:
+                self._unlink(previous, node)  # At the head this is delete_at_beginning()
+                return
+            previous = node
+        print("Value not found.")  # If value not in list
+
+    # Apply a batch of inserts and deletes (see Batch_Ops for the format) in a
+    # single forward sweep that stops after the last position it needs.
+    # Returns one True/False per operation instead of printing errors.
+    def apply_batch(self, ops):
+        self._unshare()
+        positional, by_value, results = plan_batch(ops, self.size)
+        count = len(positional)
+        j = 0
+        previous = None
+        current = self.head
+        position = 0
+        while j < count or by_value:
+            while j < count and positional[j][0] == position and positional[j][1] == 0:  # Inserts before current
+                new_node = SinglyNode(positional[j][3])
+                new_node.next = current
+                if previous is None:
+                    self.head = new_node
+                else:
+                    previous.next = new_node
+                if current is None:
+                    self.tail = new_node
+                previous = new_node
+                self.size += 1
+                results[positional[j][2]] = True
+                j += 1
+            if current is None:  # Swept past the last node
+                break
+            remove = False
+            while j < count and positional[j][0] == position:  # Deletes of current (duplicates stay False)
+                if not remove:
+                    results[positional[j][2]] = True
+                    remove = True
+                j += 1
+            if not remove and by_value:
+                remove = claim_value_delete(by_value, current.data, results)
+            following = current.next
+            if remove:
+                if previous is None:
+                    self.head = following
+                else:
+                    previous.next = following
+                if following is None:
+                    self.tail = previous
+                self.size -= 1
+            else:
+                previous = current
+            current = following
+            position += 1
+        if self._index is not None:
+            self._reindex()
+        return results
+
+    # Unlink positions start <= i < stop (slice semantics) as a None-terminated
+    # chain in one pass from the head; returns (first, last, count).
+    def _detach(self, start, stop):
+        self._unshare()
+        start, stop, _ = slice(start, stop).indices(self.size)
+        count = stop - start
+        if count <= 0:
+            return None, None, 0
+        before = None
+        if start:  # Traverse to the node before the range
+            before = self._advance(self.head, start - 1)
+        first = before.next if before else self.head
+        if stop == self.size:  # The range runs to the end, no walk needed
+            last = self.tail
+        else:  # Walk on to the last node of the range
+            last = self._advance(first, count - 1)
+        after = last.next
+        if before is None:
+            self.head = after
+        else:
+            before.next = after
+        if after is None:  # The range ran to the end
+            self.tail = before
+        last.next = None
+        if self._index is not None:
+            if count == self.size:
+                self._index.clear()
+                self._pred.clear()
+            else:
+                current = first
+                while current:  # Forget the moved nodes
+                    self._index.remove(current)
+                    del self._pred[current]
+                    current = current.next
+                if after is not None:
+                    self._pred[after] = before
+        self.size -= count
+        return first, last, count
+
+    # Link a None-terminated chain of count nodes in front of position `at`.
+    # O(1) at either end, otherwise one walk to the node before `at`.
+    def _attach(self, first, last, count, at):
+        self._unshare()
+        if at == self.size:
+            before = self.tail
+        elif at == 0:
+            before = None
+        else:  # Traverse to the node before the position
+            before = self._advance(self.head, at - 1)
+        after = before.next if before else self.head
+        if before is None:
+            self.head = first
+        else:
+            before.next = first
+        last.next = after
+        if after is None:
+            self.tail = last
+        if self._index is not None:
+            chain = []
+            previous = before
+            current = first
+            for _ in range(count):  # Register the moved nodes' predecessors
+                chain.append(current)
+                self._pred[current] = previous
+                previous = current
+                current = current.next
+            if after is not None:
+                self._pred[after] = last
+            if after is None:
+                for node in chain:
+                    self._index.push_back(node)
+            elif before is None:
+                for node in reversed(chain):  # Front-most node is registered last
+                    self._index.push_front(node)
+            else:
+                self._index.rebuild(self._nodes())
+        self.size += count
+
+    # Move other[start:stop] (slice semantics, all of other by default) in
+    # front of position `at` of this list (the end by default). Nodes are
+    # relinked, never copied; other's size and ends are updated too.
+    def splice(self, other, at=None, start=None, stop=None):
+        if not isinstance(other, LinkedList):
+            raise TypeError("Can only splice another LinkedList")
+        if other is self:
+            raise ValueError("Cannot splice a list into itself")
+        if at is None:
+            at = self.size
+        if not 0 <= at <= self.size:
+            raise IndexError("splice position out of range")
+        first, last, count = other._detach(start, stop)
+        if count:
+            self._attach(first, last, count, at)
+
+    # Move every node of other to the end of this list in O(1).
+    def concat(self, other):
+        self.splice(other)
+
+    # Split off the nodes from position i on into a new list of the same
+    # kind and return it; this list keeps the first i nodes.
+    def split_at(self, i):
+        if not 0 <= i <= self.size:
+            raise IndexError("split position out of range")
+        new_list = type(self)(indexed=self._index is not None)
+        new_list.splice(self, 0, i)
+        return new_list
+
+    # Run find_all/count/map/reduce over a snapshot of the list in a process
+    # pool, one contiguous segment per task (see Parallel_Ops).
+    def parallel(self, workers=None):
+        from .Parallel_Ops import ParallelList  # Imported lazily, only needed for this mode
+        return ParallelList(self, workers)
+
+    # Search for a node with the given data and return True if found.
+    def search(self, data):
+        if self._index is not None:
+            return data in self._index
+        for node in self._nodes():  # Traverse the list
+            if node.data == data:
+                return True  # Found
+        return False  # Not found
+
+    # Iterate over the data from head to tail.
+    def __iter__(self):
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
+
+    # Iterate from tail to head. The list is singly linked, so the data is
+    # collected first (O(n) extra references).
+    def __reversed__(self):
+        return reversed(list(self))
+
+    # Iterate over the data from the given node to the tail.
+    def iter_from(self, node):
+        while node:
+            yield node.data
+            node = node.next
+
+    # Iterate over positions start <= i < stop (slice semantics, negative
+    # indices allowed) without copying; stops walking after `stop`.
+    def iter_range(self, start, stop):
+        start, stop, _ = slice(start, stop).indices(self.size)
+        current = self._advance(self.head, start)  # Walk to the first position
+        for _ in range(stop - start):
+            yield current.data
+            current = current.next
+
+    # Render the list to a text or binary stream, e.g. "10 -> 15 -> None".
+    # Elements are batched chunk_size at a time into one write() call.
+    def write_to(self, stream, sep=" -> ", end="None\n", chunk_size=4096):
+        write_chunked(stream, self, sep, end, chunk_size)
+
+    # Save the list to a binary snapshot file (see List_IO for the format).
+    def dump(self, path):
+        dump_records(path, self, self.size)
+
+    # Load a list saved by dump(). The file is memory-mapped and nodes are
+    # linked as records are decoded, without an intermediate Python list.
+    @classmethod
+    def load(cls, path, indexed=False):
+        return cls.from_iterable(load_records(path), indexed=indexed)
+
+    # Print all elements in the list.
+    def print_list(self):
+        self.write_to(sys.stdout)
+
+    # Get the length (number of nodes) in the list.
+    def length(self):
+        return self.size  # Maintained incrementally by every mutator
+
+    # Support the built-in len() in O(1).
+    def __len__(self):
+        return self.size
+
+    # Reverse the linked list.
+    def reverse(self):
+        self._unshare()
+        prev = None
+        current = self.head
+        self.tail = current  # Old head becomes the last node
+        while current:  # Traverse and reverse pointers
+            next_node = current.next
+            current.next = prev
+            prev = current
+            current = next_node
+        self.head = prev  # Update head to the new first node
+        if self._index is not None:
+            self._reindex()
+
+    # Sort the list in place (stable, O(n log n)) by relinking its nodes.
+    def sort(self, key=None, reverse=False):
+        if self.head is None:
+            return
+        self._unshare()
+        nodes = sorted_nodes(self._nodes(), key, reverse)
+        relink(nodes)
+        nodes[-1].next = None
+        self.head, self.tail = nodes[0], nodes[-1]
+        if self._index is not None:
+            self._reindex()
+
+# Example usage (python -m linked_lists.Linked_List):
+if __name__ == "__main__":
+    # Create a linked list
+    ll = LinkedList()
+
+    # Insert operations
+    ll.insert_at_beginning(10)
+    ll.insert_at_end(20)
+    ll.insert_at_position(15, 1)  # Insert 15 between 10 and 20
+
+    # Print the list: 10 -> 15 -> 20 -> None
+    ll.print_list()
+
+    # Search for 15: True
+    print(ll.search(15))
+
+    # Delete operations
+    ll.delete_at_beginning()  # Removes 10
+    ll.delete_at_end()  # Removes 20
+    ll.delete_by_value(15)  # Removes 15
+
+    # Print the list after deletions: None
+    ll.print_list()
+
+    # Length: 0
+    print(ll.length())
+
+    # Insert again and reverse
+    ll.insert_at_end(30)
+    ll.insert_at_end(40)
+    ll.insert_at_end(50)
+    ll.print_list()  # 30 -> 40 -> 50 -> None
+    ll.reverse()
+    ll.print_list()  # 50 -> 40 -> 30 -> None
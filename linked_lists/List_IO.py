@@ -0,0 +1,133 @@
+# Stream and snapshot helpers shared by the list classes.
+import io
+import mmap
+import struct
+import sys
+from array import array
+from itertools import islice
+
+
+# True if the stream expects bytes rather than str.
+def is_binary_stream(stream):
+    if isinstance(stream, io.TextIOBase):
+        return False
+    if isinstance(stream, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    return "b" in getattr(stream, "mode", "")
+
+
+# Write str(item) + sep for every item, then `end`, batching chunk_size items
+# per write() call. Binary streams receive the text encoded with `encoding`.
+def write_chunked(stream, items, sep, end, chunk_size=4096, encoding="utf-8"):
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if is_binary_stream(stream):
+        def write(text):
+            stream.write(text.encode(encoding))
+    else:
+        write = stream.write
+    iterator = iter(items)
+    while True:
+        parts = list(map(str, islice(iterator, chunk_size)))
+        if not parts:
+            break
+        parts.append("")  # So the joined chunk ends with a separator too
+        write(sep.join(parts))
+    write(end)
+
+
+# Binary snapshot format written by dump() and read by load():
+#   header  "<4sBcxxQ": magic b"DSAL", format version, record kind, element count
+#   body    kind b"q": count little-endian int64 values (fixed width)
+#           kind b"d": count little-endian float64 values (fixed width)
+#           kind b"p": count records, each a uint32 length then a pickle
+# Pickled records can run arbitrary code when loaded: only load trusted files.
+SNAPSHOT_HEADER = struct.Struct("<4sBcxxQ")
+SNAPSHOT_MAGIC = b"DSAL"
+SNAPSHOT_VERSION = 1
+RECORD_LENGTH = struct.Struct("<I")
+INT64_MIN = -(2 ** 63)
+INT64_MAX = 2 ** 63 - 1
+
+
+# Pick the most compact record kind that can hold every item.
+def snapshot_kind(items):
+    if all(type(item) is int and INT64_MIN <= item <= INT64_MAX for item in items):
+        return b"q"
+    if all(type(item) is float for item in items):
+        return b"d"
+    return b"p"
+
+
+# Write `count` items to a snapshot file at `path`.
+def dump_records(path, items, count, chunk_size=65536):
+    kind = snapshot_kind(items)
+    with open(path, "wb") as stream:
+        stream.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, kind, count))
+        iterator = iter(items)
+        if kind == b"p":
+            import pickle  # Imported lazily, only needed for object snapshots
+            for item in iterator:
+                record = pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)
+                stream.write(RECORD_LENGTH.pack(len(record)))
+                stream.write(record)
+            return
+        while True:  # Fixed-width records go out a chunk at a time
+            chunk = array(kind.decode(), islice(iterator, chunk_size))
+            if not chunk:
+                break
+            if sys.byteorder == "big":
+                chunk.byteswap()
+            stream.write(chunk.tobytes())
+
+
+# Parse and validate a snapshot header, returning (kind, count).
+def _read_header(buffer):
+    if len(buffer) < SNAPSHOT_HEADER.size:
+        raise ValueError("Not a list snapshot: file too short")
+    magic, version, kind, count = SNAPSHOT_HEADER.unpack_from(buffer, 0)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("Not a list snapshot: bad magic bytes")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version: {version}")
+    if kind not in (b"q", b"d", b"p"):
+        raise ValueError(f"Unknown snapshot record kind: {kind!r}")
+    return kind, count
+
+
+# Lazily yield the items of a snapshot. The file is memory-mapped and
+# decoded a chunk at a time, so nothing is materialised ahead of the consumer.
+def load_records(path, chunk_size=65536):
+    with open(path, "rb") as stream, mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        kind, count = _read_header(mapped)
+        offset = SNAPSHOT_HEADER.size
+        if kind == b"p":
+            import pickle  # Imported lazily, only needed for object snapshots
+            for _ in range(count):
+                (length,) = RECORD_LENGTH.unpack_from(mapped, offset)
+                offset += RECORD_LENGTH.size
+                yield pickle.loads(mapped[offset:offset + length])
+                offset += length
+            return
+        for start in range(0, count, chunk_size):
+            chunk = array(kind.decode())
+            end = offset + min(chunk_size, count - start) * chunk.itemsize
+            chunk.frombytes(mapped[offset:end])
+            if sys.byteorder == "big":
+                chunk.byteswap()
+            yield from chunk
+            offset = end
+
+
+# Read a fixed-width snapshot straight into an array('q') or array('d'),
+# or return None when the file holds pickled records.
+def load_array(path):
+    with open(path, "rb") as stream, mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        kind, count = _read_header(mapped)
+        if kind == b"p":
+            return None
+        values = array(kind.decode())
+        values.frombytes(mapped[SNAPSHOT_HEADER.size:SNAPSHOT_HEADER.size + count * values.itemsize])
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
@@ -0,0 +1,333 @@
+# NumPy-backed linked list for int and float payloads.
+# Like ArrayLinkedList, links are slot indices (NIL = -1) in an int64 buffer,
+# but the values live in a typed NumPy buffer as well. Whole-list work
+# (search, find_all, sum/min/max, conversion) then runs as one vectorized
+# call over the value buffer instead of a Python step per node.
+# After compact() slot i holds position i, which also makes positions
+# computable without a walk; appends and deletes at the end keep that
+# layout, any other relink marks it stale until the next compact().
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # Optional dependency, only needed for this class
+    np = None
+
+from .List_IO import write_chunked
+
+NIL = -1  # Index used as the "null pointer"
+
+
+# NumericLinkedList mirrors LinkedList for numeric values.
+class NumericLinkedList:
+    def __init__(self, dtype="float64", capacity=16):
+        if np is None:
+            raise ImportError("NumericLinkedList requires NumPy (pip install numpy)")
+        capacity = max(int(capacity), 1)
+        self.dtype = np.dtype(dtype)  # Element type, values are cast on insert
+        self.values = np.zeros(capacity, self.dtype)  # Payload of every slot
+        self.next_index = np.full(capacity, NIL, np.int64)  # next_index[i] is the slot after slot i
+        self.occupied = np.zeros(capacity, np.bool_)  # True for slots holding an element
+        self.free = []  # Stack of recycled slots below `used`
+        self.used = 0  # Slots handed out so far; slots from here on were never used
+        self.head = NIL  # Slot of the first element
+        self.tail = NIL  # Slot of the last element
+        self.size = 0  # Number of elements
+        self.ordered = True  # Slot i holds position i for every element (see compact())
+
+    # Build a new list from any iterable of numbers.
+    @classmethod
+    def from_iterable(cls, iterable, dtype="float64"):
+        new_list = cls(dtype)
+        new_list.extend(iterable)
+        return new_list
+
+    # Build a new list from a 1-d array in one copy, keeping its dtype.
+    @classmethod
+    def from_numpy(cls, values):
+        values = np.asarray(values)
+        if values.ndim != 1:
+            raise ValueError("from_numpy() expects a 1-d array")
+        new_list = cls(values.dtype, len(values))
+        new_list.extend(values)
+        return new_list
+
+    # Copy of the elements in list order as a NumPy array (compacts first).
+    def to_numpy(self):
+        self.compact()
+        return self.values[:self.size].copy()
+
+    # Make sure the buffers hold at least `needed` slots, doubling as they grow.
+    def _grow(self, needed):
+        capacity = len(self.values)
+        if needed <= capacity:
+            return
+        capacity = max(needed, 2 * capacity)
+        values = np.zeros(capacity, self.dtype)
+        values[:self.used] = self.values[:self.used]
+        next_index = np.full(capacity, NIL, np.int64)
+        next_index[:self.used] = self.next_index[:self.used]
+        occupied = np.zeros(capacity, np.bool_)
+        occupied[:self.used] = self.occupied[:self.used]
+        self.values, self.next_index, self.occupied = values, next_index, occupied
+
+    # Take a slot from the free list, or the next never-used slot.
+    def _allocate(self, data):
+        if self.free:
+            slot = self.free.pop()
+        else:
+            self._grow(self.used + 1)
+            slot = self.used
+            self.used += 1
+        self.values[slot] = data
+        self.next_index[slot] = NIL
+        self.occupied[slot] = True
+        return slot
+
+    # Return a slot; the topmost slot simply lowers the high-water mark.
+    def _release(self, slot):
+        self.occupied[slot] = False
+        if slot == self.used - 1:
+            self.used -= 1
+        else:
+            self.free.append(slot)
+
+    # Values of all elements, in list order when the storage is ordered.
+    def _live(self):
+        if self.ordered:
+            return self.values[:self.size]
+        return self.values[:self.used][self.occupied[:self.used]]
+
+    # Slots in list order, following the links once.
+    def _slot_order(self):
+        next_index = self.next_index.tolist()  # Plain ints walk much faster than NumPy scalars
+        order = []
+        slot = self.head
+        while slot != NIL:
+            order.append(slot)
+            slot = next_index[slot]
+        return order
+
+    # Reorder the storage into traversal order: slot i then holds position i,
+    # the free list is dropped and positional lookups need no walk.
+    def compact(self):
+        if self.ordered:
+            return
+        order = self._slot_order()
+        capacity = len(self.values)
+        values = np.zeros(capacity, self.dtype)
+        values[:self.size] = self.values[order]
+        next_index = np.full(capacity, NIL, np.int64)
+        next_index[:self.size - 1] = np.arange(1, self.size, dtype=np.int64)
+        occupied = np.zeros(capacity, np.bool_)
+        occupied[:self.size] = True
+        self.values, self.next_index, self.occupied = values, next_index, occupied
+        self.free = []
+        self.used = self.size
+        self.head = 0 if self.size else NIL
+        self.tail = self.size - 1 if self.size else NIL
+        self.ordered = True
+
+    # Slot of the element at a 0-based position (position must be in range).
+    def _slot_at(self, position):
+        if self.ordered:
+            return position
+        slot = self.head
+        for _ in range(position):
+            slot = int(self.next_index[slot])
+        return slot
+
+    # Unlink a slot given the slot before it (NIL when it is the head).
+    def _unlink(self, previous, slot):
+        following = int(self.next_index[slot])
+        if previous == NIL:
+            self.head = following
+        else:
+            self.next_index[previous] = following
+        if slot == self.tail:  # Removing the last element keeps the layout
+            self.tail = previous
+        else:
+            self.ordered = False
+        self._release(slot)
+        self.size -= 1
+        if self.size == 0:  # Start over with fresh, ordered storage
+            self.free = []
+            self.used = 0
+            self.occupied[:] = False
+            self.head = self.tail = NIL
+            self.ordered = True
+
+    # Insert a new element at the beginning of the list.
+    def insert_at_beginning(self, data):
+        slot = self._allocate(data)
+        self.next_index[slot] = self.head
+        if self.head != NIL:
+            self.ordered = False
+        else:  # First element is also the last element
+            self.tail = slot
+        self.head = slot
+        self.size += 1
+
+    # Insert a new element at the end of the list.
+    def insert_at_end(self, data):
+        slot = self._allocate(data)
+        if self.tail == NIL:  # Empty list
+            self.head = slot
+        else:
+            self.next_index[self.tail] = slot
+        self.ordered = self.ordered and slot == self.size
+        self.tail = slot
+        self.size += 1
+
+    # Append every item in one vectorized copy into fresh, consecutive slots.
+    def extend(self, iterable):
+        if isinstance(iterable, np.ndarray):
+            items = iterable.astype(self.dtype, copy=False)
+        else:
+            items = np.fromiter(iterable, self.dtype)
+        count = len(items)
+        if count == 0:
+            return
+        first = self.used
+        self._grow(first + count)
+        self.values[first:first + count] = items
+        self.next_index[first:first + count - 1] = np.arange(first + 1, first + count, dtype=np.int64)
+        self.next_index[first + count - 1] = NIL
+        self.occupied[first:first + count] = True
+        if self.tail == NIL:
+            self.head = first
+        else:
+            self.next_index[self.tail] = first
+        self.ordered = self.ordered and first == self.size
+        self.tail = first + count - 1
+        self.used += count
+        self.size += count
+
+    # Prepend every item of the iterable (ends up reversed at the front).
+    def extendleft(self, iterable):
+        for data in iterable:
+            self.insert_at_beginning(data)
+
+    # Insert a new element at a specific position (0-based index).
+    def insert_at_position(self, data, position):
+        if position < 0:  # Invalid position
+            print("Position cannot be negative.")
+            return
+        if position > self.size:  # If position is beyond the list length
+            print("Position out of range.")
+            return
+        if position == 0:
+            self.insert_at_beginning(data)
+            return
+        if position == self.size:
+            self.insert_at_end(data)
+            return
+        before = self._slot_at(position - 1)  # Direct slot lookup when ordered
+        slot = self._allocate(data)
+        self.next_index[slot] = self.next_index[before]
+        self.next_index[before] = slot
+        self.ordered = False
+        self.size += 1
+
+    # Delete the element at the beginning of the list.
+    def delete_at_beginning(self):
+        if self.head == NIL:  # If list is empty, nothing to delete
+            print("List is empty.")
+            return
+        self._unlink(NIL, self.head)
+
+    # Delete the element at the end of the list.
+    def delete_at_end(self):
+        if self.head == NIL:  # If list is empty
+            print("List is empty.")
+            return
+        before = self._slot_at(self.size - 2) if self.size > 1 else NIL
+        self._unlink(before, self.tail)
+
+    # Delete the first element with the given data value. When ordered the
+    # match is found with one vectorized comparison and unlinked in O(1).
+    def delete_by_value(self, data):
+        if self.head == NIL:  # If list is empty
+            print("List is empty.")
+            return
+        if self.ordered:
+            matches = np.flatnonzero(self.values[:self.size] == data)
+            if len(matches) == 0:
+                print("Value not found.")  # If value not in list
+                return
+            position = int(matches[0])
+            self._unlink(position - 1 if position else NIL, position)
+            return
+        values = self.values
+        next_index = self.next_index.tolist()
+        previous = NIL
+        slot = self.head
+        while slot != NIL:
+            if values[slot] == data:
+                self._unlink(previous, slot)
+                return
+            previous = slot
+            slot = next_index[slot]
+        print("Value not found.")  # If value not in list
+
+    # Search for the data with one vectorized comparison over all elements.
+    def search(self, data):
+        return bool(np.any(self._live() == data))
+
+    def __contains__(self, data):
+        return self.search(data)
+
+    # Positions of every element equal to data, as an int64 array
+    # (compacts first so positions are slot numbers).
+    def find_all(self, data):
+        self.compact()
+        return np.flatnonzero(self.values[:self.size] == data)
+
+    # Sum of the elements (0 for an empty list).
+    def sum(self):
+        return self._live().sum().item()
+
+    # Smallest element; raises ValueError on an empty list, like min().
+    def min(self):
+        if self.size == 0:
+            raise ValueError("min() of an empty NumericLinkedList")
+        return self._live().min().item()
+
+    # Largest element; raises ValueError on an empty list, like max().
+    def max(self):
+        if self.size == 0:
+            raise ValueError("max() of an empty NumericLinkedList")
+        return self._live().max().item()
+
+    # Iterate over the data from head to tail as Python numbers.
+    def __iter__(self):
+        if self.ordered:
+            return iter(self.values[:self.size].tolist())
+        values = self.values.tolist()
+        return iter([values[slot] for slot in self._slot_order()])
+
+    # Iterate from tail to head.
+    def __reversed__(self):
+        return reversed(list(self))
+
+    # Render the list to a text or binary stream, e.g. "10 -> 15 -> None".
+    # Elements are batched chunk_size at a time into one write() call.
+    def write_to(self, stream, sep=" -> ", end="None\n", chunk_size=4096):
+        write_chunked(stream, self, sep, end, chunk_size)
+
+    # Print all elements in the list.
+    def print_list(self):
+        self.write_to(sys.stdout)
+
+    # Get the length (number of elements) in the list.
+    def length(self):
+        return self.size
+
+    # Support the built-in len() in O(1).
+    def __len__(self):
+        return self.size
+
+    # Reverse the list: compact, then reverse the value buffer in one step.
+    def reverse(self):
+        self.compact()
+        self.values[:self.size] = self.values[:self.size][::-1].copy()
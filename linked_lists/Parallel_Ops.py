@@ -0,0 +1,117 @@
+# Parallel find_all/count/map/reduce over a list, using a process pool.
+# Each call snapshots the list in order and cuts the snapshot into
+# contiguous segments, a few per worker so uneven segments even out. Lists
+# of plain ints or floats (see List_IO.snapshot_kind) are copied once into
+# a shared memory block and every worker reads only its own slice; other
+# values are pickled to the workers segment by segment. Results come back
+# in list order.
+#
+#     with linked_list.parallel(workers=4) as par:
+#         hits = par.find_all(is_prime)
+#         total = par.reduce(operator.add)
+#
+# pred and fn run in the worker processes, so they must be picklable
+# (module-level functions, not lambdas). Used outside a `with` block each
+# call starts and stops its own pool.
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce as fold
+from multiprocessing.shared_memory import SharedMemory
+
+from .List_IO import snapshot_kind
+
+SEGMENTS_PER_WORKER = 4
+
+
+# Run one operation over positions start <= i < stop. `source` is the name
+# of the shared memory block for kinds "q"/"d", or the segment itself for "p".
+def _run_segment(op, fn, kind, source, start, stop):
+    if kind == "p":
+        values = source
+    else:
+        block = SharedMemory(name=source)
+        try:
+            itemsize = array(kind).itemsize
+            with block.buf[start * itemsize:stop * itemsize] as view:
+                values = view.cast(kind).tolist()
+        finally:
+            block.close()
+    if op == "find_all":
+        return [start + i for i, value in enumerate(values) if fn(value)]
+    if op == "count":
+        return sum(1 for value in values if fn(value))
+    if op == "map":
+        return [fn(value) for value in values]
+    return fold(fn, values)  # "reduce"
+
+
+class ParallelList:
+    # source is any iterable with a stable order, usually one of the list
+    # classes; workers defaults to the number of CPUs.
+    def __init__(self, source, workers=None):
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.source = source
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = None  # Pool kept open between `with` and its exit
+
+    # Keep one process pool for every call inside the block.
+    def __enter__(self):
+        self._executor = ProcessPoolExecutor(self.workers)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._executor.shutdown()
+        self._executor = None
+
+    # Positions (in list order) of the elements for which pred(element) is true.
+    def find_all(self, pred):
+        return [position for part in self._run("find_all", pred) for position in part]
+
+    # Number of elements for which pred(element) is true.
+    def count(self, pred):
+        return sum(self._run("count", pred))
+
+    # [fn(element) for element in the list], computed in parallel.
+    def map(self, fn):
+        return [value for part in self._run("map", fn) for value in part]
+
+    # Fold the list with fn like functools.reduce. Each segment is folded on
+    # its own and the partial results are folded in order, so fn must be
+    # associative (e.g. operator.add, max). Raises TypeError for an empty
+    # list without an initial value, as functools.reduce does.
+    def reduce(self, fn, *initial):
+        return fold(fn, self._run("reduce", fn), *initial)
+
+    # Snapshot the source, hand its segments to the pool and return the
+    # per-segment results in order.
+    def _run(self, op, fn):
+        values = list(self.source)
+        size = len(values)
+        if size == 0:
+            return []
+        segments = min(size, self.workers * SEGMENTS_PER_WORKER)
+        bounds = [size * k // segments for k in range(segments + 1)]
+        starts = bounds[:-1]
+        stops = bounds[1:]
+        kind = snapshot_kind(values).decode()
+        block = None
+        if kind == "p":
+            sources = [values[start:stop] for start, stop in zip(starts, stops)]
+        else:
+            packed = array(kind, values)
+            block = SharedMemory(create=True, size=len(packed) * packed.itemsize)
+            block.buf[:len(packed) * packed.itemsize] = memoryview(packed).cast("B")
+            sources = [block.name] * segments
+            del values, packed  # Workers read the shared copy
+        executor = self._executor or ProcessPoolExecutor(self.workers)
+        try:
+            return list(executor.map(_run_segment, [op] * segments, [fn] * segments,
+                                     [kind] * segments, sources, starts, stops))
+        finally:
+            if executor is not self._executor:
+                executor.shutdown()
+            if block is not None:
+                block.close()
+                block.unlink()
@@ -0,0 +1,117 @@
+# Persistent (immutable) cons list. Every "modification" returns a new list
+# and leaves the old one untouched: prepend(), tail() and pop() run in O(1)
+# and share all existing nodes with earlier versions instead of copying them.
+# A list is a (first node, length) pair over LinkedList nodes and only ever
+# reads `length` nodes, which is what lets LinkedList.snapshot() hand out
+# views of its own chain in O(1) (see LinkedList._unshare).
+import sys
+
+from .Linked_List import SinglyNode
+from .List_IO import write_chunked
+
+
+class PersistentList:
+    __slots__ = ("_head", "_size")
+
+    def __init__(self):
+        object.__setattr__(self, "_head", None)  # First node, None for the empty list
+        object.__setattr__(self, "_size", 0)  # Number of nodes that belong to this version
+
+    # Wrap an existing chain; only the first `size` nodes are ever read.
+    @classmethod
+    def _from_chain(cls, head, size):
+        new_list = cls.__new__(cls)
+        object.__setattr__(new_list, "_head", head)
+        object.__setattr__(new_list, "_size", size)
+        return new_list
+
+    def __setattr__(self, name, value):
+        raise AttributeError("PersistentList is immutable")
+
+    # Build a list from any iterable, keeping its order.
+    @classmethod
+    def from_iterable(cls, iterable):
+        head = None
+        count = 0
+        for data in reversed(list(iterable)):  # Cons from the back
+            new_node = SinglyNode(data)
+            new_node.next = head
+            head = new_node
+            count += 1
+        return cls._from_chain(head, count)
+
+    # New list with data in front of this one, O(1).
+    def prepend(self, data):
+        new_node = SinglyNode(data)
+        new_node.next = self._head
+        return PersistentList._from_chain(new_node, self._size + 1)
+
+    # First element, O(1).
+    def first(self):
+        if not self._size:
+            raise IndexError("first() on an empty PersistentList")
+        return self._head.data
+
+    # The list without its first element, O(1).
+    def tail(self):
+        if not self._size:
+            raise IndexError("tail() on an empty PersistentList")
+        return PersistentList._from_chain(self._head.next, self._size - 1)
+
+    # Return (first element, rest of the list), O(1).
+    def pop(self):
+        if not self._size:
+            raise IndexError("pop from an empty PersistentList")
+        return self._head.data, PersistentList._from_chain(self._head.next, self._size - 1)
+
+    # New list in reverse order, O(n).
+    def reverse(self):
+        head = None
+        for data in self:
+            new_node = SinglyNode(data)
+            new_node.next = head
+            head = new_node
+        return PersistentList._from_chain(head, self._size)
+
+    # Search for the data and return True if found.
+    def search(self, data):
+        for item in self:
+            if item == data:
+                return True
+        return False
+
+    def __contains__(self, data):
+        return self.search(data)
+
+    # Iterate over the data from first to last.
+    def __iter__(self):
+        current = self._head
+        for _ in range(self._size):
+            yield current.data
+            current = current.next
+
+    # Equal to another PersistentList with the same elements in the same order.
+    def __eq__(self, other):
+        if not isinstance(other, PersistentList):
+            return NotImplemented
+        if self._head is other._head:  # Shared chain, only the lengths can differ
+            return self._size == other._size
+        return self._size == other._size and all(a == b for a, b in zip(self, other))
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    # Get the length (number of elements) of the list.
+    def length(self):
+        return self._size
+
+    def __len__(self):
+        return self._size
+
+    # Write the elements to a text or binary stream in the LinkedList format.
+    def write_to(self, stream, sep=" -> ", end="None\n", chunk_size=4096):
+        write_chunked(stream, self, sep, end, chunk_size)
+
+    # Print all elements in the list.
+    def print_list(self):
+        self.write_to(sys.stdout)
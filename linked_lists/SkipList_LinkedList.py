@@ -0,0 +1,295 @@
+# Indexable skip list with DoublyLinkedList semantics.
+# Level 0 is an ordinary doubly linked list (next/prev). Each node also sits on
+# a random number of express levels above it; every express link stores its
+# span, the number of level-0 steps it skips. Summing spans on the way down
+# locates any position in O(log n) expected time, which makes positional
+# insert, delete, get and set O(log n) instead of a walk from the head.
+import sys
+from random import random
+
+from .List_IO import dump_records, load_records, write_chunked
+
+MAX_LEVEL = 32  # Enough express levels for 2**32 elements
+
+
+# Node of the skip list. up[k] and span[k] hold the express link of level k + 1.
+class SkipNode:
+    __slots__ = ("data", "next", "prev", "up", "span")
+
+    def __init__(self, data, height=1):
+        self.data = data  # Store the data value in the node
+        self.next = None  # Level-0 pointer to the next node
+        self.prev = None  # Level-0 pointer to the previous node
+        self.up = [None] * (height - 1) if height > 1 else ()  # Express links above level 0
+        self.span = [0] * (height - 1) if height > 1 else ()  # Level-0 steps covered by each express link
+
+
+# Draw a node height: 1 with probability 1/2, 2 with 1/4, and so on.
+def _random_height():
+    height = 1
+    while height < MAX_LEVEL and random() < 0.5:
+        height += 1
+    return height
+
+
+# IndexableSkipList offers the DoublyLinkedList methods plus get/set by position.
+class IndexableSkipList:
+    def __init__(self):
+        self._header = SkipNode(None, MAX_LEVEL)  # Sentinel before the first node, at position -1
+        self.levels = 1  # Number of levels currently in use (level 0 plus express levels)
+        self.tail = None  # Reference to the last node
+        self.size = 0  # Number of nodes
+
+    # The first node hangs off the sentinel's level-0 link.
+    @property
+    def head(self):
+        return self._header.next
+
+    # Build a new list from any iterable (generators are consumed lazily).
+    @classmethod
+    def from_iterable(cls, iterable):
+        new_list = cls()
+        new_list.extend(iterable)
+        return new_list
+
+    # Yield every node from head to tail.
+    def _nodes(self):
+        current = self._header.next
+        while current:
+            yield current
+            current = current.next
+
+    # For each level, find the last node strictly before `position` and its
+    # position. Returns a list of [node, node_position] indexed by level.
+    def _find(self, position):
+        update = [None] * self.levels
+        node = self._header
+        node_position = -1
+        for level in range(self.levels - 1, 0, -1):  # Descend the express levels
+            while node.up[level - 1] is not None and node_position + node.span[level - 1] < position:
+                node_position += node.span[level - 1]
+                node = node.up[level - 1]
+            update[level] = [node, node_position]
+        while node_position + 1 < position:  # Finish along level 0
+            node = node.next
+            node_position += 1
+        update[0] = [node, node_position]
+        return update
+
+    # Node at a position (0 <= position < size).
+    def _node_at(self, position):
+        node = self._find(position)[0][0]
+        return node.next
+
+    # Link a new node in at `position`, given the predecessors from _find.
+    def _link(self, data, position, update):
+        height = _random_height()
+        if height > self.levels:  # Open new express levels starting at the sentinel
+            update.extend([self._header, -1] for _ in range(height - self.levels))
+            self.levels = height
+        new_node = SkipNode(data, height)
+        before = update[0][0]
+        new_node.next = before.next  # Level 0: ordinary doubly linked insert
+        new_node.prev = before if before is not self._header else None
+        if before.next:
+            before.next.prev = new_node
+        else:
+            self.tail = new_node
+        before.next = new_node
+        for level in range(1, self.levels):
+            node, node_position = update[level]
+            if level < height:  # Split the express link around the new node
+                new_node.up[level - 1] = node.up[level - 1]
+                if node.up[level - 1] is not None:
+                    new_node.span[level - 1] = node_position + node.span[level - 1] + 1 - position
+                node.up[level - 1] = new_node
+                node.span[level - 1] = position - node_position
+                update[level] = [new_node, position]
+            elif node.up[level - 1] is not None:  # The link now skips one more node
+                node.span[level - 1] += 1
+        update[0] = [new_node, position]
+        self.size += 1
+
+    # Unlink the node at `position`.
+    def _delete(self, position):
+        update = self._find(position)
+        before = update[0][0]
+        node = before.next
+        before.next = node.next  # Level 0: ordinary doubly linked unlink
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        for level in range(1, self.levels):
+            previous = update[level][0]
+            if previous.up[level - 1] is node:  # Bridge over the removed node
+                previous.up[level - 1] = node.up[level - 1]
+                if node.up[level - 1] is not None:
+                    previous.span[level - 1] += node.span[level - 1] - 1
+            elif previous.up[level - 1] is not None:  # The link now skips one node fewer
+                previous.span[level - 1] -= 1
+        while self.levels > 1 and self._header.up[self.levels - 2] is None:  # Drop empty top levels
+            self.levels -= 1
+        self.size -= 1
+        return node.data
+
+    # Insert a new node at the beginning of the list.
+    def insert_at_beginning(self, data):
+        self._link(data, 0, self._find(0))
+
+    # Insert a new node at the end of the list.
+    def insert_at_end(self, data):
+        self._link(data, self.size, self._find(self.size))
+
+    # Append every item of the iterable. The predecessors found for the first
+    # item are carried forward, so each further item costs O(1) expected.
+    def extend(self, iterable):
+        update = self._find(self.size)
+        for data in iterable:
+            self._link(data, self.size, update)
+
+    # Prepend every item of the iterable (ends up reversed at the front).
+    def extendleft(self, iterable):
+        for data in iterable:
+            self.insert_at_beginning(data)
+
+    # Insert a new node at a specific position (0-based index).
+    def insert_at_position(self, data, position):
+        if position < 0:  # Invalid position
+            print("Position cannot be negative.")
+            return
+        if position > self.size:  # If position is beyond list length
+            print("Position out of range.")
+            return
+        self._link(data, position, self._find(position))
+
+    # Delete the node at the beginning of the list.
+    def delete_at_beginning(self):
+        if self.size == 0:  # If list is empty
+            print("List is empty.")
+            return
+        self._delete(0)
+
+    # Delete the node at the end of the list.
+    def delete_at_end(self):
+        if self.size == 0:  # If list is empty
+            print("List is empty.")
+            return
+        self._delete(self.size - 1)
+
+    # Delete the node at a specific position (0-based index) and return its data.
+    def delete_at_position(self, position):
+        if not 0 <= position < self.size:
+            print("Position out of range.")
+            return None
+        return self._delete(position)
+
+    # Delete the first node with the given data value.
+    def delete_by_value(self, data):
+        if self.size == 0:  # If list is empty
+            print("List is empty.")
+            return
+        for position, node in enumerate(self._nodes()):  # Traverse to find the node
+            if node.data == data:
+                self._delete(position)
+                return
+        print("Value not found.")  # If value not in list
+
+    # Search for a node with the given data and return True if found.
+    def search(self, data):
+        for node in self._nodes():
+            if node.data == data:
+                return True
+        return False
+
+    # Convert a possibly negative index into a position, raising IndexError.
+    def _position(self, index):
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("list index out of range")
+        return index
+
+    # Return the data at a position (negative indices count from the end).
+    def get(self, index):
+        return self._node_at(self._position(index)).data
+
+    # Replace the data at a position (negative indices count from the end).
+    def set(self, index, data):
+        self._node_at(self._position(index)).data = data
+
+    def __getitem__(self, index):
+        return self.get(index)
+
+    def __setitem__(self, index, data):
+        self.set(index, data)
+
+    # Iterate over the data from head to tail.
+    def __iter__(self):
+        current = self._header.next
+        while current:
+            yield current.data
+            current = current.next
+
+    # Iterate over the data from tail to head along the level-0 prev pointers.
+    def __reversed__(self):
+        current = self.tail
+        while current:
+            yield current.data
+            current = current.prev
+
+    # Iterate over positions start <= i < stop (slice semantics), locating
+    # the first position in O(log n).
+    def iter_range(self, start, stop):
+        start, stop, _ = slice(start, stop).indices(self.size)
+        if start >= stop:
+            return
+        current = self._node_at(start)
+        for _ in range(stop - start):
+            yield current.data
+            current = current.next
+
+    # Render the list to a text or binary stream, e.g. "10 <-> 15 <-> None".
+    # Elements are batched chunk_size at a time into one write() call;
+    # reverse=True renders from tail to head.
+    def write_to(self, stream, sep=" <-> ", end="None\n", chunk_size=4096, reverse=False):
+        write_chunked(stream, reversed(self) if reverse else self, sep, end, chunk_size)
+
+    # Save the list to a binary snapshot file (see List_IO for the format).
+    def dump(self, path):
+        dump_records(path, self, self.size)
+
+    # Load a list saved by dump(), one record at a time.
+    @classmethod
+    def load(cls, path):
+        return cls.from_iterable(load_records(path))
+
+    # Run find_all/count/map/reduce over a snapshot of the list in a process
+    # pool, one contiguous segment per task (see Parallel_Ops).
+    def parallel(self, workers=None):
+        from .Parallel_Ops import ParallelList  # Imported lazily, only needed for this mode
+        return ParallelList(self, workers)
+
+    # Print all elements in the list (forward).
+    def print_list_forward(self):
+        self.write_to(sys.stdout)
+
+    # Print all elements in the list (backward).
+    def print_list_backward(self):
+        self.write_to(sys.stdout, reverse=True)
+
+    # Get the length (number of nodes) in the list.
+    def length(self):
+        return self.size
+
+    # Support the built-in len() in O(1).
+    def __len__(self):
+        return self.size
+
+    # Reverse the list. Express links only point forward, so the structure
+    # is rebuilt from the reversed data in one linear pass.
+    def reverse(self):
+        data = [node.data for node in self._nodes()]
+        data.reverse()
+        self.__init__()
+        self.extend(data)
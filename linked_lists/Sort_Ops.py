@@ -0,0 +1,32 @@
+# Sorting helpers shared by the sort() methods of the list classes.
+# The nodes themselves are sorted, not copies of their data: references to
+# the existing nodes are ordered with list.sort() (Timsort, a stable
+# bottom-up natural merge sort running in C) and then relinked in one pass.
+# No node is created, and equal elements keep their order (also with
+# reverse=True), exactly as with list.sort().
+from itertools import islice
+from operator import attrgetter
+
+_node_data = attrgetter("data")
+
+
+# Return the given nodes as a list in sorted order of their data.
+def sorted_nodes(nodes, key=None, reverse=False):
+    nodes = list(nodes)
+    if key is None:
+        nodes.sort(key=_node_data, reverse=reverse)
+    else:
+        nodes.sort(key=lambda node: key(node.data), reverse=reverse)
+    return nodes
+
+
+# Link the nodes into a chain in list order. The ends are left for the
+# caller (None-terminate or close the ring); doubly=True also sets prev.
+def relink(nodes, doubly=False):
+    if doubly:
+        for previous, node in zip(nodes, islice(nodes, 1, None)):
+            previous.next = node
+            node.prev = previous
+    else:
+        for previous, node in zip(nodes, islice(nodes, 1, None)):
+            previous.next = node
@@ -0,0 +1,133 @@
+# Sorted mode: a linked list whose inserts keep it in order.
+# SortedLinkedList is an IndexableSkipList whose express levels are searched
+# by value instead of by position, so an ordered insert, search or delete
+# finds its place in O(log n) expected time instead of walking from the
+# head. Level 0 stays an ordinary doubly linked list, and positional reads
+# (get, iter_range, delete_at_position) keep working in O(log n).
+from .SkipList_LinkedList import IndexableSkipList
+
+
+class SortedLinkedList(IndexableSkipList):
+    # key and reverse have the same meaning as for sorted(). Equal elements
+    # keep their insertion order.
+    def __init__(self, key=None, reverse=False):
+        super().__init__()
+        self.key = key  # Sort key applied to each element, None compares elements directly
+        self.descending = reverse  # True keeps the largest element at the head
+
+    # Build a new sorted list from any iterable.
+    @classmethod
+    def from_iterable(cls, iterable, key=None, reverse=False):
+        new_list = cls(key, reverse)
+        new_list.extend(iterable)
+        return new_list
+
+    # True if key value a belongs strictly before key value b.
+    def _before(self, a, b):
+        return b < a if self.descending else a < b
+
+    # True if an element with key value k sits before the search point for
+    # target: before it, or also level with it when after=True.
+    def _goes_before(self, k, target, after):
+        return not self._before(target, k) if after else self._before(k, target)
+
+    # Like _find, but descending by key: finds the predecessors of the first
+    # element not before `target` (after=False), or of the first element
+    # after it (after=True, which places new equal elements last).
+    def _find_key(self, target, after):
+        key = self.key
+        update = [None] * self.levels
+        node = self._header
+        node_position = -1
+        for level in range(self.levels - 1, 0, -1):  # Descend the express levels
+            while True:
+                following = node.up[level - 1]
+                if following is None:
+                    break
+                following_key = following.data if key is None else key(following.data)
+                if not self._goes_before(following_key, target, after):
+                    break
+                node_position += node.span[level - 1]
+                node = following
+            update[level] = [node, node_position]
+        while node.next is not None:  # Finish along level 0
+            following_key = node.next.data if key is None else key(node.next.data)
+            if not self._goes_before(following_key, target, after):
+                break
+            node = node.next
+            node_position += 1
+        update[0] = [node, node_position]
+        return update
+
+    # Insert data at its sorted position in O(log n) expected time.
+    def insert(self, data):
+        target = data if self.key is None else self.key(data)
+        update = self._find_key(target, after=True)
+        self._link(data, update[0][1] + 1, update)
+
+    # Every insert keeps the order, wherever the caller asked for it.
+    def insert_at_beginning(self, data):
+        self.insert(data)
+
+    def insert_at_end(self, data):
+        self.insert(data)
+
+    def insert_at_position(self, data, position):
+        self.insert(data)
+
+    # Insert every item of the iterable at its sorted position.
+    def extend(self, iterable):
+        for data in iterable:
+            self.insert(data)
+
+    def extendleft(self, iterable):
+        self.extend(iterable)
+
+    # Position of the first element equal to data, or -1. Only the run of
+    # elements with an equal key is scanned.
+    def index(self, data):
+        target = data if self.key is None else self.key(data)
+        update = self._find_key(target, after=False)
+        position = update[0][1] + 1
+        current = update[0][0].next
+        while current is not None:
+            current_key = current.data if self.key is None else self.key(current.data)
+            if self._before(target, current_key):  # Past the run of equal keys
+                break
+            if current.data == data:
+                return position
+            current = current.next
+            position += 1
+        return -1
+
+    # Search for data in O(log n) expected time and return True if found.
+    def search(self, data):
+        return self.index(data) >= 0
+
+    def __contains__(self, data):
+        return self.search(data)
+
+    # Delete the first element with the given data value.
+    def delete_by_value(self, data):
+        if self.size == 0:  # If list is empty
+            print("List is empty.")
+            return
+        position = self.index(data)
+        if position < 0:
+            print("Value not found.")  # If value not in list
+            return
+        self._delete(position)
+
+    # Assigning by position could break the order.
+    def set(self, index, data):
+        raise TypeError("SortedLinkedList does not support assignment by position")
+
+    # Re-sort with a new key and/or direction.
+    def sort(self, key=None, reverse=False):
+        data = sorted(self, key=key, reverse=reverse)
+        self.__init__(key, reverse)
+        IndexableSkipList.extend(self, data)  # Already in order, appended in O(1) each
+
+    # Reverse the order: the list stays sorted in the opposite direction.
+    def reverse(self):
+        self.sort(self.key, not self.descending)
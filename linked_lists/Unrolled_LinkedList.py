@@ -0,0 +1,236 @@
+# Unrolled linked list: each node holds a small contiguous block of elements
+# instead of a single one. Pointer overhead and allocations drop by roughly the
+# block size, and scans run over Python lists instead of chasing one pointer
+# per element. Blocks are split when they overflow and merged with (or refilled
+# from) their successor when they fall below half capacity.
+import sys
+from itertools import islice
+
+from .List_IO import write_chunked
+
+BLOCK_CAPACITY = 64  # Default number of elements per block
+
+
+# Block class to hold up to `capacity` consecutive elements of the list.
+class Block:
+    __slots__ = ("items", "next", "prev")
+
+    def __init__(self, items=None):
+        self.items = items if items is not None else []  # Elements stored in this block
+        self.next = None  # Pointer to the next block
+        self.prev = None  # Pointer to the previous block
+
+
+# UnrolledLinkedList offers the same operations as LinkedList.
+class UnrolledLinkedList:
+    def __init__(self, capacity=BLOCK_CAPACITY):
+        if capacity < 2:
+            raise ValueError("Block capacity must be at least 2")
+        self.capacity = capacity  # Maximum number of elements per block
+        self.head = None  # First block
+        self.tail = None  # Last block
+        self.size = 0  # Number of elements
+
+    # Build a new list from any iterable (generators are consumed lazily).
+    @classmethod
+    def from_iterable(cls, iterable, capacity=BLOCK_CAPACITY):
+        new_list = cls(capacity)
+        new_list.extend(iterable)
+        return new_list
+
+    # Yield every block from head to tail.
+    def _blocks(self):
+        block = self.head
+        while block:
+            yield block
+            block = block.next
+
+    # Link a new block after `before` (None links it in as the head).
+    def _link_block(self, new_block, before):
+        new_block.prev = before
+        new_block.next = before.next if before else self.head
+        if new_block.next:
+            new_block.next.prev = new_block
+        else:
+            self.tail = new_block
+        if before:
+            before.next = new_block
+        else:
+            self.head = new_block
+        return new_block
+
+    # Unlink an empty block.
+    def _unlink_block(self, block):
+        if block.prev:
+            block.prev.next = block.next
+        else:
+            self.head = block.next
+        if block.next:
+            block.next.prev = block.prev
+        else:
+            self.tail = block.prev
+
+    # Split a full block in two halves, returning the new second half.
+    def _split(self, block):
+        half = len(block.items) // 2
+        new_block = Block(block.items[half:])
+        del block.items[half:]
+        return self._link_block(new_block, block)
+
+    # After a delete, merge an under-filled block with its successor or
+    # refill it from the successor so blocks stay at least half full.
+    def _rebalance(self, block):
+        if not block.items:
+            self._unlink_block(block)
+            return
+        following = block.next
+        if following is None or len(block.items) >= self.capacity // 2:
+            return
+        if len(block.items) + len(following.items) <= self.capacity:  # Merge the successor into this block
+            block.items.extend(following.items)
+            self._unlink_block(following)
+        else:  # Borrow enough items to even the two blocks out
+            moved = (len(following.items) - len(block.items)) // 2
+            block.items.extend(following.items[:moved])
+            del following.items[:moved]
+
+    # Find the block holding a position; returns the block and the offset in it.
+    # Positions equal to the size resolve to the end of the last block.
+    def _locate(self, position):
+        block = self.head
+        while position > len(block.items) or (position == len(block.items) and block.next):
+            position -= len(block.items)
+            block = block.next
+        return block, position
+
+    # Insert a new element at the beginning of the list.
+    def insert_at_beginning(self, data):
+        if self.head is None or len(self.head.items) >= self.capacity:  # Start a new front block
+            self._link_block(Block(), None)
+        self.head.items.insert(0, data)
+        self.size += 1
+
+    # Insert a new element at the end of the list.
+    def insert_at_end(self, data):
+        if self.tail is None or len(self.tail.items) >= self.capacity:  # Start a new back block
+            self._link_block(Block(), self.tail)
+        self.tail.items.append(data)
+        self.size += 1
+
+    # Append every item of the iterable, filling whole blocks at a time.
+    def extend(self, iterable):
+        iterator = iter(iterable)
+        if self.tail is not None and len(self.tail.items) < self.capacity:  # Top up the last block first
+            room = self.capacity - len(self.tail.items)
+            before = len(self.tail.items)
+            self.tail.items.extend(islice(iterator, room))
+            self.size += len(self.tail.items) - before
+        while True:
+            items = list(islice(iterator, self.capacity))
+            if not items:
+                return
+            self._link_block(Block(items), self.tail)
+            self.size += len(items)
+
+    # Prepend every item of the iterable (ends up reversed at the front).
+    def extendleft(self, iterable):
+        for data in iterable:
+            self.insert_at_beginning(data)
+
+    # Insert a new element at a specific position (0-based index).
+    def insert_at_position(self, data, position):
+        if position < 0:  # Invalid position
+            print("Position cannot be negative.")
+            return
+        if position > self.size:  # If position is beyond the list length
+            print("Position out of range.")
+            return
+        if self.head is None:
+            self.insert_at_end(data)
+            return
+        block, offset = self._locate(position)
+        if len(block.items) >= self.capacity:  # Make room by splitting the block
+            second = self._split(block)
+            if offset > len(block.items):
+                block, offset = second, offset - len(block.items)
+        block.items.insert(offset, data)
+        self.size += 1
+
+    # Delete the element at the beginning of the list.
+    def delete_at_beginning(self):
+        if self.head is None:  # If list is empty, nothing to delete
+            print("List is empty.")
+            return
+        del self.head.items[0]
+        self.size -= 1
+        self._rebalance(self.head)
+
+    # Delete the element at the end of the list.
+    def delete_at_end(self):
+        if self.tail is None:  # If list is empty
+            print("List is empty.")
+            return
+        self.tail.items.pop()
+        self.size -= 1
+        if not self.tail.items:
+            self._unlink_block(self.tail)
+
+    # Delete the first element with the given data value.
+    def delete_by_value(self, data):
+        if self.head is None:  # If list is empty
+            print("List is empty.")
+            return
+        for block in self._blocks():
+            try:
+                block.items.remove(data)  # list.remove scans the block at C speed
+            except ValueError:
+                continue
+            self.size -= 1
+            self._rebalance(block)
+            return
+        print("Value not found.")  # If value not in list
+
+    # Search for an element with the given data and return True if found.
+    def search(self, data):
+        for block in self._blocks():
+            if data in block.items:
+                return True
+        return False
+
+    # Iterate over the data from head to tail, block by block.
+    def __iter__(self):
+        for block in self._blocks():
+            yield from block.items
+
+    # Iterate over the data from tail to head.
+    def __reversed__(self):
+        block = self.tail
+        while block:
+            yield from reversed(block.items)
+            block = block.prev
+
+    # Render the list to a text or binary stream, e.g. "10 -> 15 -> None".
+    # Elements are batched chunk_size at a time into one write() call.
+    def write_to(self, stream, sep=" -> ", end="None\n", chunk_size=4096):
+        write_chunked(stream, self, sep, end, chunk_size)
+
+    # Print all elements in the list.
+    def print_list(self):
+        self.write_to(sys.stdout)
+
+    # Get the length (number of elements) in the list.
+    def length(self):
+        return self.size
+
+    # Support the built-in len() in O(1).
+    def __len__(self):
+        return self.size
+
+    # Reverse the list: reverse the block chain and each block's items.
+    def reverse(self):
+        block = self.head
+        while block:
+            block.items.reverse()
+            block.next, block.prev = block.prev, block.next
+            block = block.prev  # Old next
+        self.head, self.tail = self.tail, self.head
@@ -0,0 +1,52 @@
+# Linked list data structures.
+#
+#     from linked_lists import LinkedList, DoublyLinkedList
+#
+# Importing the package does no work: each class is looked up in this table
+# and its module imported on first access (PEP 562 module __getattr__), so
+# worker processes only pay for the structures they actually use.
+# The example usage at the bottom of each list module runs with e.g.
+#     python -m linked_lists.Linked_List
+from importlib import import_module
+
+_EXPORTS = {
+    "LinkedList": "Linked_List",
+    "DoublyLinkedList": "doublyLinked_List",
+    "CircularSinglyLinkedList": "CircularSinglyLinked_List",
+    "CircularDoublyLinkedList": "Circular_DoublyLinked_List",
+    "SinglyNode": "Linked_List",
+    "DoublyNode": "doublyLinked_List",
+    "CircularSinglyNode": "CircularSinglyLinked_List",
+    "CircularDoublyNode": "Circular_DoublyLinked_List",
+    "ArrayLinkedList": "Array_LinkedList",
+    "ArrayDoublyLinkedList": "Array_LinkedList",
+    "IndexableSkipList": "SkipList_LinkedList",
+    "SortedLinkedList": "Sorted_LinkedList",
+    "UnrolledLinkedList": "Unrolled_LinkedList",
+    "NumericLinkedList": "Numeric_LinkedList",
+    "PersistentList": "Persistent_List",
+    "ConcurrentLinkedQueue": "Concurrent_LinkedQueue",
+    "AsyncCircularQueue": "Async_CircularQueue",
+    "HashIndex": "Hash_Index",
+    "LRUCache": "Linked_Cache",
+    "LFUCache": "Linked_Cache",
+    "ParallelList": "Parallel_Ops",
+    "instrument": "Instrumented_List",
+    "uninstrument": "Instrumented_List",
+    "ListStats": "Instrumented_List",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,682 @@
+import sys
+
+from .Batch_Ops import claim_value_delete, plan_batch
+from .Handle_Ops import Owner, adopt, check_handle, flip_chain
+from .Hash_Index import HashIndex
+from .List_IO import dump_records, load_records, write_chunked
+from .Sort_Ops import relink, sorted_nodes
+
+# DoublyNode class for a doubly linked list.
+# Each node contains data, a reference to the next node, and a reference to the previous node.
+class DoublyNode:
+    __slots__ = ("data", "next", "prev", "owner")  # No per-instance __dict__, keeps each node compact
+
+    def __init__(self, data):
+        self.data = data  # Store the data value in the node
+        self.next = None  # Pointer to the next node, initially None
+        self.prev = None  # Pointer to the previous node, initially None
+        self.owner = None  # Owner tag of the list holding the node, None while unlinked
+
+Node = DoublyNode  # Former name, kept for code that imports Node directly
+
+# DoublyLinkedList class to manage doubly linked list operations.
+class DoublyLinkedList:
+    # Fixed attribute layout, no per-instance __dict__. _stats is only set while
+    # the list is instrumented (see Instrumented_List).
+    __slots__ = ("head", "tail", "size", "_index", "_reversed", "_owner", "_stats", "__weakref__")
+
+    # engine="node" builds the list from DoublyNode objects (the default);
+    # engine="array" returns an index-linked ArrayDoublyLinkedList. It has the
+    # basic inserts/deletes, search, reverse, iteration, iter_range, write_to,
+    # dump/load and parallel, but no handles (insert_after, insert_before,
+    # remove, move_to_front), iter_from, sort, splice/concat/split_at or
+    # apply_batch.
+    # engine="skiplist" returns an IndexableSkipList with O(log n) positional
+    # access (get/set/delete_at_position). It has the same basic methods as the
+    # array engine and lacks the same ones.
+    # indexed=True keeps a value -> node hash index (values must be hashable) so
+    # search() and delete_by_value() run in O(1) on average.
+    def __new__(cls, engine="node", indexed=False):
+        if engine in ("array", "skiplist") and indexed:
+            raise ValueError(f"The {engine} engine does not support indexed=True")
+        if engine == "array":
+            from .Array_LinkedList import ArrayDoublyLinkedList  # Imported lazily, only needed for this engine
+            return ArrayDoublyLinkedList()
+        if engine == "skiplist":
+            from .SkipList_LinkedList import IndexableSkipList  # Imported lazily, only needed for this engine
+            return IndexableSkipList()
+        if engine != "node":
+            raise ValueError(f"Unknown engine: {engine!r}")
+        return super().__new__(cls)
+
+    def __init__(self, engine="node", indexed=False):
+        self.head = None  # Initialize the head of the list as None (empty list)
+        self.tail = None  # Reference to the last node, kept so end operations skip the traversal
+        self.size = 0  # Number of nodes, updated by every insert and delete
+        self._index = HashIndex() if indexed else None  # value -> nodes, None when not indexed
+        self._reversed = False  # True when the logical order runs backwards over the nodes (see reverse())
+        self._owner = Owner(self)  # Tag carried by this list's nodes, validates handles (see Handle_Ops)
+
+    # Yield every node from head to tail, or from tail to head if backward.
+    def _nodes(self, backward=False):
+        if backward:
+            current = self.tail
+            while current:
+                yield current
+                current = current.prev
+        else:
+            current = self.head
+            while current:
+                yield current
+                current = current.next
+
+    # Insert a new node at the beginning of the list and return it (a handle).
+    def insert_at_beginning(self, data):
+        if self._reversed:  # The logical front is the physical tail
+            return self._push_back(data)
+        return self._push_front(data)
+
+    # Insert a new node at the end of the list and return it (a handle).
+    def insert_at_end(self, data):
+        if self._reversed:
+            return self._push_front(data)
+        return self._push_back(data)
+
+    # Link a new node in front of the physical head.
+    def _push_front(self, data):
+        new_node = DoublyNode(data)  # Create a new node with the given data
+        new_node.owner = self._owner
+        if self.head:
+            self.head.prev = new_node  # Set current head's prev to new node
+            new_node.next = self.head  # Set new node's next to current head
+        else:  # First node is also the last node
+            self.tail = new_node
+        self.head = new_node  # Update head to the new node
+        if self._index is not None:
+            self._index.push_front(new_node)
+        self.size += 1
+        return new_node
+
+    # Link a new node in as the physical tail.
+    def _push_back(self, data):
+        new_node = DoublyNode(data)  # Create a new node with the given data
+        new_node.owner = self._owner
+        if self.head is None:  # If the list is empty, set head to new node
+            self.head = new_node
+        else:
+            self.tail.next = new_node  # Set last node's next to new node
+            new_node.prev = self.tail  # Set new node's prev to last node
+        self.tail = new_node  # The new node is now the last node
+        if self._index is not None:
+            self._index.push_back(new_node)
+        self.size += 1
+        return new_node
+
+    # Build a new list from any iterable (generators are consumed lazily).
+    @classmethod
+    def from_iterable(cls, iterable, indexed=False):
+        new_list = cls(indexed=indexed)
+        new_list.extend(iterable)
+        return new_list
+
+    # Append every item of the iterable. On a reversed list the logical end is
+    # the physical front, where extending left keeps the same logical order.
+    def extend(self, iterable):
+        if self._reversed:
+            self._extend_front(iterable)
+        else:
+            self._extend_back(iterable)
+
+    # Prepend every item of the iterable one after another, so they end up in
+    # reverse order at the front (same semantics as collections.deque.extendleft).
+    def extendleft(self, iterable):
+        if self._reversed:
+            self._extend_back(iterable)
+        else:
+            self._extend_front(iterable)
+
+    # Append at the physical back, linking the new chain in a single pass.
+    def _extend_back(self, iterable):
+        first = None
+        last = None
+        count = 0
+        for data in iterable:  # Build the chain without touching the list yet
+            new_node = DoublyNode(data)
+            new_node.owner = self._owner
+            if last is None:
+                first = new_node
+            else:
+                last.next = new_node
+                new_node.prev = last
+            last = new_node
+            count += 1
+        if first is None:  # Nothing to add
+            return
+        if self._index is not None:
+            current = first
+            while current:  # Register the new chain in list order
+                self._index.push_back(current)
+                current = current.next
+        if self.tail is None:  # Empty list, the chain becomes the whole list
+            self.head = first
+        else:
+            self.tail.next = first  # Splice the chain after the last node
+            first.prev = self.tail
+        self.tail = last
+        self.size += count
+
+    # Prepend at the physical front, one item after another.
+    def _extend_front(self, iterable):
+        first = None
+        last = None
+        count = 0
+        for data in iterable:  # Each new node goes in front of the previous one
+            new_node = DoublyNode(data)
+            new_node.owner = self._owner
+            if first is None:
+                last = new_node
+            else:
+                new_node.next = first
+                first.prev = new_node
+            if self._index is not None:
+                self._index.push_front(new_node)
+            first = new_node
+            count += 1
+        if first is None:  # Nothing to add
+            return
+        if self.head is None:  # Empty list, the chain becomes the whole list
+            self.tail = last
+        else:
+            last.next = self.head  # Splice the chain before the current head
+            self.head.prev = last
+        self.head = first
+        self.size += count
+
+    # Insert a new node at a specific position (0-based index) and return it.
+    def insert_at_position(self, data, position):
+        if position < 0:  # Invalid position
+            print("Position cannot be negative.")
+            return
+        if position > self.size:  # If position is beyond list length
+            print("Position out of range.")
+            return
+        if position == 0:  # Insert at beginning if position is 0
+            return self.insert_at_beginning(data)
+        if position == self.size:  # Appending, no traversal needed
+            return self.insert_at_end(data)
+        if self._reversed:  # Same gap counted from the physical head
+            position = self.size - position
+        new_node = DoublyNode(data)  # Create a new node
+        new_node.owner = self._owner
+        current = self._node_at(position - 1)  # Node before position, walked to from the nearer end
+        new_node.next = current.next  # Set new node's pointers
+        new_node.prev = current
+        current.next.prev = new_node  # Update next node's prev pointer
+        current.next = new_node  # Update current node's next pointer
+        if self._index is not None:
+            self._index.insert(new_node, new_node.prev, new_node.next)
+        self.size += 1
+        return new_node
+
+    # Unlink a node from the list in O(1) using its prev/next pointers.
+    def _unlink(self, node):
+        if node.prev:  # Update prev node's next pointer
+            node.prev.next = node.next
+        else:  # Removing the head
+            self.head = node.next
+        if node.next:  # Update next node's prev pointer
+            node.next.prev = node.prev
+        else:  # Removing the last node
+            self.tail = node.prev
+        node.prev = node.next = None
+        node.owner = None  # Handles to the node are stale from now on
+        if self._index is not None:
+            self._index.remove(node)
+        self.size -= 1
+
+    # Delete the node at the beginning of the list.
+    def delete_at_beginning(self):
+        if self.head is None:  # If list is empty
+            print("List is empty.")
+            return
+        self._unlink(self.tail if self._reversed else self.head)
+
+    # Delete the node at the end of the list.
+    def delete_at_end(self):
+        if self.head is None:  # If list is empty
+            print("List is empty.")
+            return
+        self._unlink(self.head if self._reversed else self.tail)
+
+    # Delete the first node with the given data value. Indexed lists jump to it;
+    # if the value was inserted mid-list away from its equals, the first such
+    # lookup walks the list once to order them (see Hash_Index).
+    def delete_by_value(self, data):
+        if self.head is None:  # If list is empty
+            print("List is empty.")
+            return
+        if self._index is not None:  # Jump straight to the first occurrence
+            node = (self._index.last(data, self._nodes) if self._reversed
+                    else self._index.first(data, self._nodes))
+        else:
+            node = None
+            for candidate in self._nodes(self._reversed):  # Reversed, the logical first occurrence is the physical last
+                if candidate.data == data:
+                    node = candidate
+                    break
+        if node is None:
+            print("Value not found.")  # If value not in list
+            return
+        self._unlink(node)
+
+    # Apply a batch of inserts and deletes (see Batch_Ops for the format) in a
+    # single forward sweep that stops after the last position it needs.
+    # Returns one True/False per operation instead of printing errors.
+    def apply_batch(self, ops):
+        self.materialize()
+        positional, by_value, results = plan_batch(ops, self.size)
+        count = len(positional)
+        j = 0
+        previous = None
+        current = self.head
+        position = 0
+        while j < count or by_value:
+            while j < count and positional[j][0] == position and positional[j][1] == 0:  # Inserts before current
+                new_node = DoublyNode(positional[j][3])
+                new_node.owner = self._owner
+                new_node.prev = previous
+                new_node.next = current
+                if previous is None:
+                    self.head = new_node
+                else:
+                    previous.next = new_node
+                if current is None:
+                    self.tail = new_node
+                else:
+                    current.prev = new_node
+                previous = new_node
+                self.size += 1
+                results[positional[j][2]] = True
+                j += 1
+            if current is None:  # Swept past the last node
+                break
+            remove = False
+            while j < count and positional[j][0] == position:  # Deletes of current (duplicates stay False)
+                if not remove:
+                    results[positional[j][2]] = True
+                    remove = True
+                j += 1
+            if not remove and by_value:
+                remove = claim_value_delete(by_value, current.data, results)
+            following = current.next
+            if remove:
+                if previous is None:
+                    self.head = following
+                else:
+                    previous.next = following
+                if following is None:
+                    self.tail = previous
+                else:
+                    following.prev = previous
+                current.prev = current.next = None
+                current.owner = None
+                self.size -= 1
+            else:
+                previous = current
+            current = following
+            position += 1
+        if self._index is not None:
+            self._index.rebuild(self._nodes())
+        return results
+
+    # Node `steps` links after node, or before it for negative steps.
+    def _advance(self, node, steps):
+        if steps >= 0:
+            for _ in range(steps):
+                node = node.next
+        else:
+            for _ in range(-steps):
+                node = node.prev
+        return node
+
+    # Node at a position (0 <= position < size), walking from the nearer end.
+    def _node_at(self, position):
+        if position <= self.size // 2:
+            return self._advance(self.head, position)
+        return self._advance(self.tail, position - (self.size - 1))
+
+    # Unlink positions start <= i < stop (slice semantics) as a None-terminated
+    # chain; returns (first, last, count). Only the endpoints are relinked,
+    # so a range that touches either end is detached in O(1). The chain keeps
+    # the physical order, which is the logical one reversed if the list is.
+    def _detach(self, start, stop):
+        start, stop, _ = slice(start, stop).indices(self.size)
+        count = stop - start
+        if count <= 0:
+            return None, None, 0
+        if self._reversed:  # Same range counted from the physical head
+            start, stop = self.size - stop, self.size - start
+        first = self._node_at(start)
+        if count - 1 < self.size - stop:  # Walk on from first unless the tail is nearer
+            last = self._advance(first, count - 1)
+        else:
+            last = self._advance(self.tail, stop - self.size)
+        before, after = first.prev, last.next
+        if before is None:
+            self.head = after
+        else:
+            before.next = after
+        if after is None:
+            self.tail = before
+        else:
+            after.prev = before
+        first.prev = last.next = None
+        if self._index is not None:
+            if count == self.size:
+                self._index.clear()
+            else:
+                current = first
+                while current:  # Forget the moved nodes
+                    self._index.remove(current)
+                    current = current.next
+        self.size -= count
+        return first, last, count
+
+    # Link a None-terminated chain of count nodes, in physical order, in front
+    # of position `at`.
+    def _attach(self, first, last, count, at):
+        if self._reversed:  # Same gap counted from the physical head
+            at = self.size - at
+        if at == self.size:
+            before, after = self.tail, None
+        else:
+            after = self._node_at(at)
+            before = after.prev
+        first.prev = before
+        last.next = after
+        if before is None:
+            self.head = first
+        else:
+            before.next = first
+        if after is None:
+            self.tail = last
+        else:
+            after.prev = last
+        if self._index is not None:
+            if after is None:
+                current = first
+                while current:  # Register the moved nodes in list order
+                    self._index.push_back(current)
+                    current = current.next
+            elif before is None:
+                current = last
+                while current:  # Front-most node is registered last
+                    self._index.push_front(current)
+                    current = current.prev
+            else:
+                self._index.rebuild(self._nodes())
+        self.size += count
+
+    # Move other[start:stop] (slice semantics, all of other by default) in
+    # front of position `at` of this list (the end by default). Nodes are
+    # relinked, never copied; other's size and ends are updated too.
+    def splice(self, other, at=None, start=None, stop=None):
+        if not isinstance(other, DoublyLinkedList):
+            raise TypeError("Can only splice another DoublyLinkedList")
+        if other is self:
+            raise ValueError("Cannot splice a list into itself")
+        if at is None:
+            at = self.size
+        if not 0 <= at <= self.size:
+            raise IndexError("splice position out of range")
+        first, last, count = other._detach(start, stop)
+        if count:
+            adopt(self, other, first, count)
+            if other._reversed != self._reversed:  # Only the moved nodes change direction, O(count)
+                first, last = flip_chain(first, last)
+            self._attach(first, last, count, at)
+
+    # Move every node of other to the end of this list in O(1).
+    def concat(self, other):
+        self.splice(other)
+
+    # Split off the nodes from position i on into a new list of the same
+    # kind and return it; this list keeps the first i nodes.
+    def split_at(self, i):
+        if not 0 <= i <= self.size:
+            raise IndexError("split position out of range")
+        new_list = type(self)(indexed=self._index is not None)
+        new_list._reversed = self._reversed  # Same orientation, so the moved nodes are not flipped
+        new_list.splice(self, 0, i)
+        return new_list
+
+    # Insert data right after the node `handle` (in list order) in O(1) and
+    # return the new node. Handles are the nodes returned by the inserts; one
+    # from another list, or already removed, raises ValueError.
+    def insert_after(self, handle, data):
+        check_handle(handle, self)
+        if self._reversed:  # Logically after is physically before
+            return self._link_before(handle, data)
+        return self._link_after(handle, data)
+
+    # Insert data right before the node `handle` (in list order) in O(1) and
+    # return the new node.
+    def insert_before(self, handle, data):
+        check_handle(handle, self)
+        if self._reversed:
+            return self._link_after(handle, data)
+        return self._link_before(handle, data)
+
+    # Link a new node in physically after node.
+    def _link_after(self, node, data):
+        if node is self.tail:
+            return self._push_back(data)
+        new_node = DoublyNode(data)
+        new_node.owner = self._owner
+        new_node.prev = node
+        new_node.next = node.next
+        node.next.prev = new_node
+        node.next = new_node
+        if self._index is not None:
+            self._index.insert(new_node, new_node.prev, new_node.next)
+        self.size += 1
+        return new_node
+
+    # Link a new node in physically before node.
+    def _link_before(self, node, data):
+        if node is self.head:
+            return self._push_front(data)
+        return self._link_after(node.prev, data)
+
+    # Remove the node `handle` in O(1) and return its data.
+    def remove(self, handle):
+        check_handle(handle, self)
+        self._unlink(handle)
+        return handle.data
+
+    # Move the node `handle` to the front of the list in O(1), keeping the node
+    # (and so the handle) itself.
+    def move_to_front(self, handle):
+        check_handle(handle, self)
+        if handle is (self.tail if self._reversed else self.head):  # Already in front
+            return
+        self._unlink(handle)
+        handle.owner = self._owner
+        if self._reversed:  # The logical front is the physical tail
+            handle.prev = self.tail
+            self.tail.next = handle
+            self.tail = handle
+            if self._index is not None:
+                self._index.push_back(handle)
+        else:
+            handle.next = self.head
+            self.head.prev = handle
+            self.head = handle
+            if self._index is not None:
+                self._index.push_front(handle)
+        self.size += 1
+
+    # Run find_all/count/map/reduce over a snapshot of the list in a process
+    # pool, one contiguous segment per task (see Parallel_Ops).
+    def parallel(self, workers=None):
+        from .Parallel_Ops import ParallelList  # Imported lazily, only needed for this mode
+        return ParallelList(self, workers)
+
+    # Search for a node with the given data and return True if found.
+    def search(self, data):
+        if self._index is not None:
+            return data in self._index
+        for node in self._nodes():  # Traverse the list
+            if node.data == data:
+                return True  # Found
+        return False  # Not found
+
+    # Iterate over the data in list order.
+    def __iter__(self):
+        return self._walk(self._reversed)
+
+    # Iterate over the data in reverse list order.
+    def __reversed__(self):
+        return self._walk(not self._reversed)
+
+    # Walk the nodes head to tail, or tail to head along the prev pointers.
+    def _walk(self, backward):
+        if backward:
+            current = self.tail
+            while current:
+                yield current.data
+                current = current.prev
+        else:
+            current = self.head
+            while current:
+                yield current.data
+                current = current.next
+
+    # Iterate over the data from the given node to the end of the list.
+    def iter_from(self, node):
+        if self._reversed:
+            while node:
+                yield node.data
+                node = node.prev
+        else:
+            while node:
+                yield node.data
+                node = node.next
+
+    # Iterate over positions start <= i < stop (slice semantics, negative
+    # indices allowed) without copying; the walk starts from the nearer end.
+    def iter_range(self, start, stop):
+        start, stop, _ = slice(start, stop).indices(self.size)
+        if start >= stop:
+            return
+        first = self.size - 1 - start if self._reversed else start  # Physical position of the first element
+        current = self._node_at(first)
+        for _ in range(stop - start):
+            yield current.data
+            current = current.prev if self._reversed else current.next
+
+    # Render the list to a text or binary stream, e.g. "10 <-> 15 <-> None".
+    # Elements are batched chunk_size at a time into one write() call;
+    # reverse=True renders from tail to head.
+    def write_to(self, stream, sep=" <-> ", end="None\n", chunk_size=4096, reverse=False):
+        write_chunked(stream, reversed(self) if reverse else self, sep, end, chunk_size)
+
+    # Save the list to a binary snapshot file (see List_IO for the format).
+    def dump(self, path):
+        dump_records(path, self, self.size)
+
+    # Load a list saved by dump(). The file is memory-mapped and nodes are
+    # linked as records are decoded, without an intermediate Python list.
+    @classmethod
+    def load(cls, path, indexed=False):
+        return cls.from_iterable(load_records(path), indexed=indexed)
+
+    # Print all elements in the list (forward).
+    def print_list_forward(self):
+        self.write_to(sys.stdout)
+
+    # Print all elements in the list (backward).
+    def print_list_backward(self):
+        self.write_to(sys.stdout, reverse=True)
+
+    # Get the length (number of nodes) in the list.
+    def length(self):
+        return self.size  # Maintained incrementally by every mutator
+
+    # Support the built-in len() in O(1).
+    def __len__(self):
+        return self.size
+
+    # Reverse the list in O(1) by flipping the orientation flag. head and tail
+    # keep naming the physical ends; every method reads the flag, and the
+    # ones that relink many nodes call materialize() first.
+    def reverse(self):
+        self._reversed = not self._reversed
+
+    # Make the physical layout match the logical order: if the list is
+    # logically reversed, swap every node's next/prev pointers (O(n)).
+    def materialize(self):
+        if not self._reversed:
+            return
+        self._reversed = False
+        if self.head is None or self.head.next is None:  # If empty or single node
+            return
+        current = self.head
+        while current:  # Traverse and swap next/prev pointers
+            temp = current.next
+            current.next = current.prev
+            current.prev = temp
+            current = temp
+        self.head, self.tail = self.tail, self.head  # Old last node is the new head
+        if self._index is not None:
+            self._index.rebuild(self._nodes())
+
+    # Sort the list in place (stable, O(n log n)) by relinking its nodes.
+    def sort(self, key=None, reverse=False):
+        if self.head is None:
+            return
+        self.materialize()
+        nodes = sorted_nodes(self._nodes(), key, reverse)
+        relink(nodes, doubly=True)
+        nodes[0].prev = nodes[-1].next = None
+        self.head, self.tail = nodes[0], nodes[-1]
+        if self._index is not None:
+            self._index.rebuild(self._nodes())
+
+# Example usage (python -m linked_lists.doublyLinked_List):
+if __name__ == "__main__":
+    # Create a doubly linked list
+    dll = DoublyLinkedList()
+
+    # Insert operations
+    dll.insert_at_beginning(10)
+    dll.insert_at_end(20)
+    dll.insert_at_position(15, 1)  # Insert 15 between 10 and 20
+
+    # Print forward: 10 <-> 15 <-> 20 <-> None
+    dll.print_list_forward()
+
+    # Print backward: 20 <-> 15 <-> 10 <-> None
+    dll.print_list_backward()
+
+    # Search for 15: True
+    print(dll.search(15))
+
+    # Delete operations
+    dll.delete_at_beginning()  # Removes 10
+    dll.delete_at_end()  # Removes 20
+    dll.delete_by_value(15)  # Removes 15
+
+    # Print forward after deletions: None
+    dll.print_list_forward()
+
+    # Length: 0
+    print(dll.length())
+
+    # Insert again and reverse
+    dll.insert_at_end(30)
+    dll.insert_at_end(40)
+    dll.insert_at_end(50)
+    dll.print_list_forward()  # 30 <-> 40 <-> 50 <-> None
+    dll.reverse()
+    dll.print_list_forward()  # 50 <-> 40 <-> 30 <-> None